@@ -1,9 +1,13 @@
-from crewai import Agent, Crew, Process, Task
+from crewai import Agent, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List
+from crew_common.config import compiled_configs
+from crew_common.dag import DagCrew
+from crew_common.sandbox import code_execution_options
 from coder.tools import NextJsScaffoldTool, ReactViteScaffoldTool
 
+@compiled_configs
 @CrewBase
 class Coder():
     """Coder crew"""
@@ -16,8 +20,8 @@ class Coder():
         return Agent(
             config=self.agents_config['coder'],
             verbose=True,
-            allow_code_execution=True,
-            code_execution_mode="safe",  # Uses Docker for safety
+            # Warm local sandbox workers, or Docker with CREW_CODE_EXECUTION=docker
+            **code_execution_options(),
             max_execution_time=30, 
             max_retry_limit=3 
         )
@@ -46,12 +50,14 @@ class Coder():
         )
 
     @crew
-    def crew(self) -> Crew:
+    def crew(self) -> DagCrew:
         """Creates the Coder crew"""
 
-        return Crew(
+        return DagCrew(
             agents=self.agents,
             tasks=self.tasks,
             process=Process.sequential,
+            # Tasks whose context is complete run in parallel, at most this many at once
+            max_concurrency=2,
             verbose=True,
         )
@@ -4,25 +4,52 @@ import warnings
 
 from datetime import datetime
 
-from coder.crew import Coder
-from coder.tools import NextJsScaffoldTool, ReactViteScaffoldTool
-
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
+
+def _crew():
+    """
+    Build the crew. crewAI, the crew module and the runtime hooks are imported
+    here rather than at module load, so CLIs that don't run the crew start fast.
+    """
+    from crew_common.checkpoint import install_checkpoints
+    from crew_common.llm_cache import install_llm_cache
+    from crew_common.streaming import install_streaming
+    from coder.crew import Coder
+
+    # Serve repeated LLM calls from disk when CREW_LLM_CACHE=1
+    install_llm_cache()
+    # Stream final answers to output files and stdout when CREW_STREAM=1
+    install_streaming()
+    # Record each task's output under a hash of its inputs, for `uv run resume`
+    install_checkpoints()
+    return Coder().crew()
+
+
 # Create output directory if it doesn't exist
 os.makedirs('output', exist_ok=True)
 
 assignment = 'Write a python program to calculate the first 10,000 terms \
     of this series, multiplying the total by 4: 1 - 1/3 + 1/5 - 1/7 + ...'
 
+# The web_scaffolder agent and scaffold_task interpolate these as well
+scaffold_inputs = {
+    'framework': 'Next.js',
+    'project_name': 'next-app',
+    'target_root': 'output',
+    'typescript': 'true',
+    'tailwind': 'true',
+    'package_manager': 'npm',
+}
+
 def run():
     """
     Run the crew.
     """
     # Default behavior runs the original coding task
-    inputs = {'assignment': assignment}
+    inputs = {'assignment': assignment, **scaffold_inputs}
     try:
-        result = Coder().crew().kickoff(inputs=inputs)
+        result = _crew().kickoff(inputs=inputs)
         print(result.raw)
     except Exception as e:
         raise Exception(f"An error occurred while running the crew: {e}")
@@ -37,8 +64,9 @@ def scaffold_next():
     target_root = os.environ.get("TARGET_ROOT", "output")
     app_router = (os.environ.get("APP_ROUTER", "true").lower() != "false")
 
-    tool = NextJsScaffoldTool()
-    created_path = tool.run(
+    from coder.tools.scaffold import scaffold_nextjs
+
+    created_path = scaffold_nextjs(
         project_name=project_name,
         typescript=typescript,
         tailwind=tailwind,
@@ -57,8 +85,9 @@ def scaffold_react():
     package_manager = os.environ.get("PM", "npm")
     target_root = os.environ.get("TARGET_ROOT", "output")
 
-    tool = ReactViteScaffoldTool()
-    created_path = tool.run(
+    from coder.tools.scaffold import scaffold_react_vite
+
+    created_path = scaffold_react_vite(
         project_name=project_name,
         typescript=typescript,
         tailwind=tailwind,
@@ -66,3 +95,30 @@ def scaffold_react():
         target_root=target_root,
     )
     print(created_path)
+
+
+def batch():
+    """
+    Run the crew once per input in a CSV or JSONL file, e.g. `uv run batch inputs.csv --concurrency 8`.
+    """
+    from crew_common.batch import main as batch_main
+
+    sys.exit(batch_main(_crew, defaults=scaffold_inputs, argv=sys.argv[1:]))
+
+
+def profile():
+    """
+    Run the crew with tracing; spans go to output/trace.jsonl and a summary table is printed.
+    """
+    from crew_common.tracing import profile_main
+
+    sys.exit(profile_main(run, argv=sys.argv[1:]))
+
+
+def resume():
+    """
+    Rerun the crew, reusing checkpointed outputs of tasks whose inputs are unchanged.
+    """
+    from crew_common.checkpoint import resume_main
+
+    sys.exit(resume_main(run))
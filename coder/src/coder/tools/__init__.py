@@ -1,11 +1,19 @@
 
-from .scaffold_webapp import (
-    NextJsScaffoldTool,
-    ReactViteScaffoldTool,
-)
+# The tools import crewAI; load them on first access so the scaffold CLIs start fast
+_LAZY = {
+    "NextJsScaffoldTool": ".scaffold_webapp",
+    "ReactViteScaffoldTool": ".scaffold_webapp",
+}
 
 __all__ = [
     "NextJsScaffoldTool",
     "ReactViteScaffoldTool",
 ]
 
+
+def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+
+        return getattr(import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,4 @@
+"""Shared runtime utilities for the crews in this repo.
+
+Modules are imported on demand; nothing here imports crewAI at package import.
+"""
@@ -0,0 +1,124 @@
+"""Run a crew over many inputs with bounded concurrency.
+
+    uv run batch companies.csv --out reports.jsonl --concurrency 8
+
+Inputs are a CSV file (one input per row, columns are the crew's
+placeholders) or JSON Lines (one object per line). Each input gets a fresh
+crew; at most --concurrency kickoffs run at once. Every finished input is
+appended to the output JSONL as soon as it completes:
+
+    {"key": ..., "inputs": {...}, "status": "ok" | "error", "raw": ..., "error": ..., "seconds": ...}
+
+Rerunning with the same --out skips inputs already recorded as "ok", so an
+interrupted run resumes where it stopped and failed inputs are retried.
+Inputs are keyed by their "id" field when present, otherwise by a hash of
+their values. Task output files are written under a per-input directory,
+e.g. output/<key>/report.md, so concurrent runs don't overwrite each other.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+DEFAULT_CONCURRENCY = 4
+
+
+def input_key(inputs: dict) -> str:
+    if inputs.get("id"):
+        return str(inputs["id"])
+    encoded = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def load_inputs(path) -> list:
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            return [dict(row) for row in csv.DictReader(f)]
+        return [json.loads(line) for line in f if line.strip()]
+
+
+# Keys already completed in an earlier run; drops a partial last line left by an interrupt
+def completed_keys(out_path) -> set:
+    out_path = Path(out_path)
+    if not out_path.exists():
+        return set()
+    data = out_path.read_bytes()
+    if data and not data.endswith(b"\n"):
+        data = data[:data.rfind(b"\n") + 1]
+        with open(out_path, "r+b") as f:
+            f.truncate(len(data))
+    done = set()
+    for line in data.decode("utf-8").splitlines():
+        if line.strip():
+            record = json.loads(line)
+            if record.get("status") == "ok":
+                done.add(record["key"])
+    return done
+
+
+def _isolate_outputs(crew, key):
+    for task in crew.tasks:
+        if task.output_file:
+            path = Path(task.output_file)
+            task.output_file = str(path.parent / re.sub(r"[^\w.-]", "_", key) / path.name)
+
+
+async def run_batch(crew_factory, inputs, out_path, concurrency=DEFAULT_CONCURRENCY, defaults=None, log=sys.stderr):
+    """Kick off crew_factory() once per input; returns (succeeded, failed, skipped) counts."""
+    done = completed_keys(out_path)
+    todo = [(input_key(row), {**(defaults or {}), **row}) for row in inputs]
+    skipped = sum(1 for key, _ in todo if key in done)
+    todo = [(key, row) for key, row in todo if key not in done]
+    counts = {"ok": 0, "error": 0}
+    limit = asyncio.Semaphore(concurrency)
+    # Kickoffs run on threads; size the pool so the semaphore, not the pool, is the limit
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+
+    with open(out_path, "a", encoding="utf-8") as out:
+        async def run_one(key, row):
+            async with limit:
+                start = time.perf_counter()
+                record = {"key": key, "inputs": row}
+                try:
+                    crew = crew_factory()
+                    _isolate_outputs(crew, key)
+                    result = await crew.kickoff_async(inputs=row)
+                    record.update(status="ok", raw=result.raw)
+                except Exception as e:
+                    record.update(status="error", error=f"{type(e).__name__}: {e}")
+                record["seconds"] = round(time.perf_counter() - start, 3)
+                out.write(json.dumps(record, default=str) + "\n")
+                out.flush()
+                counts[record["status"]] += 1
+                print(f"[{counts['ok'] + counts['error']}/{len(todo)}] {key} {record['status']} "
+                      f"{record['seconds']:.1f}s", file=log, flush=True)
+
+        await asyncio.gather(*(run_one(key, row) for key, row in todo))
+    return counts["ok"], counts["error"], skipped
+
+
+def main(crew_factory, defaults=None, argv=None) -> int:
+    """Command-line entry point; each crew's main.py passes its crew factory and default inputs."""
+    parser = argparse.ArgumentParser(description="Run the crew once per input in a CSV or JSONL file")
+    parser.add_argument("inputs", help="CSV or JSONL file of inputs")
+    parser.add_argument("--out", help="results JSONL (default: output/<inputs name>.results.jsonl)")
+    parser.add_argument("--concurrency", type=int,
+                        default=int(os.environ.get("BATCH_CONCURRENCY", DEFAULT_CONCURRENCY)))
+    args = parser.parse_args(argv)
+
+    out_path = Path(args.out or Path("output") / f"{Path(args.inputs).stem}.results.jsonl")
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    succeeded, failed, skipped = asyncio.run(
+        run_batch(crew_factory, load_inputs(args.inputs), out_path, args.concurrency, defaults))
+    print(f"{succeeded} succeeded, {failed} failed, {skipped} already done; results in {out_path}")
+    return 1 if failed else 0
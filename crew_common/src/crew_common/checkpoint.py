@@ -0,0 +1,147 @@
+"""Content-addressed checkpoints of task outputs, and resume from them.
+
+Every task run records its output under a hash of everything that shapes
+it: the interpolated description and expected output, the output file and
+schema, the agent's role, goal, backstory, model and tools, and the context
+text handed over by upstream tasks. `uv run resume` reruns the crew and
+serves any task whose hash is already recorded from disk, so the run picks
+up at the first task that failed or whose inputs changed. Because upstream
+outputs are part of the hash, a task downstream of a regenerated one is
+only rerun if the text it receives actually differs.
+
+Checkpoints live in CREW_CHECKPOINT_DIR (default .crew_checkpoints/ in the
+working directory); CREW_CHECKPOINTS=0 turns recording off.
+"""
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+DEFAULT_DIRECTORY = ".crew_checkpoints"
+
+
+class CheckpointStore:
+    """One JSON file per task input hash."""
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory or os.environ.get("CREW_CHECKPOINT_DIR") or DEFAULT_DIRECTORY)
+
+    def _path(self, key):
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, key, record):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, default=str)
+        os.replace(tmp, path)
+
+
+def task_key(task, agent, context) -> str:
+    """sha256 over the task's rendered spec, its agent and the context it receives."""
+    schema = task.output_pydantic or task.output_json
+    llm = getattr(agent, "llm", None)
+    payload = {
+        "description": task.description,
+        "expected_output": task.expected_output,
+        "output_file": task.output_file,
+        "schema": schema.model_json_schema() if schema is not None else None,
+        "agent": {
+            "role": getattr(agent, "role", None),
+            "goal": getattr(agent, "goal", None),
+            "backstory": getattr(agent, "backstory", None),
+            "model": getattr(llm, "model", None) or str(llm),
+            "tools": sorted(tool.name for tool in (task.tools or getattr(agent, "tools", None) or [])),
+        },
+        "context": context or "",
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+_store: CheckpointStore | None = None
+_reuse = False
+# (task name, "reused" | "ran") for the current process, in completion order
+history = []
+_history_lock = threading.Lock()
+
+
+def _restore(task, agent, record):
+    from crewai.tasks.task_output import TaskOutput
+
+    pydantic_output = None
+    if task.output_pydantic is not None and record.get("pydantic") is not None:
+        pydantic_output = task.output_pydantic(**record["pydantic"])
+    output = TaskOutput(
+        name=task.name, description=task.description, expected_output=task.expected_output,
+        raw=record["raw"], pydantic=pydantic_output, json_dict=record.get("json_dict"),
+        agent=getattr(agent, "role", None) or record.get("agent"), output_format=task._get_output_format(),
+    )
+    task.output = output
+    if task.output_file:
+        task._save_file(output.json_dict or (pydantic_output.model_dump_json() if pydantic_output else output.raw))
+    return output
+
+
+def install_checkpoints(store: CheckpointStore | None = None):
+    """Record every task's output under its input hash; returns the store, or None when disabled."""
+    global _store
+    if _store is not None:
+        return _store
+    if os.environ.get("CREW_CHECKPOINTS", "1").lower() in ("0", "false", "no", "off"):
+        return None
+    from crewai import Task
+
+    _store = store or CheckpointStore()
+    original = Task._execute_core
+
+    def checkpointed(task, agent, context, tools):
+        worker = agent or task.agent
+        key = task_key(task, worker, context)
+        if _reuse:
+            record = _store.get(key)
+            if record is not None:
+                with _history_lock:
+                    history.append((task.name, "reused"))
+                return _restore(task, worker, record)
+        output = original(task, agent, context, tools)
+        _store.put(key, {
+            "task": task.name, "key": key, "agent": output.agent, "raw": output.raw,
+            "json_dict": output.json_dict,
+            "pydantic": output.pydantic.model_dump() if output.pydantic is not None else None,
+            "created": datetime.datetime.now().isoformat(),
+        })
+        with _history_lock:
+            history.append((task.name, "ran"))
+        return output
+
+    checkpointed.__wrapped__ = original
+    Task._execute_core = checkpointed
+    return _store
+
+
+def resume_main(run) -> int:
+    """Run a crew's run() serving unchanged tasks from checkpoints, then report what was reused."""
+    global _reuse
+    if install_checkpoints() is None:
+        print("Checkpoints are disabled (CREW_CHECKPOINTS=0); running the whole crew")
+    _reuse = True
+    try:
+        run()
+    finally:
+        _reuse = False
+        for name, outcome in history:
+            print(f"{outcome:>7}  {name}")
+    return 0
@@ -0,0 +1,231 @@
+"""Compiled, cached and statically checked agents.yaml / tasks.yaml.
+
+    uv run check_config          # inside a crew folder; exits 1 on errors
+
+@compiled_configs, placed above @CrewBase, makes a crew load its YAML
+through load_config(): the parsed config is kept as JSON in
+config/__pycache__/ and reused while the YAML file's mtime and size (or,
+failing that, its sha256) are unchanged, so startup skips YAML parsing.
+Every time the crew class is instantiated, the agent and task
+cross-references are checked before crewAI wires them up, so a bad
+`agent:` or `context:` fails with every problem listed at once.
+
+check_config goes further without importing crewAI or calling a model:
+it reads crew.py and main.py with ast and checks that
+  - agents have role, goal and backstory, and tasks description and expected_output
+  - every task's agent and context names exist, with context tasks defined earlier
+  - every agents_config[...] / tasks_config[...] lookup in crew.py exists in the YAML
+  - every {placeholder} in the YAML is supplied by each inputs dict in main.py
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+# crewAI's interpolation pattern (crewai.utilities.string_utils)
+PLACEHOLDER = re.compile(r"\{([A-Za-z_][A-Za-z0-9_\-]*)\}")
+INTERPOLATED = {"agents": ("role", "goal", "backstory"), "tasks": ("description", "expected_output", "output_file")}
+REQUIRED = {"agents": ("role", "goal", "backstory"), "tasks": ("description", "expected_output")}
+
+
+def _cache_path(path: Path) -> Path:
+    return path.parent / "__pycache__" / f"{path.name}.json"
+
+
+def load_config(path) -> dict:
+    """Parsed YAML file, served from its compiled JSON copy while the file is unchanged."""
+    path = Path(path)
+    stat = path.stat()
+    cache = _cache_path(path)
+    try:
+        compiled = json.loads(cache.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        compiled = None
+    if compiled and (compiled["mtime_ns"], compiled["size"]) == (stat.st_mtime_ns, stat.st_size):
+        return compiled["data"]
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if compiled and compiled["sha256"] == digest:
+        data = compiled["data"]
+    else:
+        import yaml
+
+        data = yaml.safe_load(raw.decode("utf-8")) or {}
+    record = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest, "data": data}
+    try:
+        cache.parent.mkdir(exist_ok=True)
+        tmp = cache.with_name(f".{cache.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(record), encoding="utf-8")
+        os.replace(tmp, cache)
+    except OSError:
+        pass  # read-only install: parse every time
+    return data
+
+
+def placeholders(text) -> set:
+    return set(PLACEHOLDER.findall(text)) if isinstance(text, str) else set()
+
+
+def config_placeholders(agents: dict, tasks: dict) -> dict:
+    """{placeholder: ["tasks.x.description", ...]} for every interpolated field."""
+    found = {}
+    for kind, entries in (("agents", agents), ("tasks", tasks)):
+        for name, entry in (entries or {}).items():
+            for field in INTERPOLATED[kind]:
+                for placeholder in placeholders((entry or {}).get(field)):
+                    found.setdefault(placeholder, []).append(f"{kind}.{name}.{field}")
+    return found
+
+
+def check_references(agents: dict, tasks: dict, agent_methods=None, task_methods=None) -> list:
+    """Problems with required fields and agent/context references; methods are in definition order."""
+    problems = []
+    for kind, entries in (("agents", agents), ("tasks", tasks)):
+        for name, entry in (entries or {}).items():
+            if not isinstance(entry, dict):
+                problems.append(f"{kind}.{name} is not a mapping")
+                continue
+            missing = [field for field in REQUIRED[kind] if not entry.get(field)]
+            if missing:
+                problems.append(f"{kind}.{name} is missing {', '.join(missing)}")
+    order = list(task_methods) if task_methods is not None else list(tasks or {})
+    for name, entry in (tasks or {}).items():
+        if not isinstance(entry, dict):
+            continue
+        agent = entry.get("agent")
+        if agent is not None and agent not in (agents or {}):
+            problems.append(f"tasks.{name}.agent '{agent}' is not defined in agents.yaml")
+        elif agent is not None and agent_methods is not None and agent not in agent_methods:
+            problems.append(f"tasks.{name}.agent '{agent}' has no @agent method in the crew")
+        for upstream in entry.get("context") or []:
+            if upstream not in (tasks or {}):
+                problems.append(f"tasks.{name}.context '{upstream}' is not defined in tasks.yaml")
+            elif upstream not in order:
+                problems.append(f"tasks.{name}.context '{upstream}' has no @task method in the crew")
+            elif name in order and order.index(upstream) >= order.index(name):
+                problems.append(f"tasks.{name}.context '{upstream}' is defined after the task")
+    return problems
+
+
+def compiled_configs(cls):
+    """Class decorator, above @CrewBase: cached YAML loading plus reference checks on every instance."""
+    # @task methods in definition order, which is the order crewAI runs them in
+    members = {name: value for klass in reversed(cls.__mro__) for name, value in vars(klass).items()}
+    agent_methods = [name for name, value in members.items() if getattr(value, "is_agent", False)]
+    task_methods = [name for name, value in members.items() if getattr(value, "is_task", False)]
+    original = cls.load_configurations
+
+    def load_configurations(self):
+        original(self)
+        problems = check_references(self.agents_config, self.tasks_config, agent_methods, task_methods)
+        if problems:
+            name = getattr(cls, "_crew_name", cls.__name__)
+            raise ValueError(f"Invalid crew config for {name}:\n  " + "\n  ".join(problems))
+
+    cls.load_yaml = staticmethod(load_config)
+    cls.load_configurations = load_configurations
+    return cls
+
+
+class _CrewSource(ast.NodeVisitor):
+    """@agent / @task methods (in order) and the config keys crew.py looks up."""
+
+    def __init__(self):
+        self.agent_methods, self.task_methods = [], []
+        self.lookups = {"agents": set(), "tasks": set()}
+
+    def visit_FunctionDef(self, node):
+        decorators = {getattr(decorator, "id", getattr(decorator, "attr", None)) for decorator in node.decorator_list}
+        if "agent" in decorators:
+            self.agent_methods.append(node.name)
+        if "task" in decorators:
+            self.task_methods.append(node.name)
+        self.generic_visit(node)
+
+    def visit_Subscript(self, node):
+        attr = getattr(node.value, "attr", None)
+        key = node.slice.value if isinstance(node.slice, ast.Constant) else None
+        if attr in ("agents_config", "tasks_config") and isinstance(key, str):
+            self.lookups[attr.split("_")[0]].add(key)
+        self.generic_visit(node)
+
+
+def _dict_keys(node, module_dicts) -> set:
+    keys = set()
+    for key, value in zip(node.keys, node.values):
+        if isinstance(key, ast.Constant):
+            keys.add(key.value)
+        elif key is None and isinstance(value, ast.Name):  # **module_level_dict
+            keys |= module_dicts.get(value.id, set())
+    return keys
+
+
+# {function name: set of input keys} for every `inputs = {...}` literal in main.py
+def _main_inputs(tree) -> dict:
+    module_dicts = {target.id: _dict_keys(node.value, {}) for node in tree.body
+                    if isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict)
+                    for target in node.targets if isinstance(target, ast.Name)}
+    supplied = {}
+    for function in ast.walk(tree):
+        if not isinstance(function, ast.FunctionDef):
+            continue
+        for node in ast.walk(function):
+            if (isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict)
+                    and any(getattr(target, "id", None) == "inputs" for target in node.targets)):
+                keys = _dict_keys(node.value, module_dicts)
+                supplied[function.name] = supplied.get(function.name, set()) | keys
+    return supplied
+
+
+def check_project(project_dir=".") -> tuple:
+    """(errors, warnings) for the crew package under project_dir/src."""
+    project_dir = Path(project_dir)
+    packages = [path.parent for path in sorted((project_dir / "src").glob("*/crew.py"))]
+    if not packages:
+        return [f"no src/<package>/crew.py under {project_dir.resolve()}"], []
+    errors, warnings = [], []
+    for package in packages:
+        agents = load_config(package / "config" / "agents.yaml")
+        tasks = load_config(package / "config" / "tasks.yaml")
+        source = _CrewSource()
+        source.visit(ast.parse((package / "crew.py").read_text(encoding="utf-8")))
+        errors += check_references(agents, tasks, source.agent_methods, source.task_methods)
+        for kind, entries in (("agents", agents), ("tasks", tasks)):
+            for key in sorted(source.lookups[kind] - set(entries)):
+                errors.append(f"crew.py looks up {kind}_config['{key}'], which is not in {kind}.yaml")
+            for key in sorted(set(entries) - source.lookups[kind]):
+                warnings.append(f"{kind}.{key} is never used by crew.py")
+
+        used = config_placeholders(agents, tasks)
+        main = package / "main.py"
+        supplied = _main_inputs(ast.parse(main.read_text(encoding="utf-8"))) if main.exists() else {}
+        for function, keys in sorted(supplied.items()):
+            for placeholder, fields in sorted(used.items()):
+                if placeholder not in keys:
+                    errors.append(f"main.py {function}() does not supply {{{placeholder}}}, "
+                                  f"used in {', '.join(fields)}")
+            for key in sorted(keys - set(used)):
+                warnings.append(f"main.py {function}() supplies '{key}', which no config uses")
+    return errors, warnings
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Validate a crew's YAML configs against crew.py and main.py")
+    parser.add_argument("project", nargs="?", default=".", help="crew folder (default: current directory)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    errors, warnings = check_project(args.project)
+    for warning in warnings:
+        print(f"warning: {warning}")
+    for error in errors:
+        print(f"error: {error}", file=sys.stderr)
+    print(f"{len(errors)} errors, {len(warnings)} warnings in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 1 if errors else 0
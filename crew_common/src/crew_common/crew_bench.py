@@ -0,0 +1,209 @@
+"""End-to-end crew latency benchmark against the local mock LLM.
+
+    crew_bench --crews debate financial_researcher --out bench.json
+    crew_bench --baseline bench.json --tolerance 0.25
+
+Each crew is kicked off in a fresh process with every LLM pointed at the
+mock server (mock_llm.py), so the numbers isolate orchestration cost from
+provider latency. Per crew the run reports wall time, framework overhead per
+task (task time not spent in LLM calls or tools), LLM client overhead per
+call (call time minus the mock's simulated model time) and time per tool
+call. Crews whose package is not installed in the current environment are
+reported as skipped.
+
+With --baseline the run exits non-zero if wall time or any per-task or
+per-call overhead grew by more than the tolerance.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from crew_common.mock_llm import MOCK_MODEL, MockLLM, Script, start_background
+from crew_common.tracing import Tracer
+
+# crew name -> (module, class, kickoff inputs)
+CREWS = {
+    "debate": ("debate.crew", "Debate", {"motion": "There needs to be strict laws to regulate LLMs"}),
+    "financial_researcher": ("financial_researcher.crew", "FinancialResearcher", {"company": "Tesla"}),
+    "stock_picker": ("stock_picker.crew", "StockPicker", {"sector": "Technology", "current_year": "2025"}),
+    "engineering_team": ("engineering_team.crew", "EngineeringTeam", {
+        "requirements": "A simple account management system for a trading simulation platform.",
+        "module_name": "accounts.py", "class_name": "Account"}),
+    "coder": ("coder.crew", "Coder", {"assignment": "Write a python program that prints the first 10 primes."}),
+}
+
+
+def _redirect_llms(base_url):
+    import crewai
+
+    original_init = crewai.LLM.__init__
+
+    # Route every LLM, whatever its configured provider, to the mock
+    def mock_init(self, model=None, *args, **kwargs):
+        kwargs.update(base_url=base_url, api_key="mock")
+        kwargs.pop("api_base", None)
+        original_init(self, f"openai/{MOCK_MODEL}", *args, **kwargs)
+
+    crewai.LLM.__init__ = mock_init
+
+
+def _mean(values):
+    return sum(values) / len(values) if values else 0.0
+
+
+# Seconds under span_id spent in the outermost descendants of the given kinds
+def _time_in(span_id, children, kinds):
+    total = 0.0
+    for child in children.get(span_id, ()):
+        if child["kind"] in kinds:
+            total += child["duration_ms"] / 1000
+        else:
+            total += _time_in(child["span_id"], children, kinds)
+    return total
+
+
+def _summarize(spans, wall_seconds, model_seconds):
+    children = {}
+    for span in spans:
+        children.setdefault(span["parent_id"], []).append(span)
+    tasks = []
+    for span in spans:
+        if span["kind"] != "task":
+            continue
+        seconds = span["duration_ms"] / 1000
+        # A tool call's own LLM calls (delegation) count as tool time
+        outside = _time_in(span["span_id"], children, ("llm", "tool"))
+        tool = _time_in(span["span_id"], children, ("tool",))
+        tasks.append({"task": span["name"], "seconds": seconds, "llm_seconds": outside - tool,
+                      "tool_seconds": tool, "overhead_seconds": seconds - outside})
+    llm_calls = [span["duration_ms"] / 1000 for span in spans if span["kind"] == "llm"]
+    tool_calls = [span["duration_ms"] / 1000 - _time_in(span["span_id"], children, ("llm",))
+                  for span in spans if span["kind"] == "tool"]
+    return {
+        "wall_seconds": wall_seconds,
+        "tasks": tasks,
+        "overhead_per_task": _mean([task["overhead_seconds"] for task in tasks]),
+        "llm_calls": len(llm_calls),
+        "llm_seconds": sum(llm_calls),
+        "model_seconds": model_seconds,
+        "llm_overhead_per_call": (sum(llm_calls) - model_seconds) / len(llm_calls) if llm_calls else 0.0,
+        "tool_calls": len(tool_calls),
+        "seconds_per_tool_call": _mean(tool_calls),
+    }
+
+
+def _model_seconds(base_url):
+    from urllib.request import urlopen
+    with urlopen(f"{base_url}/stats") as response:
+        return json.load(response)["model_seconds"]
+
+
+# Kick off one crew against the mock; runs in its own process
+def run_crew(name, base_url):
+    module_name, class_name, inputs = CREWS[name]
+    os.environ.update(OPENAI_API_KEY="mock", OPENAI_API_BASE=base_url, OPENAI_BASE_URL=base_url,
+                      OPENAI_MODEL_NAME=f"openai/{MOCK_MODEL}", CREWAI_DISABLE_TELEMETRY="true",
+                      OTEL_SDK_DISABLED="true")
+    try:
+        crew_class = getattr(importlib.import_module(module_name), class_name)
+    except ImportError as e:
+        return {"crew": name, "skipped": f"{module_name} not importable: {e}"}
+    _redirect_llms(base_url)
+    tracer = Tracer().install()
+    # Tasks write output files relative to the working directory
+    os.chdir(tempfile.mkdtemp(prefix=f"crew_bench_{name}_"))
+    model_before = _model_seconds(base_url)
+    start = time.perf_counter()
+    try:
+        crew_class().crew().kickoff(inputs=inputs)
+    except Exception as e:
+        return {"crew": name, "error": f"{type(e).__name__}: {e}",
+                **_summarize(tracer.spans, time.perf_counter() - start, _model_seconds(base_url) - model_before)}
+    wall = time.perf_counter() - start
+    return {"crew": name, **_summarize(tracer.spans, wall, _model_seconds(base_url) - model_before)}
+
+
+def _run_crew_args(args):
+    return run_crew(*args)
+
+
+def run_suite(crews, llm=None):
+    server, base_url = start_background(llm or MockLLM())
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    try:
+        for name in crews:
+            with ctx.Pool(processes=1) as pool:
+                results.append(pool.apply(_run_crew_args, ((name, base_url),)))
+    finally:
+        server.shutdown()
+        server.server_close()
+    return {"python": platform.python_version(), "platform": platform.platform(), "crews": results}
+
+
+# List regressions of results against a baseline; tolerance is a fraction (0.25 = 25%)
+def compare(results, baseline, tolerance=0.25):
+    previous = {case["crew"]: case for case in baseline["crews"] if "wall_seconds" in case}
+    regressions = []
+    for case in results["crews"]:
+        base = previous.get(case["crew"])
+        if base is None or "wall_seconds" not in case:
+            continue
+        for metric in ("wall_seconds", "overhead_per_task", "llm_overhead_per_call", "seconds_per_tool_call"):
+            if case[metric] > base[metric] * (1 + tolerance) and case[metric] - base[metric] > 0.001:
+                regressions.append(f"{case['crew']} {metric} {base[metric] * 1000:.1f} ms -> "
+                                   f"{case[metric] * 1000:.1f} ms")
+    return regressions
+
+
+def print_table(results):
+    print(f"{'crew':<22} {'wall s':>8} {'tasks':>6} {'ovh/task ms':>12} {'llm calls':>10} "
+          f"{'ovh/call ms':>12} {'tools':>6} {'ms/tool':>8}")
+    for case in results["crews"]:
+        if "skipped" in case:
+            print(f"{case['crew']:<22} skipped: {case['skipped']}")
+            continue
+        print(f"{case['crew']:<22} {case['wall_seconds']:>8.2f} {len(case['tasks']):>6} "
+              f"{case['overhead_per_task'] * 1000:>12.1f} {case['llm_calls']:>10} "
+              f"{case['llm_overhead_per_call'] * 1000:>12.1f} {case['tool_calls']:>6} "
+              f"{case['seconds_per_tool_call'] * 1000:>8.1f}")
+        if "error" in case:
+            print(f"{'':<22} error: {case['error']}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--crews", nargs="+", choices=sorted(CREWS), default=list(CREWS))
+    parser.add_argument("--script", help="mock reply rules (see mock_llm.py)")
+    parser.add_argument("--token-latency", type=float, default=0.0)
+    parser.add_argument("--first-token-latency", type=float, default=0.0)
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--baseline", help="baseline results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    script = Script.load(args.script) if args.script else Script()
+    results = run_suite(args.crews, MockLLM(script, args.token_latency, args.first_token_latency))
+    print_table(results)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
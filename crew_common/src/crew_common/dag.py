@@ -0,0 +1,108 @@
+"""Dependency-graph execution for sequential crews.
+
+DagCrew is a drop-in Crew that runs every task whose dependencies have
+finished concurrently, up to max_concurrency at a time. Dependencies come
+from each task's `context:` in tasks.yaml, with crewAI's own meaning:
+
+    context: [a, b]   depends on a and b, which are passed in as context
+    context: []       depends on nothing and receives no context
+    (omitted)         depends on, and receives, every earlier task
+
+so a crew whose tasks.yaml has no explicit contexts runs exactly as before.
+Hierarchical crews, conditional tasks and replays use the stock sequential
+path.
+"""
+from __future__ import annotations
+
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, Optional
+
+from crewai import Crew, Process, Task
+from crewai.tasks.conditional_task import ConditionalTask
+from crewai.utilities.constants import NOT_SPECIFIED
+from crewai.utilities.formatter import aggregate_raw_outputs_from_task_outputs
+from pydantic import Field
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+# For each task, the indices of the tasks it waits for
+def task_dependencies(tasks: List[Task]) -> List[List[int]]:
+    index = {id(task): i for i, task in enumerate(tasks)}
+    dependencies = []
+    for i, task in enumerate(tasks):
+        if task.context is NOT_SPECIFIED:
+            dependencies.append(list(range(i)))
+            continue
+        depends = []
+        for upstream in task.context or ():
+            j = index.get(id(upstream))
+            if j is None:
+                raise ValueError(f"Task '{task.name}' has context '{upstream.name}', which is not in the crew")
+            if j >= i:
+                raise ValueError(f"Task '{task.name}' has context '{upstream.name}', which runs after it")
+            depends.append(j)
+        dependencies.append(depends)
+    return dependencies
+
+
+class DagCrew(Crew):
+    """Crew that runs independent tasks in parallel, bounded by max_concurrency."""
+
+    max_concurrency: int = Field(
+        default=DEFAULT_MAX_CONCURRENCY, description="Most tasks of this crew running at once."
+    )
+
+    def _execute_tasks(self, tasks: List[Task], start_index: Optional[int] = 0, was_replayed: bool = False):
+        if (self.process != Process.sequential or start_index or self.max_concurrency <= 1
+                or any(isinstance(task, ConditionalTask) for task in tasks)):
+            return super()._execute_tasks(tasks, start_index, was_replayed)
+
+        dependencies = task_dependencies(tasks)
+        outputs = [None] * len(tasks)
+        pending = set(range(len(tasks)))
+        running = {}
+        busy_agents = set()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="crew-task") as pool:
+            while pending or running:
+                ready = [i for i in sorted(pending) if all(outputs[j] is not None for j in dependencies[i])]
+                for i in ready[:self.max_concurrency - len(running)]:
+                    pending.discard(i)
+                    task = tasks[i]
+                    agent = self._agent_for(task, busy_agents)
+                    tools = self._prepare_tools(agent, task, task.tools or agent.tools or [])
+                    self._log_task_start(task, agent.role)
+                    context = aggregate_raw_outputs_from_task_outputs([outputs[j] for j in dependencies[i]])
+                    # Carry context variables (e.g. the open trace span) into the worker thread
+                    future = pool.submit(contextvars.copy_context().run, task.execute_sync,
+                                         agent=agent, context=context, tools=tools)
+                    running[future] = (i, agent)
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, agent = running.pop(future)
+                    busy_agents.discard(id(agent))
+                    # Let in-flight tasks finish before surfacing a failure
+                    if future.exception() is not None:
+                        for other in running:
+                            other.cancel()
+                        raise future.exception()
+                    outputs[i] = future.result()
+                    self._process_task_result(tasks[i], outputs[i])
+                    self._store_execution_log(tasks[i], outputs[i], i, was_replayed)
+        return self._create_crew_output(outputs)
+
+    # The task's agent, or a private copy when another running task already holds it
+    def _agent_for(self, task, busy_agents):
+        agent = self._get_agent_to_use(task)
+        if agent is None:
+            raise ValueError(f"No agent available for task: {task.description}")
+        if id(agent) in busy_agents:
+            original = agent
+            agent = original.copy()
+            agent.crew = self
+            agent.i18n = original.i18n
+            agent.function_calling_llm = original.function_calling_llm
+            agent.step_callback = original.step_callback
+        busy_agents.add(id(agent))
+        return agent
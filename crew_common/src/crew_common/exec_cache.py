@@ -0,0 +1,211 @@
+"""Content-addressed cache of sandbox execution results.
+
+Agents retry and rerun the same snippets (the coder crew's Leibniz series
+is executed identically on every run). LocalCodeInterpreterTool looks each
+snippet up here before running it. Results (stdout, stderr, exit code and
+runtime) are keyed on a hash of the code, the sandbox limits it ran under,
+and a fingerprint of the interpreter and its installed packages, so raising
+a limit or upgrading Python or a library invalidates them. Only clean runs
+(exit code 0) are stored: errors, MemoryError, timeouts and killed workers
+can depend on load and limits rather than on the code.
+
+Caching is opt-in per snippet: one is served from the cache only if every
+module it imports is in DETERMINISTIC_MODULES and it uses none of
+UNCACHEABLE_NAMES (open, input, id, hash, exec, ...) and builds no sets,
+whose iteration order changes per process. Everything else, including any
+snippet that imports os, io, pathlib, glob, sys or platform, is run every
+time, as is one containing a `# crew: no-cache` comment. CREW_EXEC_CACHE=0 turns the cache off.
+
+    CREW_EXEC_CACHE_PATH=...   # default ~/.cache/crew_agents/exec_cache.sqlite3
+    exec_cache stats
+    exec_cache clear
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import sys
+import threading
+import time
+from importlib import metadata
+from pathlib import Path
+
+DEFAULT_PATH = Path.home() / ".cache" / "crew_agents" / "exec_cache.sqlite3"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+NO_CACHE_MARKER = "# crew: no-cache"
+# Pure computation: same code, same output, on any host and at any time
+DETERMINISTIC_MODULES = frozenset({
+    "math", "cmath", "decimal", "fractions", "numbers", "statistics", "json", "re", "string", "textwrap",
+    "collections", "itertools", "functools", "operator", "heapq", "bisect", "array", "copy", "enum",
+    "dataclasses", "typing", "abc", "__future__", "unicodedata", "base64", "binascii", "hashlib", "struct",
+    "calendar", "pprint", "difflib",
+})
+# Reach the file system, the terminal or the process, or vary per process (string
+# hashing is randomized per process, and with it the iteration order of sets)
+UNCACHEABLE_NAMES = frozenset({
+    "open", "input", "id", "hash", "exec", "eval", "compile", "__import__", "__builtins__", "breakpoint",
+    "globals", "vars", "set", "frozenset",
+})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    stdout TEXT NOT NULL,
+    stderr TEXT NOT NULL,
+    exit_code INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+_fingerprint = None
+
+
+def environment_fingerprint() -> str:
+    """Hash of the interpreter and installed distributions, computed once per process."""
+    global _fingerprint
+    if _fingerprint is None:
+        packages = sorted(f"{dist.metadata['Name']}=={dist.version}".lower() for dist in metadata.distributions())
+        payload = [sys.version, sys.executable, platform.platform(), packages]
+        _fingerprint = hashlib.sha256(json.dumps(payload).encode("utf-8")).hexdigest()
+    return _fingerprint
+
+
+def execution_key(code: str, limits: dict | None = None) -> str:
+    """Hash of the code, the sandbox limits it runs under and the environment."""
+    payload = json.dumps([environment_fingerprint(), limits or {}, code], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(code: str) -> bool:
+    """True only for snippets that import allowlisted modules and avoid uncacheable builtins and sets."""
+    if NO_CACHE_MARKER in code:
+        return False
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        # Never exits cleanly, so there is nothing to store
+        return False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.level or not node.module:
+                return False
+            names = [node.module]
+        elif isinstance(node, (ast.Set, ast.SetComp)):
+            return False
+        elif isinstance(node, ast.Name) and node.id in UNCACHEABLE_NAMES:
+            return False
+        else:
+            continue
+        if any(name.split(".")[0] not in DETERMINISTIC_MODULES for name in names):
+            return False
+    return True
+
+
+class ExecCache:
+    """SQLite store of execution results with least-recently-used eviction by size."""
+
+    def __init__(self, path=None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path or os.environ.get("CREW_EXEC_CACHE_PATH") or DEFAULT_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def get(self, key: str):
+        """The stored result as a dict of stdout, stderr, exit_code and seconds, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT stdout, stderr, exit_code, seconds FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._db.execute(
+                "UPDATE results SET accessed = ?, hits = hits + 1 WHERE key = ?", (time.time(), key))
+            return {"stdout": row[0], "stderr": row[1], "exit_code": row[2], "seconds": row[3]}
+
+    def put(self, key: str, stdout: str, stderr: str, exit_code: int, seconds: float) -> None:
+        now = time.time()
+        size = len(stdout.encode("utf-8")) + len(stderr.encode("utf-8"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, stdout, stderr, exit_code, seconds, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (key, stdout, stderr, exit_code, seconds, size, now, now))
+            self._evict()
+
+    def _evict(self) -> None:
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM results ORDER BY accessed").fetchall():
+            self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, size, hits, saved = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0), "
+                "COALESCE(SUM(hits * seconds), 0) FROM results").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "bytes": size,
+            "session_hits": self.hits,
+            "session_misses": self.misses,
+            "session_hit_rate": self.hits / lookups if lookups else 0.0,
+            "total_hits": hits,
+            "seconds_saved": round(saved, 3),
+        }
+
+
+_cache: ExecCache | None = None
+_cache_lock = threading.Lock()
+
+
+def default_cache():
+    """The process-wide cache, or None when CREW_EXEC_CACHE is off."""
+    global _cache
+    if os.environ.get("CREW_EXEC_CACHE", "1").lower() in ("0", "false", "no", "off"):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ExecCache()
+        return _cache
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect or clear the sandbox execution result cache")
+    parser.add_argument("command", choices=("stats", "clear"))
+    args = parser.parse_args(argv)
+    cache = ExecCache()
+    if args.command == "clear":
+        cache.clear()
+    print(json.dumps(cache.stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
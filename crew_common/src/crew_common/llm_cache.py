@@ -0,0 +1,201 @@
+"""Content-addressed, disk-backed cache for LLM responses, shared by every crew.
+
+Opt in with CREW_LLM_CACHE=1. Responses are stored in one SQLite file
+(CREW_LLM_CACHE_PATH, default ~/.cache/crew_agents/llm_cache.sqlite3) keyed
+on a hash of the rendered messages, the model and the sampling parameters,
+so identical calls from any crew are served from disk. CREW_LLM_CACHE_BYPASS=1
+skips lookups but still stores fresh responses.
+
+    llm_cache stats      # hit rate and size
+    llm_cache clear
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_PATH = Path.home() / ".cache" / "crew_agents" / "llm_cache.sqlite3"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_AGE = 30 * 24 * 3600
+# LLM attributes that change the sampled output
+SAMPLING_PARAMS = (
+    "temperature", "top_p", "n", "stop", "max_tokens", "max_completion_tokens",
+    "presence_penalty", "frequency_penalty", "seed", "response_format", "logit_bias",
+    "reasoning_effort",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    model TEXT,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() in ("1", "true", "yes", "on")
+
+
+def cache_key(model: str, messages, params: dict, tools=None) -> str:
+    """sha256 over the canonical JSON of model, messages, sampling params and tools."""
+    payload = {"model": model, "messages": messages, "params": params, "tools": tools}
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """SQLite store of LLM responses with age and size based eviction."""
+
+    def __init__(self, path=None, max_bytes: int = DEFAULT_MAX_BYTES, max_age: float = DEFAULT_MAX_AGE):
+        self.path = Path(path or os.environ.get("CREW_LLM_CACHE_PATH") or DEFAULT_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def get(self, key: str):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response, created FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None and row[1] < time.time() - self.max_age:
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                self._bump("misses")
+                return None
+            self.hits += 1
+            self._bump("hits")
+            self._db.execute(
+                "UPDATE entries SET accessed = ?, hits = hits + 1 WHERE key = ?", (time.time(), key))
+            return row[0]
+
+    def put(self, key: str, model: str, response: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, model, response, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, len(response.encode("utf-8")), now, now))
+            self._evict(now)
+
+    # Drop expired entries, then least recently used ones until under max_bytes
+    def _evict(self, now: float) -> None:
+        self._db.execute("DELETE FROM entries WHERE created < ?", (now - self.max_age,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall():
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def _bump(self, name: str) -> None:
+        self._db.execute(
+            "INSERT INTO counters (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1", (name,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM counters")
+
+    def stats(self) -> dict:
+        """Hit rate for this process and across every run that shared the file."""
+        with self._lock:
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            counters = dict(self._db.execute("SELECT name, value FROM counters").fetchall())
+        total_hits, total_misses = counters.get("hits", 0), counters.get("misses", 0)
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "bytes": size,
+            "session_hits": self.hits,
+            "session_misses": self.misses,
+            "session_hit_rate": self.hits / lookups if lookups else 0.0,
+            "total_hits": total_hits,
+            "total_misses": total_misses,
+            "total_hit_rate": total_hits / (total_hits + total_misses) if total_hits + total_misses else 0.0,
+        }
+
+
+_cache: LLMCache | None = None
+
+
+def _sampling_params(llm) -> dict:
+    params = {}
+    for name in SAMPLING_PARAMS:
+        value = getattr(llm, name, None)
+        if value is not None:
+            params[name] = value
+    return params
+
+
+def install_llm_cache(cache: LLMCache | None = None, force: bool = False):
+    """Route every crewAI LLM call through the response cache.
+
+    Does nothing unless CREW_LLM_CACHE is set (or force=True). Safe to call
+    more than once; returns the active cache or None.
+    """
+    global _cache
+    if _cache is not None:
+        return _cache
+    if not (force or _env_flag("CREW_LLM_CACHE")):
+        return None
+    from crewai import LLM
+
+    _cache = cache or LLMCache()
+    original_call = LLM.call
+
+    def cached_call(self, messages, *args, **kwargs):
+        tools = kwargs.get("tools", args[0] if args else None)
+        key = cache_key(self.model, messages, _sampling_params(self), tools)
+        if not _env_flag("CREW_LLM_CACHE_BYPASS"):
+            hit = _cache.get(key)
+            if hit is not None:
+                return hit
+        response = original_call(self, messages, *args, **kwargs)
+        # Tool-call results and other structured responses are not cached
+        if isinstance(response, str):
+            _cache.put(key, self.model, response)
+        return response
+
+    cached_call.__wrapped__ = original_call
+    LLM.call = cached_call
+    return _cache
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect or clear the shared LLM response cache")
+    parser.add_argument("command", choices=("stats", "clear"))
+    args = parser.parse_args(argv)
+    cache = LLMCache()
+    if args.command == "clear":
+        cache.clear()
+    print(json.dumps(cache.stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,240 @@
+"""Local OpenAI-compatible stand-in for the model providers.
+
+    mock_llm --port 8900 --token-latency 0.01 --script script.json
+
+Serves POST /v1/chat/completions (plain and streamed), POST /v1/embeddings
+and GET /v1/models. Replies come from a script, a JSON list of entries
+matched in order against the conversation text:
+
+    [{"match": "against the motion", "responses": ["Thought: ...\\nFinal Answer: ..."]},
+     {"match": "Action: Search", "response": "Thought: ...\\nAction: ...\\nAction Input: {...}"}]
+
+"match" is a regular expression searched in the joined message contents;
+an entry with several responses cycles through them. Anything unmatched
+gets a ReAct-style final answer, which ends a crewAI task in one call.
+Latency is simulated as first_token_latency + tokens * token_latency, with
+whitespace-separated words standing in for tokens.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import re
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+MOCK_MODEL = "mock-model"
+EMBEDDING_DIMENSIONS = 1536
+DEFAULT_ANSWER = "Thought: I now can give a great answer\nFinal Answer: {answer}"
+
+
+def _content_text(content) -> str:
+    if isinstance(content, str):
+        return content
+    # Multi-part content: [{"type": "text", "text": ...}, ...]
+    return " ".join(part.get("text", "") for part in content or () if isinstance(part, dict))
+
+
+class Script:
+    """Ordered reply rules with a ReAct final answer as the fallback."""
+
+    def __init__(self, entries=()):
+        self._rules = []
+        for entry in entries:
+            responses = entry.get("responses") or [entry["response"]]
+            self._rules.append((re.compile(entry.get("match", ""), re.S), itertools.cycle(responses)))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path) -> "Script":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def reply(self, messages) -> str:
+        text = "\n".join(_content_text(message.get("content")) for message in messages)
+        with self._lock:
+            for pattern, responses in self._rules:
+                if pattern.search(text):
+                    return next(responses)
+        last = _content_text(messages[-1].get("content")) if messages else ""
+        return DEFAULT_ANSWER.format(answer=f"Mock answer ({len(last.split())} prompt words).")
+
+
+def _embedding(text: str) -> list:
+    # Deterministic unit-ish vector so memory storages get stable neighbours
+    seed = hashlib.sha256(text.encode("utf-8")).digest()
+    values = []
+    block = seed
+    while len(values) < EMBEDDING_DIMENSIONS:
+        block = hashlib.sha256(block).digest()
+        values.extend(v / 2**31 - 1.0 for v in struct.unpack("<8I", block))
+    return values[:EMBEDDING_DIMENSIONS]
+
+
+class MockLLM:
+    """Reply generation and request accounting, independent of the HTTP layer."""
+
+    def __init__(self, script=None, token_latency: float = 0.0, first_token_latency: float = 0.0):
+        self.script = script or Script()
+        self.token_latency = token_latency
+        self.first_token_latency = first_token_latency
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.completion_tokens = 0
+        self.model_seconds = 0.0
+
+    def _account(self, tokens: int, seconds: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.completion_tokens += tokens
+            self.model_seconds += seconds
+
+    def completion(self, body) -> dict:
+        started = time.perf_counter()
+        text = self.script.reply(body.get("messages", []))
+        tokens = text.split()
+        time.sleep(self.first_token_latency + len(tokens) * self.token_latency)
+        self._account(len(tokens), time.perf_counter() - started)
+        prompt_tokens = sum(len(_content_text(m.get("content")).split()) for m in body.get("messages", []))
+        return {
+            "id": f"chatcmpl-mock-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", MOCK_MODEL),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text},
+                         "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": len(tokens),
+                      "total_tokens": prompt_tokens + len(tokens)},
+        }
+
+    # Yield chat.completion.chunk payloads, sleeping per token as a provider would
+    def stream(self, body):
+        started = time.perf_counter()
+        text = self.script.reply(body.get("messages", []))
+        pieces = re.findall(r"\S+\s*|\s+", text)
+        model = body.get("model", MOCK_MODEL)
+        time.sleep(self.first_token_latency)
+        for i, piece in enumerate(pieces):
+            time.sleep(self.token_latency)
+            delta = {"role": "assistant", "content": piece} if i == 0 else {"content": piece}
+            yield {"id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": int(time.time()),
+                   "model": model, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+        yield {"id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": int(time.time()),
+               "model": model, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+        self._account(len(pieces), time.perf_counter() - started)
+
+    def embeddings(self, body) -> dict:
+        inputs = body.get("input", [])
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        return {
+            "object": "list",
+            "model": body.get("model", MOCK_MODEL),
+            "data": [{"object": "embedding", "index": i, "embedding": _embedding(str(text))}
+                     for i, text in enumerate(inputs)],
+            "usage": {"prompt_tokens": 0, "total_tokens": 0},
+        }
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"requests": self.requests, "completion_tokens": self.completion_tokens,
+                    "model_seconds": self.model_seconds}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    llm = None
+
+    def _respond(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream(self, chunks):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for chunk in chunks:
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.flush()
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.close_connection = True
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._respond(200, {"object": "list", "data": [{"id": MOCK_MODEL, "object": "model"}]})
+        elif self.path.rstrip("/").endswith("/stats"):
+            self._respond(200, self.llm.stats())
+        else:
+            self._respond(404, {"error": {"message": f"No route for GET {self.path}"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            self._respond(400, {"error": {"message": f"Invalid JSON: {e}"}})
+            return
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path.endswith("/chat/completions"):
+            if body.get("stream"):
+                self._stream(self.llm.stream(body))
+            else:
+                self._respond(200, self.llm.completion(body))
+        elif path.endswith("/embeddings"):
+            self._respond(200, self.llm.embeddings(body))
+        else:
+            self._respond(404, {"error": {"message": f"No route for POST {self.path}"}})
+
+    def log_message(self, format, *args):
+        pass
+
+
+# Build (but don't start) a threaded server around a MockLLM
+def make_server(host="127.0.0.1", port=0, llm=None):
+    handler = type("MockLLMHandler", (_Handler,), {"llm": llm or MockLLM()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+# Start a server on a background thread; returns (server, base_url ending in /v1)
+def start_background(llm=None, host="127.0.0.1", port=0):
+    server = make_server(host, port, llm)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_port}/v1"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="OpenAI-compatible mock LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--script", help="JSON list of {match, response|responses} rules")
+    parser.add_argument("--token-latency", type=float, default=0.0, help="seconds per generated token")
+    parser.add_argument("--first-token-latency", type=float, default=0.0, help="seconds before the first token")
+    args = parser.parse_args(argv)
+
+    script = Script.load(args.script) if args.script else Script()
+    server = make_server(args.host, args.port, MockLLM(script, args.token_latency, args.first_token_latency))
+    print(f"Mock LLM listening on http://{args.host}:{server.server_port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
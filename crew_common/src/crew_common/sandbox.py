@@ -0,0 +1,328 @@
+"""Local code-execution sandbox: a pool of warm, resource-limited Python workers.
+
+    uv run sandbox -c "print(sum(range(10)))" --repeat 5    # per-execution latency
+
+crewAI's code execution starts a Docker container per snippet, which costs
+seconds each time and fails on hosts without Docker. SandboxPool instead
+keeps `size` worker interpreters running (sandbox_worker.py). Each snippet
+runs in a fresh namespace and scratch directory of an idle worker, under
+rlimits on address space, CPU time and file size, and with a wall-clock
+timeout after which the worker is killed and replaced. Workers are recycled
+after max_uses snippets so state leaked through imported modules doesn't
+pile up. run_snippet() serves repeated deterministic snippets from the
+execution result cache (exec_cache.py) without touching the pool.
+
+Crews choose the backend with CREW_CODE_EXECUTION:
+
+    docker   (default) crewAI's CodeInterpreterTool in a container ("safe"
+             mode); like plain crewAI, it fails when Docker is unavailable
+    local    LocalCodeInterpreterTool (crew_common.tools) on the shared pool
+
+and tune the pool with CREW_SANDBOX_WORKERS, CREW_SANDBOX_TIMEOUT (seconds),
+CREW_SANDBOX_MEMORY_MB and CREW_SANDBOX_DIR. The local backend limits
+resources but is not a security boundary, which is why it is opt-in.
+"""
+from __future__ import annotations
+
+import argparse
+import atexit
+import json
+import os
+import queue
+import shutil
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from crew_common.exec_cache import default_cache, execution_key, is_cacheable
+
+WORKER = Path(__file__).with_name("sandbox_worker.py")
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MEMORY_MB = 1024
+DEFAULT_FILE_MB = 64
+DEFAULT_MAX_USES = 50
+# Attempts to start a replacement worker before the slot is left for execute() to refill
+SPAWN_ATTEMPTS = 3
+# How often a caller waiting for an idle worker checks whether the pool lost its workers
+ACQUIRE_POLL = 1.0
+# Imported by every worker before it reports ready
+PRELOAD = ("math", "json", "random", "re", "collections", "itertools", "decimal", "fractions", "datetime")
+
+
+class ExecutionResult:
+    def __init__(self, stdout="", stderr="", exit_code=0, seconds=0.0, timed_out=False, cached=False):
+        self.stdout = stdout
+        self.stderr = stderr
+        self.exit_code = exit_code
+        self.seconds = seconds
+        self.timed_out = timed_out
+        # Served from the execution result cache; seconds is the original runtime
+        self.cached = cached
+
+    @property
+    def ok(self):
+        return self.exit_code == 0 and not self.timed_out
+
+    def __repr__(self):
+        return (f"ExecutionResult(exit_code={self.exit_code}, seconds={self.seconds:.3f}, "
+                f"timed_out={self.timed_out}, cached={self.cached})")
+
+
+class _Worker:
+    def __init__(self, config):
+        self.process = subprocess.Popen(
+            [sys.executable, "-I", str(WORKER), json.dumps(config)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding="utf-8", cwd=config["scratch"])
+        self.replies = queue.Queue()
+        self.uses = 0
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in self.process.stdout:
+            self.replies.put(json.loads(line))
+        self.replies.put(None)
+
+    def wait_ready(self, timeout):
+        reply = self.replies.get(timeout=timeout)
+        if reply is None or "ready" not in reply:
+            raise RuntimeError("sandbox worker failed to start")
+
+    def run(self, code, cpu_seconds, timeout):
+        self.process.stdin.write(json.dumps({"code": code, "cpu_seconds": cpu_seconds}) + "\n")
+        self.process.stdin.flush()
+        return self.replies.get(timeout=timeout)
+
+    def kill(self):
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+
+
+class SandboxPool:
+    """Fixed-size pool of pre-started worker interpreters."""
+
+    def __init__(self, size=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT, memory_mb=DEFAULT_MEMORY_MB,
+                 file_mb=DEFAULT_FILE_MB, max_uses=DEFAULT_MAX_USES, scratch=None):
+        self.size = size
+        self.timeout = timeout
+        self.max_uses = max_uses
+        self._owns_scratch = scratch is None
+        self.scratch = Path(scratch or tempfile.mkdtemp(prefix="crew-sandbox-")).resolve()
+        self.scratch.mkdir(parents=True, exist_ok=True)
+        self._config = {"scratch": str(self.scratch), "preload": PRELOAD, "memory_mb": memory_mb,
+                        "file_mb": file_mb, "max_cpu_seconds": int(timeout * (max_uses + 1))}
+        # What a snippet's result can depend on besides its code; part of its cache key
+        self.limits = {"timeout": timeout, "memory_mb": memory_mb, "file_mb": file_mb}
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        # Workers that could not be replaced, and why
+        self._lost = 0
+        self.spawn_error = None
+        self.latencies = []
+        self.timeouts = 0
+        self.restarts = 0
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self):
+        worker = _Worker(self._config)
+        try:
+            worker.wait_ready(timeout=60)
+        except BaseException:
+            worker.kill()
+            raise
+        return worker
+
+    # Replace a killed or retired worker off the caller's path so the pool stays warm
+    def _replace(self, worker):
+        worker.kill()
+        with self._lock:
+            self.restarts += 1
+        threading.Thread(target=self._respawn, daemon=True).start()
+
+    # Retry a failed start; if every attempt fails the slot is recorded as lost
+    def _respawn(self):
+        for attempt in range(SPAWN_ATTEMPTS):
+            if self._closed:
+                return
+            try:
+                fresh = self._spawn()
+            except Exception as e:
+                error = e
+                time.sleep(0.5 * 2 ** attempt)
+                continue
+            if self._closed:
+                fresh.kill()
+            else:
+                self._idle.put(fresh)
+            return
+        with self._lock:
+            self._lost += 1
+            self.spawn_error = error
+
+    # Wait for an idle worker; a lost slot is refilled on the caller's thread, which
+    # then sees the error if the worker still can't start
+    def _acquire(self):
+        while True:
+            try:
+                return self._idle.get(timeout=ACQUIRE_POLL)
+            except queue.Empty:
+                pass
+            if self._closed:
+                raise RuntimeError("sandbox pool is closed")
+            with self._lock:
+                if not self._lost:
+                    continue
+                self._lost -= 1
+            try:
+                return self._spawn()
+            except Exception as e:
+                with self._lock:
+                    self._lost += 1
+                    self.spawn_error = e
+                raise RuntimeError(f"sandbox pool has no worker available: {e}") from e
+
+    def execute(self, code: str, timeout: float | None = None) -> ExecutionResult:
+        """Run code on an idle worker; never raises for failures inside the snippet."""
+        if self._closed:
+            raise RuntimeError("sandbox pool is closed")
+        timeout = timeout or self.timeout
+        worker = self._acquire()
+        start = time.perf_counter()
+        try:
+            reply = worker.run(code, max(1, int(timeout)), timeout)
+        except queue.Empty:
+            reply = False
+        except (BrokenPipeError, OSError):
+            reply = None
+        seconds = time.perf_counter() - start
+        if reply is False:
+            self._replace(worker)
+            result = ExecutionResult(stderr=f"Execution timed out after {timeout:g}s", exit_code=-9,
+                                     seconds=seconds, timed_out=True)
+        elif reply is None:
+            # The worker died: CPU or memory limit, or the snippet killed its own process
+            status = worker.process.wait()
+            self._replace(worker)
+            if status == -getattr(signal, "SIGXCPU", 0):
+                result = ExecutionResult(stderr=f"CPU time limit of {int(timeout)}s exceeded", exit_code=status,
+                                         seconds=seconds, timed_out=True)
+            else:
+                result = ExecutionResult(stderr=f"Sandbox worker exited with code {status} (resource limit exceeded?)",
+                                         exit_code=status or -1, seconds=seconds)
+        else:
+            worker.uses += 1
+            if worker.uses >= self.max_uses:
+                self._replace(worker)
+            else:
+                self._idle.put(worker)
+            result = ExecutionResult(reply["stdout"], reply["stderr"], reply["exit_code"], seconds)
+        with self._lock:
+            self.latencies.append(seconds)
+            self.timeouts += result.timed_out
+        return result
+
+    def stats(self):
+        with self._lock:
+            latencies = sorted(self.latencies)
+        counts = {"timeouts": self.timeouts, "restarts": self.restarts, "lost": self._lost}
+        if not latencies:
+            return {"executions": 0, **counts}
+        return {"executions": len(latencies), "mean_ms": statistics.fmean(latencies) * 1000,
+                "p50_ms": latencies[len(latencies) // 2] * 1000, "max_ms": latencies[-1] * 1000, **counts}
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                break
+        if self._owns_scratch:
+            shutil.rmtree(self.scratch, ignore_errors=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def default_pool() -> SandboxPool:
+    """Process-wide pool configured from CREW_SANDBOX_* variables, started on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SandboxPool(
+                size=int(os.environ.get("CREW_SANDBOX_WORKERS", DEFAULT_WORKERS)),
+                timeout=float(os.environ.get("CREW_SANDBOX_TIMEOUT", DEFAULT_TIMEOUT)),
+                memory_mb=int(os.environ.get("CREW_SANDBOX_MEMORY_MB", DEFAULT_MEMORY_MB)),
+                scratch=os.environ.get("CREW_SANDBOX_DIR"))
+            atexit.register(_pool.close)
+        return _pool
+
+
+def run_snippet(code: str, pool: SandboxPool | None = None) -> ExecutionResult:
+    """Execute code on the pool, serving deterministic snippets from the execution result cache."""
+    pool = pool or default_pool()
+    cache = default_cache() if is_cacheable(code) else None
+    key = execution_key(code, pool.limits) if cache is not None else None
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            return ExecutionResult(**hit, cached=True)
+    result = pool.execute(code)
+    # Failures (MemoryError, timeouts, killed workers) can depend on load rather than the code
+    if cache is not None and result.ok:
+        cache.put(key, result.stdout, result.stderr, result.exit_code, result.seconds)
+    return result
+
+
+def code_execution_options(tools=None) -> dict:
+    """Agent keyword arguments for the backend chosen by CREW_CODE_EXECUTION (docker or local).
+
+    Pass the agent's other tools here rather than as a separate tools= argument.
+    """
+    tools = list(tools or [])
+    backend = os.environ.get("CREW_CODE_EXECUTION", "docker").lower()
+    if backend == "docker":
+        return {"allow_code_execution": True, "code_execution_mode": "safe", "tools": tools}
+    if backend != "local":
+        raise ValueError(f"CREW_CODE_EXECUTION must be 'docker' or 'local', not {backend!r}")
+    from crew_common.tools import LocalCodeInterpreterTool
+
+    return {"tools": tools + [LocalCodeInterpreterTool()]}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run a snippet on the local sandbox and report its latency")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("-c", dest="code", help="code to run")
+    source.add_argument("file", nargs="?", help="Python file to run")
+    parser.add_argument("--repeat", type=int, default=1, help="run it this many times (at least 1)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    code = args.code if args.code is not None else Path(args.file).read_text(encoding="utf-8")
+    start = time.perf_counter()
+    pool = SandboxPool(size=args.workers, timeout=args.timeout)
+    print(f"started {args.workers} workers in {(time.perf_counter() - start) * 1000:.0f} ms")
+    try:
+        for i in range(args.repeat):
+            result = pool.execute(code)
+            print(f"run {i + 1}: exit {result.exit_code} in {result.seconds * 1000:.1f} ms")
+        sys.stdout.write(result.stdout)
+        sys.stderr.write(result.stderr)
+        print(json.dumps(pool.stats()))
+    finally:
+        pool.close()
+    return 0 if result.ok else 1
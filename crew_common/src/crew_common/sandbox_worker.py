@@ -0,0 +1,111 @@
+"""Worker process of the local code-execution sandbox; see sandbox.py.
+
+Run as a script with only the standard library. Reads one JSON request per
+line from stdin ({"code": ..., "cpu_seconds": ...}) and answers each with
+one JSON line: {"stdout", "stderr", "exit_code"}. File descriptors 1 and 2
+point at per-execution capture files while a snippet runs, so output from
+child processes is captured too and can't corrupt the protocol stream.
+Every snippet runs in a fresh namespace and a fresh scratch directory;
+imported modules stay loaded, which is what makes the next run warm.
+"""
+import contextlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import traceback
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, timeouts still apply
+    resource = None
+
+MAX_OUTPUT = 64 * 1024
+
+
+def _apply_limits(memory_mb, file_mb, max_cpu_seconds):
+    if resource is None:
+        return
+    for limit, value in ((resource.RLIMIT_AS, memory_mb * 1024 * 1024),
+                         (resource.RLIMIT_FSIZE, file_mb * 1024 * 1024),
+                         (resource.RLIMIT_CPU, max_cpu_seconds)):
+        if value > 0:
+            with contextlib.suppress(ValueError, OSError):
+                resource.setrlimit(limit, (value, value))
+
+
+# CPU time is cumulative per process, so each snippet's budget starts from what is already used
+def _limit_cpu(cpu_seconds):
+    if resource is None or cpu_seconds <= 0:
+        return
+    used = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(used.ru_utime + used.ru_stime) + cpu_seconds
+    hard = resource.getrlimit(resource.RLIMIT_CPU)[1]
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    with contextlib.suppress(ValueError, OSError):
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        data = f.read(MAX_OUTPUT + 1)
+    text = data[:MAX_OUTPUT].decode("utf-8", errors="replace")
+    return text + "\n[output truncated]" if len(data) > MAX_OUTPUT else text
+
+
+def _execute(code, scratch_root):
+    scratch = tempfile.mkdtemp(prefix="run-", dir=scratch_root)
+    out_path, err_path = os.path.join(scratch, ".stdout"), os.path.join(scratch, ".stderr")
+    saved = os.dup(1), os.dup(2)
+    exit_code = 0
+    try:
+        with open(out_path, "wb") as out, open(err_path, "wb") as err:
+            os.dup2(out.fileno(), 1)
+            os.dup2(err.fileno(), 2)
+        os.chdir(scratch)
+        try:
+            exec(compile(code, "<snippet>", "exec"), {"__name__": "__main__", "__builtins__": __builtins__})
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        return {"stdout": _read(out_path), "stderr": _read(err_path), "exit_code": exit_code}
+    finally:
+        os.dup2(saved[0], 1)
+        os.dup2(saved[1], 2)
+        os.close(saved[0])
+        os.close(saved[1])
+        os.chdir(scratch_root)
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def main():
+    config = json.loads(sys.argv[1])
+    scratch_root = config["scratch"]
+    # The protocol uses private copies of stdin/stdout; snippets see /dev/null and capture files
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    os.chdir(scratch_root)
+    for module in config.get("preload", ()):
+        with contextlib.suppress(ImportError):
+            __import__(module)
+    _apply_limits(config.get("memory_mb", 0), config.get("file_mb", 0), config.get("max_cpu_seconds", 0))
+    replies.write(json.dumps({"ready": os.getpid()}) + "\n")
+    replies.flush()
+    for line in requests:
+        request = json.loads(line)
+        _limit_cpu(request.get("cpu_seconds", 0))
+        replies.write(json.dumps(_execute(request["code"], scratch_root)) + "\n")
+        replies.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Import-time profiler that enforces a startup budget per entry point.
+
+    uv run startup_budget                      # inside a crew folder
+    uv run startup_budget coder.tools.scaffold --budget 50
+
+Budgets live in the crew's pyproject.toml, in milliseconds, keyed by the
+module to import or by a [project.scripts] name (which measures the
+module its entry point lives in):
+
+    [tool.crew_common.startup_budget]
+    scaffold_next = 150
+    "coder.tools.scaffold" = 50
+
+Each module is imported in a fresh interpreter with `python -X importtime`,
+several times, and the median cumulative import time is compared with its
+budget. The heaviest imports it pulls in are listed so a regression points
+at the dependency that caused it. Exits 1 when any budget is exceeded.
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+DEFAULT_RUNS = 5
+TOP = 8
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def _load_toml(path: Path) -> dict:
+    try:
+        import tomllib
+    except ImportError:  # Python 3.10
+        import tomli as tomllib
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def read_budgets(pyproject="pyproject.toml") -> dict:
+    """{module: budget_ms} from [tool.crew_common.startup_budget], script names resolved to modules."""
+    config = _load_toml(Path(pyproject))
+    scripts = config.get("project", {}).get("scripts", {})
+    budgets = {}
+    for name, budget in config.get("tool", {}).get("crew_common", {}).get("startup_budget", {}).items():
+        module = scripts[name].split(":")[0] if name in scripts else name
+        budgets[module] = min(float(budget), budgets.get(module, float("inf")))
+    return budgets
+
+
+def measure(module: str, runs: int = DEFAULT_RUNS):
+    """Median cumulative import time of module in ms, and its heaviest imports as (ms, name)."""
+    totals, heaviest = [], {}
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                              capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"importing {module} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+        # Children are printed before their parent, so the module's imports precede its own line
+        total, pending = 0.0, []
+        for line in proc.stderr.splitlines():
+            match = _LINE.match(line)
+            if not match:
+                continue
+            cumulative_ms, depth, name = int(match[2]) / 1000, len(match[3]) // 2, match[4]
+            if depth > 0:
+                pending.append((depth, name, cumulative_ms))
+                continue
+            # A dotted module's parent packages are imported alongside it
+            if name == module or module.startswith(name + "."):
+                total += cumulative_ms
+                for child_depth, child, child_ms in pending:
+                    if child_depth <= 2:
+                        heaviest.setdefault(child, []).append(child_ms)
+            pending = []
+        totals.append(total)
+    top = sorted(((statistics.median(times), name) for name, times in heaviest.items()), reverse=True)
+    return statistics.median(totals), top[:TOP]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure import time of entry points against a startup budget")
+    parser.add_argument("module", nargs="?", help="module to measure (default: every budget in pyproject.toml)")
+    parser.add_argument("--budget", type=float, help="budget in ms for the given module")
+    parser.add_argument("--pyproject", default="pyproject.toml")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args(argv)
+
+    if args.module:
+        budgets = {args.module: args.budget}
+    else:
+        budgets = read_budgets(args.pyproject)
+        if not budgets:
+            parser.error(f"no [tool.crew_common.startup_budget] table in {args.pyproject}")
+
+    over = 0
+    for module, budget in budgets.items():
+        total, top = measure(module, args.runs)
+        failed = budget is not None and total > budget
+        over += failed
+        verdict = "" if budget is None else f" / {budget:.0f} ms  {'OVER BUDGET' if failed else 'ok'}"
+        print(f"{module}: {total:.1f} ms{verdict}")
+        for ms, name in top:
+            print(f"    {ms:9.1f} ms  {name}")
+    return 1 if over else 0
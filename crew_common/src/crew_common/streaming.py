@@ -0,0 +1,260 @@
+"""Stream each task's final answer to its output file and stdout as tokens arrive.
+
+Opt in with CREW_STREAM=1. While a crew kicks off, every LLM it calls is
+switched to streaming (and switched back to its previous setting once no
+kickoff is running), and once a response reaches "Final Answer:" the rest
+of it is appended to
+`<output_file>.partial` and echoed to stdout, so a watcher can tail the
+report while it is written. When the task finishes its output file is
+written to a temporary file and renamed into place, so readers only ever see
+a complete file, and the .partial file is removed.
+
+The handlers are registered inside crewAI's scoped_handlers(), which sets
+crewAI's own console listeners aside for the kickoff: its echo of raw
+chunks would interleave parallel tasks token by token, so the console shows
+one task's answer live instead and replays the others' as it finishes.
+Kickoffs running at once (batch runs) share one scope.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from contextlib import ExitStack
+from pathlib import Path
+
+FINAL_ANSWER = "Final Answer:"
+
+
+def streaming_enabled() -> bool:
+    return os.environ.get("CREW_STREAM", "").lower() in ("1", "true", "yes", "on")
+
+
+class _Console:
+    """Shows one task's answer live at a time; the others are buffered until it finishes."""
+
+    def __init__(self, out):
+        self.out = out
+        self.owner = None
+        self.waiting = []
+        self._lock = threading.Lock()
+
+    def write(self, stream, text):
+        with self._lock:
+            if self.owner is None:
+                self.owner = stream
+                self.out.write(f"\n--- {stream.name} ---\n")
+            if self.owner is stream:
+                self.out.write(text)
+                self.out.flush()
+                return
+            if stream not in self.waiting:
+                self.waiting.append(stream)
+            stream.backlog.append(text)
+
+    def finish(self, stream):
+        with self._lock:
+            if self.owner is not stream:
+                return
+            self.out.write("\n")
+            self.owner = None
+            # Replay waiting answers in order until one is still being generated
+            while self.waiting and self.owner is None:
+                stream = self.waiting.pop(0)
+                self.out.write(f"\n--- {stream.name} ---\n" + "".join(stream.backlog))
+                stream.backlog.clear()
+                if stream.done:
+                    self.out.write("\n")
+                else:
+                    self.owner = stream
+            self.out.flush()
+
+
+class _TaskStream:
+    def __init__(self, task, console):
+        self.name = task.name or "task"
+        self.console = console
+        self.partial = Path(f"{task.output_file}.partial") if task.output_file else None
+        self.file = None
+        self.backlog = []
+        self.done = False
+        self.reset()
+
+    # Called at the start of each LLM response; only the final answer is streamed
+    def reset(self):
+        self.buffer = ""
+        self.answering = False
+
+    def feed(self, chunk):
+        if self.answering:
+            self._emit(chunk)
+            return
+        self.buffer += chunk
+        marker = self.buffer.find(FINAL_ANSWER)
+        if marker >= 0:
+            self.answering = True
+            self._emit(self.buffer[marker + len(FINAL_ANSWER):].lstrip())
+
+    def _emit(self, text):
+        if not text:
+            return
+        if self.partial is not None:
+            if self.file is None:
+                self.partial.parent.mkdir(parents=True, exist_ok=True)
+                self.file = open(self.partial, "w", encoding="utf-8")
+            self.file.write(text)
+            self.file.flush()
+        if self.console is not None:
+            self.console.write(self, text)
+
+    def close(self, remove=True):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if remove and self.partial is not None and self.partial.exists():
+            self.partial.unlink()
+
+    def finish(self):
+        self.done = True
+        self.close(remove=False)
+        if self.console is not None:
+            self.console.finish(self)
+
+
+def _write_atomic(path, result):
+    path = Path(path).expanduser().resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        if isinstance(result, dict):
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        else:
+            f.write(str(result))
+    os.replace(tmp, path)
+
+
+class _StreamingScope:
+    """Event handlers and LLM stream flags for the kickoffs currently running.
+
+    Reference counted: the first kickoff to enter registers the handlers in a
+    scoped_handlers() block, the last one to leave closes it and restores the
+    stream flag of every LLM that was switched on.
+    """
+
+    def __init__(self, echo):
+        self.echo = echo
+        self.depth = 0
+        self.streams = {}
+        self.previous = {}  # id(llm) -> (llm, its stream flag before the scope)
+        self._lock = threading.Lock()
+        self._stack = None
+
+    def enter(self):
+        with self._lock:
+            self.depth += 1
+            if self.depth == 1:
+                self._stack = ExitStack()
+                self._register(self._stack, _Console(self.echo) if self.echo else None)
+
+    def exit(self):
+        with self._lock:
+            self.depth -= 1
+            if self.depth:
+                return
+            self._stack.close()
+            for llm, stream in self.previous.values():
+                llm.stream = stream
+            self.previous.clear()
+            for stream in self.streams.values():
+                stream.close(remove=False)
+            self.streams.clear()
+
+    def stream_llm(self, llm):
+        with self._lock:
+            if self.depth and id(llm) not in self.previous:
+                self.previous[id(llm)] = (llm, llm.stream)
+                llm.stream = True
+
+    def _register(self, stack, console):
+        from crewai.utilities.events import crewai_event_bus
+        from crewai.utilities.events.llm_events import LLMCallStartedEvent, LLMStreamChunkEvent
+        from crewai.utilities.events.task_events import TaskCompletedEvent, TaskFailedEvent, TaskStartedEvent
+
+        stack.enter_context(crewai_event_bus.scoped_handlers())
+        streams = self.streams
+
+        @crewai_event_bus.on(TaskStartedEvent)
+        def on_task_started(source, event):
+            if event.task is not None:
+                with self._lock:
+                    streams[str(event.task.id)] = _TaskStream(event.task, console)
+
+        @crewai_event_bus.on(LLMCallStartedEvent)
+        def on_call_started(source, event):
+            stream = streams.get(str(event.task_id))
+            if stream is not None:
+                stream.reset()
+
+        @crewai_event_bus.on(LLMStreamChunkEvent)
+        def on_chunk(source, event):
+            stream = streams.get(str(event.task_id))
+            if stream is not None and event.tool_call is None:
+                stream.feed(event.chunk)
+
+        @crewai_event_bus.on(TaskCompletedEvent)
+        @crewai_event_bus.on(TaskFailedEvent)
+        def on_task_finished(source, event):
+            if event.task is None:
+                return
+            with self._lock:
+                stream = streams.pop(str(event.task.id), None)
+            if stream is not None:
+                # A failed task keeps its .partial file for inspection
+                stream.finish()
+
+
+_installed = False
+
+
+def install_streaming(echo=sys.stdout, force: bool = False) -> bool:
+    """Stream final answers of every crew in this process; a no-op unless CREW_STREAM is set."""
+    global _installed
+    if _installed:
+        return True
+    if not (force or streaming_enabled()):
+        return False
+    from crewai import LLM, Crew, Task
+
+    scope = _StreamingScope(echo)
+
+    def save_file(task, result):
+        try:
+            _write_atomic(task.output_file, result)
+        except OSError as e:
+            raise RuntimeError(f"Failed to save output file: {e}")
+        stream = scope.streams.get(str(task.id))
+        if stream is not None:
+            stream.close()
+
+    original_kickoff = Crew.kickoff
+    original_call = LLM.call
+
+    def streaming_kickoff(crew, *args, **kwargs):
+        scope.enter()
+        try:
+            return original_kickoff(crew, *args, **kwargs)
+        finally:
+            scope.exit()
+
+    def streaming_call(llm, *args, **kwargs):
+        scope.stream_llm(llm)
+        return original_call(llm, *args, **kwargs)
+
+    streaming_kickoff.__wrapped__ = original_kickoff
+    streaming_call.__wrapped__ = original_call
+    Crew.kickoff = streaming_kickoff
+    LLM.call = streaming_call
+    Task._save_file = save_file
+    _installed = True
+    return True
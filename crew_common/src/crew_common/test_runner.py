@@ -0,0 +1,324 @@
+"""Parallel runner for generated test modules, with results cached per test.
+
+    uv run run_tests                       # inside engineering_team: output/test_*.py
+    uv run run_tests output --workers 8 --timeout 5 --json
+
+Test modules matching the pattern are collected without importing them:
+unittest TestCase methods, methods of plain Test* classes and top-level
+test_* functions. Tests that take arguments (pytest fixtures, parametrize)
+are reported as errors without running. Each test runs on its own in a
+warm sandbox worker, so tests are spread over the pool, a hanging test is
+killed at the timeout, and no test sees module state left by another.
+TestCase tests run inside a unittest.TestSuite, so setUpModule and
+setUpClass run; plain tests get pytest's setup_module, setup_class,
+setup_method and setup_function (and their teardowns). The outcome comes
+back through a result file, not the test's output, which may be truncated.
+
+run_tests() uses the shared, already warm sandbox.default_pool() unless
+given a pool or a worker count; the CLI starts a pool of --workers.
+
+Outcomes are cached in <directory>/.test_cache.json under
+(module hash, test hash). The module hash covers the Python version, the
+test module's shared code (imports, helpers, fixtures) and every local
+module it imports, such as the backend module under test. The test hash
+covers the test's own source and its class's setUp-style members. Editing
+one test reruns only that test; changing the backend reruns its tests.
+Timeouts and harness failures (a crashed worker, no result) are never
+cached.
+
+RunTestsTool (crew_common.tools) gives an agent the same runner: it saves a
+test module and returns the compact JSON summary, so the test engineer can
+fix its tests before answering.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from crew_common.sandbox import SandboxPool, default_pool
+
+DEFAULT_PATTERN = "test_*.py"
+DEFAULT_TIMEOUT = 10.0
+CACHE_FILE = ".test_cache.json"
+MESSAGE_LINES = 6
+
+# Runs one test inside a sandbox worker and writes its outcome to the result file
+_RUN_ONE = '''
+import asyncio, contextlib, importlib, inspect, json, sys, traceback, unittest
+_dir, _module, _cls, _name, _result_path = {args!r}
+if _dir not in sys.path:
+    sys.path.insert(0, _dir)
+# Workers are reused; drop modules loaded from the directory by an earlier test
+for _key, _mod in list(sys.modules.items()):
+    if (getattr(_mod, "__file__", None) or "").startswith(_dir):
+        del sys.modules[_key]
+
+# Call a pytest-style setup/teardown hook if the holder defines one, with arg if it takes one
+def _fixture(holder, name, arg):
+    hook = getattr(holder, name, None)
+    if callable(hook):
+        hook(*[arg][:len(inspect.signature(hook).parameters)])
+
+_status, _message = "passed", ""
+try:
+    _mod = importlib.import_module(_module)
+    _owner = getattr(_mod, _cls) if _cls else None
+    if isinstance(_owner, type) and issubclass(_owner, unittest.TestCase):
+        # The suite runs setUpModule/setUpClass and their teardowns around the test
+        _result = unittest.TestResult()
+        unittest.TestSuite([_owner(_name)]).run(_result)
+        if _result.errors:
+            _status, _message = "error", _result.errors[0][1]
+        elif _result.failures:
+            _status, _message = "failed", _result.failures[0][1]
+        elif _result.skipped:
+            _status, _message = "skipped", _result.skipped[0][1]
+    else:
+        _target = _owner() if _owner else _mod
+        _test = getattr(_target, _name)
+        _scopes = [(_mod, "module", _mod)] + (
+            [(_owner, "class", _owner), (_target, "method", _test)] if _owner else [(_mod, "function", _test)])
+        with contextlib.ExitStack() as _stack:
+            for _holder, _scope, _arg in _scopes:
+                _fixture(_holder, "setup_" + _scope, _arg)
+                _stack.callback(_fixture, _holder, "teardown_" + _scope, _arg)
+            _outcome = _test()
+            if inspect.iscoroutine(_outcome):
+                asyncio.run(_outcome)
+except unittest.SkipTest as _e:
+    _status, _message = "skipped", str(_e)
+except AssertionError:
+    _status, _message = "failed", traceback.format_exc()
+except BaseException:
+    _status, _message = "error", traceback.format_exc()
+with open(_result_path, "w", encoding="utf-8") as _file:
+    json.dump({{"status": _status, "message": _message}}, _file)
+'''
+
+
+def _hash(*parts) -> str:
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _is_test(node) -> bool:
+    return isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test")
+
+
+# Parameters a test needs that nobody will pass; pytest would fill them from fixtures
+def _required_args(node, method: bool) -> list:
+    args = node.args
+    positional = args.posonlyargs + args.args
+    required = [arg.arg for arg in positional[:len(positional) - len(args.defaults)]]
+    if method and required:
+        required = required[1:]
+    return required + [arg.arg for arg, default in zip(args.kwonlyargs, args.kw_defaults) if default is None]
+
+
+def _local_imports(tree, directory: Path):
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            path = directory / f"{name.split('.')[0]}.py"
+            if path.exists():
+                yield path
+
+
+# Source of the local modules a test module depends on, following their own local imports
+def _dependency_sources(tree, directory: Path, seen=None) -> list:
+    seen = set() if seen is None else seen
+    sources = []
+    for path in _local_imports(tree, directory):
+        if path in seen:
+            continue
+        seen.add(path)
+        source = path.read_text(encoding="utf-8", errors="replace")
+        sources.append(f"{path.name}\0{source}")
+        try:
+            sources += _dependency_sources(ast.parse(source), directory, seen)
+        except SyntaxError:
+            pass
+    return sorted(sources)
+
+
+class CollectedTest:
+    def __init__(self, path: Path, cls, name, module_hash, test_hash, problem=None):
+        self.path = path
+        self.cls = cls
+        self.name = name
+        self.key = f"{module_hash}:{test_hash}"
+        # Why the test can't run, reported as its error
+        self.problem = problem
+
+    @property
+    def id(self):
+        return "::".join(part for part in (self.path.name, self.cls, self.name) if part)
+
+
+def collect(path: Path):
+    """The tests of one module; a module that doesn't parse yields a single failing entry."""
+    source = path.read_text(encoding="utf-8", errors="replace")
+    try:
+        tree = ast.parse(source)
+    except SyntaxError as e:
+        return [], f"{path.name}: SyntaxError: {e}"
+    shared, found = [], []
+    for node in tree.body:
+        if _is_test(node):
+            found.append((None, node, ast.unparse(node)))
+        elif isinstance(node, ast.ClassDef) and any(_is_test(member) for member in node.body):
+            members = [member for member in node.body if not _is_test(member)]
+            setup = ast.unparse(ast.ClassDef(name=node.name, bases=node.bases, keywords=node.keywords,
+                                             body=members or [ast.Pass()], decorator_list=node.decorator_list))
+            found += [(node.name, member, f"{setup}\0{ast.unparse(member)}")
+                      for member in node.body if _is_test(member)]
+        else:
+            shared.append(ast.unparse(node))
+    module_hash = _hash(sys.version, "\n".join(shared), *_dependency_sources(tree, path.parent))
+    tests = []
+    for cls, node, test_source in found:
+        required = _required_args(node, method=cls is not None)
+        problem = (f"takes arguments ({', '.join(required)}); pytest fixtures and parametrize are not "
+                   "supported, so write the test without parameters") if required else None
+        tests.append(CollectedTest(path, cls, node.name, module_hash, _hash(cls or "", test_source), problem))
+    return tests, None
+
+
+def _load_cache(directory: Path) -> dict:
+    try:
+        return json.loads((directory / CACHE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(directory: Path, cache: dict) -> None:
+    path = directory / CACHE_FILE
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(cache, indent=1), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _short(message: str) -> str:
+    lines = [line for line in message.strip().splitlines() if line.strip()]
+    return "\n".join(lines[-MESSAGE_LINES:])
+
+
+def run_tests(directory="output", pattern=DEFAULT_PATTERN, workers=None, timeout=DEFAULT_TIMEOUT,
+              use_cache=True, files=None, pool=None) -> dict:
+    """Run every collected test in parallel; returns the summary dict (see summarize).
+
+    Tests run on pool, else on a pool of `workers` started for this call,
+    else on the shared default_pool().
+    """
+    directory = Path(directory).resolve()
+    start = time.perf_counter()
+    paths = [directory / name for name in files] if files else sorted(directory.glob(pattern))
+    tests, results = [], []
+    for path in paths:
+        collected, problem = collect(path)
+        tests += collected
+        if problem:
+            results.append({"test": path.name, "status": "error", "message": problem, "seconds": 0.0})
+
+    cache = _load_cache(directory) if use_cache else {}
+    todo = []
+    for test in tests:
+        hit = cache.get(test.key)
+        if test.problem:
+            results.append({"test": test.id, "status": "error", "message": test.problem, "seconds": 0.0})
+        elif hit is not None:
+            results.append({"test": test.id, **hit, "cached": True})
+        else:
+            todo.append(test)
+
+    if todo:
+        owned = pool is None and workers is not None
+        if owned:
+            pool = SandboxPool(size=max(1, min(workers, len(todo))), timeout=timeout)
+        elif pool is None:
+            pool = default_pool()
+
+        # (test, outcome, seconds, cacheable); only outcomes the test itself reported are cacheable
+        def run_one(test):
+            result_path = pool.scratch / f"result-{uuid.uuid4().hex}.json"
+            code = _RUN_ONE.format(args=(str(directory), test.path.stem, test.cls, test.name, str(result_path)))
+            try:
+                result = pool.execute(code, timeout)
+                if result.timed_out:
+                    outcome = {"status": "timeout", "message": f"timed out after {timeout:g}s"}
+                    return test, outcome, result.seconds, False
+                try:
+                    return test, json.loads(result_path.read_text(encoding="utf-8")), result.seconds, True
+                except (OSError, ValueError):
+                    message = result.stderr or result.stdout or "test worker crashed"
+                    return test, {"status": "error", "message": message}, result.seconds, False
+            except RuntimeError as e:
+                return test, {"status": "error", "message": str(e)}, 0.0, False
+            finally:
+                result_path.unlink(missing_ok=True)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(pool.size, len(todo)))) as threads:
+                for test, outcome, seconds, cacheable in threads.map(run_one, todo):
+                    record = {"status": outcome["status"], "message": _short(outcome["message"]),
+                              "seconds": round(seconds, 4)}
+                    if cacheable:
+                        cache[test.key] = record
+                    results.append({"test": test.id, **record, "cached": False})
+        finally:
+            if owned:
+                pool.close()
+        if use_cache:
+            _save_cache(directory, cache)
+    return summarize(results, time.perf_counter() - start)
+
+
+def summarize(results, seconds) -> dict:
+    """Counts per status plus the failing tests with the tail of their tracebacks."""
+    counts = {status: 0 for status in ("passed", "failed", "error", "timeout", "skipped")}
+    for result in results:
+        counts[result["status"]] += 1
+    failures = [{"test": result["test"], "status": result["status"], "message": result["message"]}
+                for result in sorted(results, key=lambda result: result["test"])
+                if result["status"] in ("failed", "error", "timeout")]
+    return {**counts, "total": len(results), "cached": sum(1 for result in results if result.get("cached")),
+            "seconds": round(seconds, 3), "failures": failures}
+
+
+def main(argv=None, directory="output") -> int:
+    parser = argparse.ArgumentParser(description="Run generated test modules in parallel with cached results")
+    parser.add_argument("directory", nargs="?", default=directory)
+    parser.add_argument("--pattern", default=DEFAULT_PATTERN)
+    parser.add_argument("--workers", type=int, default=None, help="parallel workers (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="seconds per test")
+    parser.add_argument("--no-cache", action="store_true", help="rerun every test")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    summary = run_tests(args.directory, args.pattern, args.workers or os.cpu_count() or 1, args.timeout,
+                        not args.no_cache)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        for failure in summary["failures"]:
+            print(f"{failure['status'].upper()} {failure['test']}\n{failure['message']}\n")
+        print(f"{summary['passed']} passed, {summary['failed']} failed, {summary['error']} errors, "
+              f"{summary['timeout']} timed out, {summary['skipped']} skipped "
+              f"({summary['cached']} cached) in {summary['seconds']:.2f}s")
+    return 1 if summary["failures"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,61 @@
+"""crewAI tools over the local sandbox and test runner.
+
+Kept apart from sandbox.py and test_runner.py so those modules, and the
+`sandbox` and `run_tests` scripts, only need the standard library.
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+from typing import List, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from crew_common.sandbox import run_snippet
+from crew_common.test_runner import run_tests
+
+
+class CodeInterpreterInput(BaseModel):
+    code: str = Field(..., description="Python3 code to run. ALWAYS PRINT the final result and the output of the code")
+    libraries_used: List[str] = Field(
+        default_factory=list, description="Libraries the code imports; they must already be installed")
+
+
+class LocalCodeInterpreterTool(BaseTool):
+    name: str = "Code Interpreter"
+    description: str = "Interprets Python3 code strings with a final print statement."
+    args_schema: Type[BaseModel] = CodeInterpreterInput
+
+    def _run(self, code: str, libraries_used: List[str] | None = None) -> str:
+        missing = [name for name in libraries_used or () if importlib.util.find_spec(name.split("==")[0]) is None]
+        if missing:
+            return f"These libraries are not installed and can't be installed here: {', '.join(missing)}"
+        result = run_snippet(code)
+        if result.ok:
+            return result.stdout
+        return f"Something went wrong while running the code: \n{result.stderr or result.stdout}"
+
+
+class RunTestsInput(BaseModel):
+    filename: str = Field(..., description="Test module file name, e.g. test_accounts.py")
+    source: str = Field(..., description="Complete Python source of the test module")
+
+
+class RunTestsTool(BaseTool):
+    name: str = "Run Tests"
+    description: str = (
+        "Saves a test module next to the backend module and runs its tests in parallel. "
+        "Returns JSON with pass/fail counts and the failing tests with their errors."
+    )
+    args_schema: Type[BaseModel] = RunTestsInput
+    directory: str = "output"
+
+    def _run(self, filename: str, source: str) -> str:
+        if Path(filename).name != filename or not filename.endswith(".py"):
+            return "filename must be a plain .py file name without directories"
+        path = Path(self.directory) / filename
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+        return json.dumps(run_tests(self.directory, files=[filename]))
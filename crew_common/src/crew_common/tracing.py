@@ -0,0 +1,249 @@
+"""Structured spans for crew runs: crew, task, agent, step, LLM call and tool call.
+
+    uv run profile                        # inside any crew folder
+    uv run profile --trace output/trace.jsonl
+
+Tracer patches crewAI once per process. Each span carries its latency and
+parent, plus kind-specific attributes: token counts on LLM calls, attempt
+numbers on agent executions (which restart when a task is retried), and
+parsing retries on tool calls. The hierarchical manager's delegations show
+up as tool calls with nested agent spans. Finished spans are appended to a
+JSONL trace as they end, and summary() aggregates them per kind and name.
+"""
+from __future__ import annotations
+
+import argparse
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+
+DEFAULT_TRACE_PATH = Path("output") / "trace.jsonl"
+KINDS = ("crew", "task", "agent", "step", "llm", "tool")
+
+# Open spans of the current thread or task, innermost last
+_stack: contextvars.ContextVar[tuple] = contextvars.ContextVar("crew_trace_stack", default=())
+
+
+class _UsageCapture:
+    """litellm-style callback that keeps the usage reported for one LLM call."""
+
+    def __init__(self):
+        self.usage = None
+
+    def log_success_event(self, kwargs=None, response_obj=None, start_time=None, end_time=None):
+        self.usage = (response_obj or {}).get("usage")
+
+
+def _usage_field(usage, name):
+    if usage is None:
+        return 0
+    value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+    return value or 0
+
+
+class Tracer:
+    """Records nested spans in memory and, optionally, to a JSONL file."""
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self.trace_id = uuid.uuid4().hex
+        self.spans = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._file = None
+        self._patches = []
+        # Outermost open crew span; parent for spans on threads that did not inherit a context
+        self._root = None
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+
+    def start(self, kind, name, **attrs):
+        stack = _stack.get()
+        parent = stack[-1] if stack else self._root
+        span = {"trace_id": self.trace_id, "span_id": next(self._ids),
+                "parent_id": parent["span_id"] if parent else None, "kind": kind,
+                "name": " ".join(str(name).split()),
+                "thread": threading.current_thread().name, "start": time.time(),
+                "_t0": time.perf_counter(), **attrs}
+        _stack.set(stack + (span,))
+        if kind == "crew" and self._root is None:
+            self._root = span
+        return span
+
+    def end(self, span, error=None, **attrs):
+        stack = _stack.get()
+        position = next((i for i, open_span in enumerate(stack) if open_span is span), None)
+        if position is not None:
+            # Inner spans still open, such as an agent's last step, end with their parent
+            for inner in reversed(stack[position + 1:]):
+                self._finish(inner)
+            _stack.set(stack[:position])
+        if error is not None:
+            attrs["error"] = f"{type(error).__name__}: {error}"
+        self._finish(span, **attrs)
+
+    def _finish(self, span, **attrs):
+        span["duration_ms"] = (time.perf_counter() - span.pop("_t0")) * 1000
+        span.update(attrs)
+        if self._root is span:
+            self._root = None
+        with self._lock:
+            self.spans.append(span)
+            if self._file:
+                self._file.write(json.dumps(span, default=str) + "\n")
+                self._file.flush()
+
+    def wrap(self, kind, func, name=None, before=None, after=None):
+        """Wrap func in a span; name/before/after receive the call's args to derive attributes."""
+        tracer = self
+
+        def traced(*args, **kwargs):
+            extra = before(*args, **kwargs) if before else {}
+            span = tracer.start(kind, name(*args, **kwargs) if name else kind, **extra)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                tracer.end(span, error=e, **(after(*args, **kwargs) if after else {}))
+                raise
+            tracer.end(span, **(after(*args, **kwargs) if after else {}))
+            return result
+
+        traced.__wrapped__ = func
+        return traced
+
+    def _patch(self, owner, attr, replacement):
+        self._patches.append((owner, attr, getattr(owner, attr)))
+        setattr(owner, attr, replacement)
+
+    def install(self):
+        """Patch crewAI so every crew, task, agent step, LLM and tool call opens a span."""
+        from crewai import LLM, Crew, Task
+        from crewai.agents import crew_agent_executor
+        from crewai.agents.crew_agent_executor import CrewAgentExecutor
+        from crewai.tools.tool_usage import ToolUsage
+
+        tracer = self
+        self._patch(Crew, "kickoff", self.wrap(
+            "crew", Crew.kickoff, name=lambda crew, *a, **k: crew.name or type(crew).__name__))
+        self._patch(Task, "_execute_core", self.wrap(
+            "task", Task._execute_core,
+            name=lambda task, *a, **k: task.name or task.description[:40],
+            before=lambda task, agent=None, *a, **k: {"agent": getattr(agent or task.agent, "role", None)}))
+        self._patch(CrewAgentExecutor, "invoke", self.wrap(
+            "agent", CrewAgentExecutor.invoke,
+            name=lambda executor, *a, **k: getattr(executor.agent, "role", "agent"),
+            before=lambda executor, *a, **k: {
+                "attempt": getattr(executor.agent, "_times_executed", 0) + 1},
+            after=lambda executor, *a, **k: {"steps": executor.iterations}))
+
+        # A step runs from one iteration check of the agent loop to the next
+        original_check = crew_agent_executor.has_reached_max_iterations
+
+        def step_boundary(iterations, max_iterations):
+            stack = _stack.get()
+            if stack and stack[-1]["kind"] == "step":
+                tracer.end(stack[-1])
+            tracer.start("step", f"step {iterations + 1}", iteration=iterations + 1)
+            return original_check(iterations, max_iterations)
+
+        self._patch(crew_agent_executor, "has_reached_max_iterations", step_boundary)
+
+        original_call = LLM.call
+
+        def traced_call(llm, messages, *args, **kwargs):
+            capture = _UsageCapture()
+            if len(args) >= 2:
+                args = (args[0], list(args[1] or []) + [capture]) + args[2:]
+            else:
+                kwargs["callbacks"] = list(kwargs.get("callbacks") or []) + [capture]
+            span = tracer.start("llm", llm.model)
+            try:
+                result = original_call(llm, messages, *args, **kwargs)
+            except BaseException as e:
+                tracer.end(span, error=e)
+                raise
+            tracer.end(span, prompt_tokens=_usage_field(capture.usage, "prompt_tokens"),
+                       completion_tokens=_usage_field(capture.usage, "completion_tokens"))
+            return result
+
+        traced_call.__wrapped__ = original_call
+        self._patch(LLM, "call", traced_call)
+        self._patch(ToolUsage, "use", self.wrap(
+            "tool", ToolUsage.use,
+            name=lambda usage, calling, *a, **k: getattr(calling, "tool_name", None) or "invalid tool call",
+            after=lambda usage, *a, **k: {"retries": getattr(usage, "_run_attempts", 1) - 1}))
+        return self
+
+    def uninstall(self):
+        for owner, attr, original in reversed(self._patches):
+            setattr(owner, attr, original)
+        self._patches.clear()
+
+    def close(self):
+        self.uninstall()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def summary(self):
+        """Rows of (kind, name, count, total_ms, mean_ms, max_ms, prompt_tokens, completion_tokens, retries, errors)."""
+        groups = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            groups.setdefault((span["kind"], span["name"]), []).append(span)
+        rows = []
+        for (kind, name), group in groups.items():
+            durations = [span["duration_ms"] for span in group]
+            rows.append({
+                "kind": kind, "name": name, "count": len(group), "total_ms": sum(durations),
+                "mean_ms": sum(durations) / len(group), "max_ms": max(durations),
+                "prompt_tokens": sum(span.get("prompt_tokens", 0) for span in group),
+                "completion_tokens": sum(span.get("completion_tokens", 0) for span in group),
+                "retries": sum(span.get("retries", 0) + max(span.get("attempt", 1) - 1, 0) for span in group),
+                "errors": sum(1 for span in group if "error" in span),
+            })
+        rows.sort(key=lambda row: (KINDS.index(row["kind"]), -row["total_ms"]))
+        return rows
+
+
+def print_summary(rows, file=None):
+    print(f"{'kind':<6} {'name':<40} {'count':>6} {'total ms':>11} {'mean ms':>10} {'max ms':>10} "
+          f"{'tok in':>8} {'tok out':>8} {'retries':>7} {'errors':>6}", file=file)
+    for row in rows:
+        print(f"{row['kind']:<6} {row['name'][:40]:<40} {row['count']:>6} {row['total_ms']:>11.1f} "
+              f"{row['mean_ms']:>10.1f} {row['max_ms']:>10.1f} {row['prompt_tokens']:>8} "
+              f"{row['completion_tokens']:>8} {row['retries']:>7} {row['errors']:>6}", file=file)
+
+
+def profile_main(run, argv=None) -> int:
+    """Run a crew's run() under a Tracer, then print the per-span summary."""
+    parser = argparse.ArgumentParser(description="Run the crew with tracing and print where the time went")
+    parser.add_argument("--trace", default=os.environ.get("CREW_TRACE_PATH", str(DEFAULT_TRACE_PATH)),
+                        help="JSONL file the spans are appended to")
+    args = parser.parse_args(argv)
+
+    tracer = Tracer(args.trace)
+    failed = False
+    with tracer:
+        try:
+            run()
+        except Exception as e:
+            failed = True
+            print(f"Crew run failed: {e}")
+    print()
+    print_summary(tracer.summary())
+    print(f"\nTrace {tracer.trace_id} appended to {args.trace}")
+    return 1 if failed else 0
@@ -1,8 +1,11 @@
-from crewai import Agent, Crew, Process, Task
+from crewai import Agent, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List
+from crew_common.config import compiled_configs
+from crew_common.dag import DagCrew
 
+@compiled_configs
 @CrewBase
 class Debate():
     """Debate crew"""
@@ -43,12 +46,14 @@ class Debate():
         )
 
     @crew
-    def crew(self) -> Crew:
+    def crew(self) -> DagCrew:
         """Creates the Debate crew"""
 
-        return Crew(
+        return DagCrew(
             agents=self.agents,
             tasks=self.tasks,
             process=Process.sequential,
+            # Tasks whose context is complete run in parallel, at most this many at once
+            max_concurrency=2,
             verbose=True,
         )
@@ -1,30 +1,23 @@
-```python
-from datetime import datetime
 import functools
+import time
 
-# Test implementation for get_share_price()
+from ledger import Ledger
+from prices import default_price_provider
+from snapshots import Checkpoints
+from valuation import Valuation
+
+# Test implementation for get_share_price(), served by the shared price provider
 def get_share_price(symbol):
-    if symbol == 'AAPL':
-        return 150.0
-    elif symbol == 'TSLA':
-        return 700.0
-    elif symbol == 'GOOGL':
-        return 2800.0
-    else:
-        raise ValueError(f"Unknown symbol: {symbol}")
-
-def get_share_symbol_price(symbol_price_dict, symbol):
-    if symbol in symbol_price_dict:
-        return symbol_price_dict[symbol]
-    else:
-        raise ValueError(f"Unknown symbol: {symbol}")
-
-# Define a wrapper to ensure share quantity is an integer
+    return default_price_provider.get_price(symbol)
+
+# Define a wrapper to ensure share quantity is a positive integer
 def ensure_integer_quantity(func):
     @functools.wraps(func)
     def wrapper(self, symbol, quantity):
         if not isinstance(quantity, int):
             raise ValueError("Quantity must be an integer")
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive")
         return func(self, symbol, quantity)
     return wrapper
 
@@ -48,54 +41,166 @@ def sufficient_shares(func):
     return wrapper
 
 class Account:
-    def __init__(self, user_name, user_email, initial_deposit=0.0):
+    def __init__(self, user_name, user_email, initial_deposit=0.0, price_provider=None, lot_method='fifo'):
         self.user_name = user_name
         self.user_email = user_email
+        self.price_provider = price_provider or default_price_provider
         self.balance = initial_deposit
-        self.holdings = {}
-        self.transactions = []
+        self.valuation = Valuation(lot_method)
+        # Holdings share the valuation's quantity map so they never drift apart
+        self.holdings = self.valuation.quantities
+        self.transactions = Ledger()
+        self.checkpoints = Checkpoints(initial_deposit)
         self.initial_deposit = initial_deposit
+        # Cash put in minus cash taken out, the baseline for profit/loss
+        self.net_contributions = initial_deposit
+        # Optional durable log that is told about every recorded transaction
+        self.journal = None
+        # Callbacks run with the account after every trade, cash movement or price tick
+        self.listeners = []
+
+    # Append to the ledger and checkpoint the history when due
+    def _record(self, type_name, amount, symbol=None, quantity=0):
+        index = self.transactions.append(type_name, amount, symbol, quantity)
+        self.checkpoints.update(self.transactions)
+        if self.journal is not None:
+            self.journal.append(type_name, amount, symbol, quantity, self.transactions.timestamps[index])
+            self.journal.commit()
+        self._notify()
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        self.listeners.remove(listener)
+
+    def _notify(self):
+        for listener in self.listeners:
+            listener(self)
+
+    # Move cash and holdings for an already validated transaction
+    def _settle(self, type_name, amount, symbol=None, quantity=0, price=None):
+        if type_name == 'deposit':
+            self.balance += amount
+            self.net_contributions += amount
+        elif type_name == 'withdraw':
+            self.balance -= amount
+            self.net_contributions -= amount
+        elif type_name == 'buy':
+            self.balance -= amount
+            self.valuation.on_buy(symbol, quantity, amount / quantity if price is None else price)
+        elif type_name == 'sell':
+            self.balance += amount
+            self.valuation.on_sell(symbol, quantity, amount / quantity if price is None else price)
+        else:
+            raise ValueError(f"Unknown transaction type: {type_name}")
+
+    # Re-apply a transaction exactly as it was recorded, without checks or price lookups
+    def restore_transaction(self, type_name, amount, symbol=None, quantity=0, timestamp_ns=None):
+        if type_name in ('buy', 'sell') and not quantity:
+            return  # zero-quantity trade logged before quantities were validated; it moved nothing
+        self._settle(type_name, amount, symbol, quantity)
+        self.transactions.append(type_name, amount, symbol, quantity, timestamp_ns)
+        self.checkpoints.update(self.transactions)
+
+    # Validate and settle a batch of orders in one pass, priced with one bulk lookup.
+    # Orders are tuples such as ('deposit', amount) or ('buy', symbol, quantity).
+    # With atomic=True nothing is applied unless every order is valid; otherwise
+    # invalid orders are skipped. Returns (ok, amount or error message) per order.
+    def apply_orders(self, orders, atomic=True):
+        orders = list(orders)
+        symbols = {order[1] for order in orders if order[0] in ('buy', 'sell')}
+        prices = self.price_provider.get_prices(symbols) if symbols else {}
+        balance = self.balance
+        held = {}
+        accepted = []
+        results = []
+        for order in orders:
+            action = order[0]
+            try:
+                if action == 'deposit' or action == 'withdraw':
+                    _, amount = order
+                    if action == 'deposit':
+                        if amount <= 0:
+                            raise ValueError("Deposit amount must be positive")
+                        balance += amount
+                    else:
+                        if amount <= 0:
+                            raise ValueError("Withdrawal amount must be positive")
+                        if amount > balance:
+                            raise ValueError("Insufficient balance")
+                        balance -= amount
+                    accepted.append((action, amount, None, 0, None))
+                elif action == 'buy' or action == 'sell':
+                    _, symbol, quantity = order
+                    if not isinstance(quantity, int):
+                        raise ValueError("Quantity must be an integer")
+                    if quantity <= 0:
+                        raise ValueError("Quantity must be positive")
+                    shares = held.get(symbol, self.holdings.get(symbol, 0))
+                    if action == 'sell' and shares < quantity:
+                        raise ValueError(f"Insufficient shares of {symbol} to sell {quantity} units")
+                    if symbol not in prices:
+                        raise ValueError(f"Unknown symbol: {symbol}")
+                    price = prices[symbol]
+                    amount = price * quantity
+                    if action == 'buy':
+                        if amount > balance:
+                            raise ValueError("Insufficient balance to buy shares")
+                        balance -= amount
+                        held[symbol] = shares + quantity
+                    else:
+                        balance += amount
+                        held[symbol] = shares - quantity
+                    accepted.append((action, amount, symbol, quantity, price))
+                else:
+                    raise ValueError(f"Unknown action: {action}")
+                results.append((True, amount))
+            except ValueError as e:
+                results.append((False, str(e)))
+
+        if atomic and len(accepted) < len(orders):
+            return [result if not result[0] else (False, "Not applied: batch rejected") for result in results]
+
+        timestamp_ns = time.time_ns()
+        for type_name, amount, symbol, quantity, price in accepted:
+            self._settle(type_name, amount, symbol, quantity, price)
+            index = self.transactions.append(type_name, amount, symbol, quantity, timestamp_ns)
+            if self.journal is not None:
+                self.journal.append(type_name, amount, symbol, quantity, self.transactions.timestamps[index])
+        self.checkpoints.update(self.transactions)
+        if accepted and self.journal is not None:
+            self.journal.commit()
+        if accepted:
+            self._notify()
+        return results
 
     # Deposit funds
-    @sufficient_balance
     def deposit(self, amount):
+        if amount <= 0:
+            raise ValueError("Deposit amount must be positive")
         self.balance += amount
-        self.transactions.append({
-            'type': 'deposit',
-            'amount': amount,
-            'timestamp': datetime.now()
-        })
+        self.net_contributions += amount
+        self._record('deposit', amount)
 
     # Withdraw funds
     @sufficient_balance
-    @sufficient_balance
     def withdraw(self, amount):
+        if amount <= 0:
+            raise ValueError("Withdrawal amount must be positive")
         self.balance -= amount
-        self.transactions.append({
-            'type': 'withdraw',
-            'amount': amount,
-            'timestamp': datetime.now()
-        })
+        self.net_contributions -= amount
+        self._record('withdraw', amount)
 
     # Buy shares
     @ensure_integer_quantity
-    @sufficient_balance
     def buy(self, symbol, quantity):
-        price = get_share_price(symbol)
+        price = self.price_provider.get_price(symbol)
         cost = price * quantity
         if cost <= self.balance:
             self.balance -= cost
-            if symbol in self.holdings:
-                self.holdings[symbol] += quantity
-            else:
-                self.holdings[symbol] = quantity
-            self.transactions.append({
-                'type': 'buy',
-                'symbol': symbol,
-                'quantity': quantity,
-                'amount': cost,
-                'timestamp': datetime.now()
-            })
+            self.valuation.on_buy(symbol, quantity, price)
+            self._record('buy', cost, symbol, quantity)
         else:
             raise ValueError("Insufficient balance to buy shares")
 
@@ -103,33 +208,94 @@ class Account:
     @ensure_integer_quantity
     @sufficient_shares
     def sell(self, symbol, quantity):
-        price = get_share_symbol_price(self.holdings, symbol)
+        price = self.price_provider.get_price(symbol)
         revenue = price * quantity
         self.balance += revenue
-        self.holdings[symbol] -= quantity
-        if self.holdings[symbol] == 0:
-            del self.holdings[symbol]
-        self.transactions.append({
-            'type': 'sell',
-            'symbol': symbol,
-            'quantity': quantity,
-            'amount': revenue,
-            'timestamp': datetime.now()
-        })
-
-    # Get portfolio value
+        self.valuation.on_sell(symbol, quantity, price)
+        self._record('sell', revenue, symbol, quantity)
+
+    # Apply a price tick; only the affected symbols are revalued
+    def update_price(self, symbol, price):
+        self.valuation.update_price(symbol, price)
+        self._notify()
+
+    def update_prices(self, prices):
+        self.valuation.update_prices(prices)
+        self._notify()
+
+    # Reprice every holding with one batched lookup
+    def refresh_prices(self):
+        self.update_prices(self.price_provider.get_prices(list(self.holdings)))
+
+    # Get cash balance
+    def get_balance(self):
+        return self.balance
+
+    # Get portfolio value (market value of holdings)
     def get_portfolio_value(self):
-        return sum(price * quantity for symbol, quantity in self.holdings.items() if symbol in self.holdings for price in [get_share_symbol_price(self.holdings, symbol) for symbol in self.holdings])
+        return self.valuation.market_value
 
-    # Get profit/loss
+    # Get cost basis of holdings
+    def get_cost_basis(self):
+        return self.valuation.cost_basis
+
+    # Get profit/loss: cash plus holdings against the net cash contributed
     def get_profit_loss(self):
-        return self.get_portfolio_value() - self.initial_deposit
+        return self.balance + self.valuation.market_value - self.net_contributions
+
+    # Get realized profit/loss from sells, for one symbol or all
+    def get_realized_profit_loss(self, symbol=None):
+        return self.valuation.realized(symbol)
+
+    # Get unrealized profit/loss of open lots, for one symbol or all
+    def get_unrealized_profit_loss(self, symbol=None):
+        return self.valuation.unrealized(symbol)
+
+    # Get portfolio value and profit/loss figures, all from the same state
+    def get_pnl(self):
+        return {
+            'portfolio_value': self.get_portfolio_value(),
+            'profit_loss': self.get_profit_loss(),
+            'realized': self.get_realized_profit_loss(),
+            'unrealized': self.get_unrealized_profit_loss(),
+        }
+
+    # Get open tax lots of a symbol as (quantity, unit_cost) tuples
+    def get_lots(self, symbol):
+        return self.valuation.lots.open_lots(symbol)
 
     # Get current holdings
     def get_holdings(self):
         return self.holdings
 
+    # Account state (balance, holdings, P&L) as of a datetime or epoch-ns timestamp
+    def as_of(self, when):
+        return self.checkpoints.as_of(self.transactions, when)
+
+    # Get holdings at a point in time
+    def get_holdings_at(self, when):
+        return self.as_of(when).holdings
+
+    # Get profit/loss at a point in time, valued at the last traded prices
+    def get_profit_loss_at(self, when):
+        return self.as_of(when).get_profit_loss()
+
     # Get transaction history
     def get_transaction_history(self):
-        return self.transactions
-```
\ No newline at end of file
+        return list(self.transactions)
+
+    # Stream transactions matching the filters without materializing the history
+    def iter_transactions(self, start=None, end=None, symbol=None, type_name=None):
+        return self.transactions.iter_records(start, end, symbol, type_name)
+
+    # Get one page of transactions and the cursor of the next page (None when done)
+    def get_transaction_page(self, cursor=0, page_size=100, start=None, end=None, symbol=None, type_name=None):
+        return self.transactions.page(cursor, page_size, start, end, symbol, type_name)
+
+    # Totals per transaction type, optionally within [start, end)
+    def get_totals_by_type(self, start=None, end=None):
+        return self.transactions.totals_by_type(start, end)
+
+    # Net quantity and traded amount per symbol, optionally within [start, end)
+    def get_totals_by_symbol(self, type_name=None, start=None, end=None):
+        return self.transactions.totals_by_symbol(type_name, start, end)
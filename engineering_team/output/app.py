@@ -1,185 +1,179 @@
-```python
-import gradio as gr
+import json
+import os
+import sys
+import threading
+import weakref
+
 from accounts import Account
-from typing import Dict
-
-# Test implementation for get_share_price()
-def get_share_price(symbol):
-    if symbol == 'AAPL':
-        return 150.0
-    elif symbol == 'TSLA':
-        return 700.0
-    elif symbol == 'GOOGL':
-        return 2800.0
-    else:
-        raise ValueError(f"Unknown symbol: {symbol}")
+from concurrency import ConcurrencyLimiter, ServerBusy
+from dashboard import FIGURES, TABLE_COLUMNS, WINDOW_ROWS, stream_deltas, table_window, tail_window
+
+# Handlers running at once, and requests allowed to wait behind them
+DEFAULT_CONCURRENCY = int(os.environ.get('APP_CONCURRENCY', 8))
+DEFAULT_MAX_QUEUE = int(os.environ.get('APP_MAX_QUEUE', 256))
 
-def get_share_symbol_price(symbol_price_dict, symbol):
-    if symbol in symbol_price_dict:
-        return symbol_price_dict[symbol]
-    else:
-        raise ValueError(f"Unknown symbol: {symbol}")
-
-# Define a wrapper to ensure share quantity is an integer
-def ensure_integer_quantity(func):
-    @gr.wraps(func)
-    def wrapper(self, symbol, quantity):
-        if not isinstance(quantity, int):
-            raise ValueError("Quantity must be an integer")
-        return func(self, symbol, quantity)
-    return wrapper
-
-# Define a wrapper to check for insufficient balance
-def sufficient_balance(func):
-    @gr.wraps(func)
-    def wrapper(self, amount):
-        if amount > self.balance:
-            raise ValueError("Insufficient balance")
-        return func(self, amount)
-    return wrapper
-
-# Define a wrapper to check for insufficient shares
-def sufficient_shares(func):
-    @gr.wraps(func)
-    def wrapper(self, symbol, quantity):
-        if symbol in self.holdings and self.holdings[symbol] >= quantity:
-            return func(self, symbol, quantity)
-        elif symbol not in self.holdings or self.holdings[symbol] < quantity:
-            raise ValueError(f"Insufficient shares of {symbol} to sell {quantity} units")
-    return wrapper
 
 class AccountUI:
-    def __init__(self):
-        # Initialize an instance of the Account class
-        self.account = Account('John Doe', 'john.doe@email.com')
-        
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, max_queue=DEFAULT_MAX_QUEUE):
+        # Gradio is only needed for the UI; the headless API (server.py) never imports it
+        import gradio as gr
+        self._gr = gr
+
+        # Every browser session gets its own Account, created when the page loads
+        self.limiter = ConcurrencyLimiter(concurrency, max_queue)
+        self._session_locks = weakref.WeakKeyDictionary()
+        self._session_locks_guard = threading.Lock()
+
         # Create a Gradio app
-        self.app = gr.Blocks()
-        self.user_input_area = gr.Textbox(label="Account details and transactions")
-        self.result_area = gr.Textbox(label="Result")
-
-        # Add blocks for deposit
-        self.deposit_area = gr.Textbox(label='Deposit amount')
-        self.deposit_button = gr.Button('Deposit')
-        self.deposit_button.click(
-            self.deposit_transaction, 
-            inputs=[self.deposit_area], 
-            outputs=self.result_area)
-
-        # Add blocks for withdraw
-        self.withdraw_area = gr.Textbox(label='Withdraw amount')
-        self.withdraw_button = gr.Button('Withdraw')
-        self.withdraw_button.click(
-            self.withdraw_transaction, 
-            inputs=[self.withdraw_area], 
-            outputs=self.result_area)
-
-        # Add blocks for buy shares
-        self.buy_area = gr.Textbox(label='Number of shares to buy')
-        self.buy_symbol_area = gr.Textbox(label='Symbol of shares to buy')
-        self.buy_button = gr.Button('Buy shares')
-        self.buy_button.click(
-            self.buy_shares, 
-            inputs=[self.buy_area, self.buy_symbol_area], 
-            outputs=self.result_area)
-
-        # Add blocks for sell shares
-        self.sell_area = gr.Textbox(label='Number of shares to sell')
-        self.sell_symbol_area = gr.Textbox(label='Symbol of shares to sell')
-        self.sell_button = gr.Button('Sell shares')
-        self.sell_button.click(
-            self.sell_shares, 
-            inputs=[self.sell_area, self.sell_symbol_area], 
-            outputs=self.result_area)
-
-        # Add blocks for get portfolio value
-        self.get_portfolio_button = gr.Button('Get portfolio value')
-        self.get_portfolio_button.click(
-            self.get_portfolio_value, 
-            outputs=self.result_area)
-
-        # Add blocks for get profit/loss
-        self.get_profit_button = gr.Button('Get profit/loss')
-        self.get_profit_button.click(
-            self.get_profit_loss, 
-            outputs=self.result_area)
-
-        # Add blocks for get current holdings
-        self.get_holdings_button = gr.Button('Get current holdings')
-        self.get_holdings_button.click(
-            self.get_current_holdings, 
-            outputs=self.result_area)
-
-        # Add blocks for get transaction history
-        self.get_transaction_button = gr.Button('Get transaction history')
-        self.get_transaction_button.click(
-            self.get_transaction_history, 
-            outputs=self.result_area)
-
-        # Add blocks to the app
-        self.app.add(self.user_input_area, 
-                     self.deposit_area, 
-                     self.withdraw_area, 
-                     self.buy_area, 
-                     self.buy_symbol_area, 
-                     self.sell_area, 
-                     self.sell_symbol_area, 
-                     self.deposit_button,
-                     self.withdraw_button,
-                     self.buy_button, 
-                     self.sell_button,
-                     self.get_portfolio_button, 
-                     self.get_profit_button, 
-                     self.get_holdings_button, 
-                     self.get_transaction_button,
-                     self.result_area)
-
-
-    def deposit_transaction(self, deposit_amount):
+        with gr.Blocks() as self.app:
+            self.session_account = gr.State(None)
+            self.user_input_area = gr.Textbox(label="Account details and transactions")
+
+            # Add blocks for deposit
+            self.deposit_area = gr.Textbox(label='Deposit amount')
+            self.deposit_button = gr.Button('Deposit')
+
+            # Add blocks for withdraw
+            self.withdraw_area = gr.Textbox(label='Withdraw amount')
+            self.withdraw_button = gr.Button('Withdraw')
+
+            # Add blocks for buy shares
+            self.buy_area = gr.Textbox(label='Number of shares to buy')
+            self.buy_symbol_area = gr.Textbox(label='Symbol of shares to buy')
+            self.buy_button = gr.Button('Buy shares')
+
+            # Add blocks for sell shares
+            self.sell_area = gr.Textbox(label='Number of shares to sell')
+            self.sell_symbol_area = gr.Textbox(label='Symbol of shares to sell')
+            self.sell_button = gr.Button('Sell shares')
+
+            self.metrics_button = gr.Button('Server metrics')
+            self.result_area = gr.Textbox(label="Result")
+
+            # Live dashboard, pushed to the browser whenever a figure changes
+            self.balance_area = gr.Number(label='Cash balance')
+            self.portfolio_area = gr.Number(label='Portfolio value')
+            self.profit_area = gr.Number(label='Profit/loss')
+            self.realized_area = gr.Number(label='Realized P&L')
+            self.unrealized_area = gr.Number(label='Unrealized P&L')
+            self.holdings_area = gr.JSON(label='Current holdings')
+            self.transaction_count_area = gr.Number(label='Transactions')
+            self.figure_areas = [self.balance_area, self.portfolio_area, self.profit_area, self.realized_area,
+                                 self.unrealized_area, self.holdings_area, self.transaction_count_area]
+
+            # Transaction table shows one window of rows; it follows the latest rows as trades arrive
+            self.history_offset_area = gr.Number(label='First transaction row', value=0, precision=0)
+            self.history_table = gr.Dataframe(headers=TABLE_COLUMNS, label=f'Transactions ({WINDOW_ROWS} rows)')
+
+            session = [self.session_account]
+            outputs = [self.result_area]
+            self.deposit_button.click(
+                self._handler(self.deposit_transaction),
+                inputs=[self.deposit_area] + session,
+                outputs=outputs)
+            self.withdraw_button.click(
+                self._handler(self.withdraw_transaction),
+                inputs=[self.withdraw_area] + session,
+                outputs=outputs)
+            self.buy_button.click(
+                self._handler(self.buy_shares),
+                inputs=[self.buy_area, self.buy_symbol_area] + session,
+                outputs=outputs)
+            self.sell_button.click(
+                self._handler(self.sell_shares),
+                inputs=[self.sell_area, self.sell_symbol_area] + session,
+                outputs=outputs)
+            self.metrics_button.click(self.get_server_metrics, outputs=self.result_area)
+            self.history_offset_area.change(
+                self._handler(self.get_history_window, loading=gr.update()),
+                inputs=[self.history_offset_area] + session,
+                outputs=self.history_table)
+
+            # Create the session's account on page load, then keep its dashboard stream open.
+            # The stream only awaits changes, so it does not count against the concurrency limit.
+            self.app.load(self.start_session, inputs=session, outputs=session).then(
+                self.stream_dashboard,
+                inputs=session,
+                outputs=self.figure_areas + [self.history_table],
+                concurrency_limit=None)
+
+        # Gradio's own queue bounds the event handlers the same way
+        self.app.queue(default_concurrency_limit=concurrency, max_size=max_queue)
+
+    def new_account(self):
+        return Account('John Doe', 'john.doe@email.com')
+
+    def start_session(self, account):
+        return account if account is not None else self.new_account()
+
+    # Push changed figures, and the latest table rows when transactions arrive
+    async def stream_dashboard(self, account):
+        gr = self._gr
+        async for delta in stream_deltas(account):
+            updates = [gr.update(value=delta[name]) if name in delta else gr.update() for name in FIGURES]
+            table = gr.update(value=tail_window(account)) if 'transactions' in delta else gr.update()
+            yield updates + [table]
+
+    # Serialize calls within one session; different sessions run in parallel
+    def _locked(self, method, account, *inputs):
+        with self._session_locks_guard:
+            lock = self._session_locks.setdefault(account, threading.Lock())
+        with lock:
+            return method(account, *inputs)
+
+    # Wrap a sync handler as an async Gradio handler bound to the session's account.
+    # Only start_session creates the account; a click that arrives before the page
+    # has loaded gets `loading` back instead of creating a second one.
+    def _handler(self, method, loading="Error: the page is still loading, please try again"):
+        async def handler(*args):
+            *inputs, account = args
+            if account is None:
+                return loading
+            try:
+                return await self.limiter.run(self._locked, method, account, *inputs)
+            except ServerBusy as e:
+                return f"Error: {e}"
+        return handler
+
+    def get_server_metrics(self):
+        return f"Server metrics: {json.dumps(self.limiter.metrics(), indent=2)}"
+
+    def deposit_transaction(self, account, deposit_amount):
         try:
             amount = float(deposit_amount)
-            self.account.deposit(amount)
+            account.deposit(amount)
             return f"Deposited {amount} successfully"
         except ValueError as e:
             return f"Error: {str(e)}"
 
-    def withdraw_transaction(self, withdraw_amount):
+    def withdraw_transaction(self, account, withdraw_amount):
         try:
             amount = float(withdraw_amount)
-            self.account.withdraw(amount)
+            account.withdraw(amount)
             return f"Withdrew {amount} successfully"
         except ValueError as e:
             return f"Error: {str(e)}"
 
-    def buy_shares(self, number_of_shares, symbol):
+    def buy_shares(self, account, number_of_shares, symbol):
         try:
             shares = int(number_of_shares)
             symbol = symbol
-            self.account.buy(symbol, shares)
+            account.buy(symbol, shares)
             return f"Bought {shares} {symbol} successfully"
         except ValueError as e:
             return f"Error: {str(e)}"
 
-    def sell_shares(self, number_of_shares, symbol):
+    def sell_shares(self, account, number_of_shares, symbol):
         try:
             shares = int(number_of_shares)
             symbol = symbol
-            self.account.sell(symbol, shares)
+            account.sell(symbol, shares)
             return f"Sold {shares} {symbol} successfully"
         except ValueError as e:
             return f"Error: {str(e)}"
 
-    def get_portfolio_value(self):
-        return f"Total portfolio value: ${self.account.get_portfolio_value():.2f}"
-
-    def get_profit_loss(self):
-        return f"Profit/loss: ${self.account.get_profit_loss():.2f}"
-
-    def get_current_holdings(self):
-        return f"Current holdings: {str(self.account.get_holdings())}"
-
-    def get_transaction_history(self):
-        return f"Transaction history: {str(self.account.get_transaction_history())}"
+    def get_history_window(self, account, offset):
+        return table_window(account, int(offset or 0))
 
     def launch_app(self):
         demo = self.app.launch()
@@ -187,6 +181,9 @@ class AccountUI:
         return demo
 
 if __name__ == "__main__":
-    demo = AccountUI()
-    demo.launch_app()
-```
\ No newline at end of file
+    if '--headless' in sys.argv:
+        from server import serve
+        serve()
+    else:
+        demo = AccountUI()
+        demo.launch_app()
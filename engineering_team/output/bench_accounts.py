@@ -0,0 +1,253 @@
+"""Benchmark and load test for the accounts module.
+
+Runs seeded synthetic order streams against Account and reports ops/sec,
+p50/p99 latency and peak RSS per operation. Each (workload, size) case runs
+in a fresh process so peak RSS is not inherited from earlier cases. Peak
+RSS is read once the order stream and portfolio reads are done, before the
+history reads. History is read a page at a time, plus one streaming scan
+with iter_transactions(); it is never materialized as a list of dicts, so
+the figures measure the columnar ledger and 10^7-order cases stay feasible.
+
+    python bench_accounts.py --sizes 1000 100000 --out results.json
+    python bench_accounts.py --baseline baseline.json --tolerance 0.2 --repeat 5
+
+Each case runs --repeat times and every figure is the median over the
+repeats. With --baseline the run exits non-zero if any operation got
+slower or hungrier than the baseline by more than the tolerance. p99 is
+only compared for operations timed at least MIN_P99_SAMPLES times; with
+fewer samples it is a handful of outliers rather than a percentile. A p99
+increase below P99_NOISE_US is scheduler noise and is not reported.
+"""
+import argparse
+from array import array
+import json
+import multiprocessing
+import platform
+import random
+import resource
+import statistics
+import sys
+import time
+
+from accounts import Account
+from prices import CachedPriceProvider, StaticPriceFeed
+
+# Order mix per workload: weights for deposit, withdraw, buy, sell and the symbol universe size
+WORKLOADS = {
+    'deposit_heavy': {'mix': (0.70, 0.10, 0.15, 0.05), 'symbols': 3},
+    'trade_heavy': {'mix': (0.05, 0.00, 0.55, 0.40), 'symbols': 3},
+    'many_symbols': {'mix': (0.05, 0.00, 0.55, 0.40), 'symbols': 1000},
+}
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+# Read-side calls measured after the order stream has been applied
+PORTFOLIO_CALLS = 1000
+PAGE_CALLS = 1000
+PAGE_SIZE = 100
+DEFAULT_REPEAT = 5
+# Fewest timings per operation for its p99 to be gated by compare()
+MIN_P99_SAMPLES = 1000
+# Smallest p99 increase in microseconds that counts as a regression
+P99_NOISE_US = 5.0
+
+
+def symbol_universe(count):
+    return [f'SYM{i:04d}' for i in range(count)]
+
+
+# Yield a reproducible stream of (action, *args) orders that the account can always satisfy
+def generate_orders(workload, count, seed=0):
+    spec = WORKLOADS[workload]
+    rng = random.Random(seed)
+    symbols = symbol_universe(spec['symbols'])
+    actions = ('deposit', 'withdraw', 'buy', 'sell')
+    held = {}
+    for action in rng.choices(actions, weights=spec['mix'], k=count):
+        if action == 'deposit':
+            yield ('deposit', float(rng.randint(10, 1000)))
+        elif action == 'withdraw':
+            yield ('withdraw', float(rng.randint(1, 10)))
+        else:
+            symbol = rng.choice(symbols)
+            if action == 'sell' and held.get(symbol):
+                held[symbol] -= 1
+                yield ('sell', symbol, 1)
+            else:
+                quantity = rng.randint(1, 5)
+                held[symbol] = held.get(symbol, 0) + quantity
+                yield ('buy', symbol, quantity)
+
+
+def _percentile(sorted_ns, fraction):
+    if not sorted_ns:
+        return 0.0
+    return sorted_ns[min(len(sorted_ns) - 1, int(fraction * len(sorted_ns)))] / 1000
+
+
+def _summarize(latencies_ns):
+    ordered = sorted(latencies_ns)
+    total = sum(ordered)
+    return {
+        'count': len(ordered),
+        'ops_per_sec': len(ordered) / (total / 1e9) if total else 0.0,
+        'p50_us': _percentile(ordered, 0.50),
+        'p99_us': _percentile(ordered, 0.99),
+    }
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+# Run one workload at one size and return its measurements
+def run_case(workload, size, seed=0):
+    symbols = symbol_universe(WORKLOADS[workload]['symbols'])
+    feed = StaticPriceFeed({symbol: 10.0 + i for i, symbol in enumerate(symbols)})
+    account = Account('bench', 'bench@example.com', 1e15, CachedPriceProvider(feed, ttl=3600.0))
+    latencies = {action: array('q') for action in ('deposit', 'withdraw', 'buy', 'sell')}
+    clock = time.perf_counter_ns
+    errors = 0
+    start = time.perf_counter()
+    for action, *args in generate_orders(workload, size, seed):
+        method = getattr(account, action)
+        t0 = clock()
+        try:
+            method(*args)
+        except ValueError:
+            errors += 1
+        latencies[action].append(clock() - t0)
+    stream_seconds = time.perf_counter() - start
+
+    portfolio = array('q')
+    for _ in range(PORTFOLIO_CALLS):
+        t0 = clock()
+        account.get_portfolio_value()
+        portfolio.append(clock() - t0)
+    peak_rss_mb = _peak_rss_mb()
+
+    rng = random.Random(seed)
+    entries = len(account.transactions)
+    pages = array('q')
+    for _ in range(PAGE_CALLS):
+        cursor = rng.randrange(entries)
+        t0 = clock()
+        account.get_transaction_page(cursor, PAGE_SIZE)
+        pages.append(clock() - t0)
+    t0 = clock()
+    for _ in account.iter_transactions():
+        pass
+    scan = array('q', [clock() - t0])
+
+    ops = {action: _summarize(values) for action, values in latencies.items() if values}
+    ops['get_portfolio_value'] = _summarize(portfolio)
+    ops['get_transaction_page'] = _summarize(pages)
+    ops['iter_transactions'] = _summarize(scan)
+    return {
+        'workload': workload,
+        'size': size,
+        'seed': seed,
+        'errors': errors,
+        'stream_seconds': stream_seconds,
+        'peak_rss_mb': peak_rss_mb,
+        'ops': ops,
+    }
+
+
+def _run_case_args(args):
+    return run_case(*args)
+
+
+# Median of every measurement over repeated runs of one case
+def _median_case(runs):
+    case = dict(runs[0])
+    for key in ('errors', 'stream_seconds', 'peak_rss_mb'):
+        case[key] = statistics.median(run[key] for run in runs)
+    case['ops'] = {op: {stat: statistics.median(run['ops'][op][stat] for run in runs) for stat in stats}
+                   for op, stats in runs[0]['ops'].items()}
+    case['repeat'] = len(runs)
+    return case
+
+
+# Run every case repeat times, each run in its own child process
+def run_suite(workloads, sizes, seed=0, repeat=DEFAULT_REPEAT):
+    ctx = multiprocessing.get_context('spawn')
+    cases = []
+    for workload in workloads:
+        for size in sizes:
+            runs = []
+            for _ in range(repeat):
+                with ctx.Pool(processes=1) as pool:
+                    runs.append(pool.apply(_run_case_args, ((workload, size, seed),)))
+            cases.append(_median_case(runs))
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'repeat': repeat,
+        'cases': cases,
+    }
+
+
+# List regressions of results against a baseline; tolerance is a fraction (0.2 = 20%)
+def compare(results, baseline, tolerance=0.2):
+    previous = {(case['workload'], case['size']): case for case in baseline['cases']}
+    regressions = []
+    for case in results['cases']:
+        key = (case['workload'], case['size'])
+        base = previous.get(key)
+        if base is None:
+            continue
+        if case['peak_rss_mb'] > base['peak_rss_mb'] * (1 + tolerance):
+            regressions.append(f"{key[0]}/{key[1]} peak_rss_mb {base['peak_rss_mb']:.1f} -> {case['peak_rss_mb']:.1f}")
+        for op, stats in case['ops'].items():
+            base_stats = base['ops'].get(op)
+            if base_stats is None:
+                continue
+            if stats['ops_per_sec'] < base_stats['ops_per_sec'] * (1 - tolerance):
+                regressions.append(f"{key[0]}/{key[1]} {op} ops_per_sec "
+                                   f"{base_stats['ops_per_sec']:,.0f} -> {stats['ops_per_sec']:,.0f}")
+            if min(stats['count'], base_stats['count']) < MIN_P99_SAMPLES:
+                continue
+            if stats['p99_us'] > max(base_stats['p99_us'] * (1 + tolerance), base_stats['p99_us'] + P99_NOISE_US):
+                regressions.append(f"{key[0]}/{key[1]} {op} p99_us "
+                                   f"{base_stats['p99_us']:.1f} -> {stats['p99_us']:.1f}")
+    return regressions
+
+
+def print_table(results):
+    print(f"{'workload':<14} {'size':>10} {'op':<24} {'ops/s':>14} {'p50 us':>10} {'p99 us':>10} {'rss MB':>8}")
+    for case in results['cases']:
+        for op, stats in case['ops'].items():
+            print(f"{case['workload']:<14} {case['size']:>10} {op:<24} {stats['ops_per_sec']:>14,.0f} "
+                  f"{stats['p50_us']:>10.2f} {stats['p99_us']:>10.2f} {case['peak_rss_mb']:>8.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workloads', nargs='+', choices=sorted(WORKLOADS), default=sorted(WORKLOADS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES),
+                        help='transactions per case, e.g. 1000 ... 10000000')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help='write results JSON here')
+    parser.add_argument('--baseline', help='baseline results JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='runs per case; figures are medians')
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.workloads, args.sizes, args.seed, args.repeat)
+    print_table(results)
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+
+from accounts import Account
+from prices import CachedPriceProvider, default_price_provider
+
+DEFAULT_SHARDS = 64
+# ProcessAccountBook should reach this fraction of linear speedup, up to the core count
+SCALING_TARGET = 0.7
+
+# Account methods an order may invoke
+ACTIONS = frozenset({
+    'deposit', 'withdraw', 'buy', 'sell',
+    'get_balance', 'get_portfolio_value', 'get_profit_loss', 'get_pnl', 'get_holdings', 'refresh_prices',
+    'get_realized_profit_loss', 'get_unrealized_profit_loss', 'get_lots',
+    'apply_orders', 'get_transaction_page',
+})
+
+
+class _Shard:
+    __slots__ = ('lock', 'accounts', 'price_provider')
+
+    def __init__(self, price_provider):
+        self.lock = threading.Lock()
+        self.accounts = {}
+        self.price_provider = price_provider
+
+
+# Deep copy of an account that shares no mutable state with the live one
+def _copy_account(account):
+    memo = {id(account.price_provider): account.price_provider, id(account.journal): None,
+            id(account.listeners): []}
+    return copy.deepcopy(account, memo)
+
+
+class AccountBook:
+    """Many accounts, sharded by account id, each shard behind its own lock.
+
+    Orders for accounts on different shards never contend on a lock, and
+    unless a price_provider is given each shard prices through its own cache
+    in front of the default feed, so shards don't contend on a shared cache
+    lock either. Threads still share the GIL, though: on a GIL build the
+    throughput stays flat as threads are added (see benchmark()). For
+    throughput that grows with cores, use ProcessAccountBook.
+    """
+
+    def __init__(self, shards=DEFAULT_SHARDS, price_provider=None):
+        self.price_provider = price_provider
+        self._shards = [_Shard(price_provider or CachedPriceProvider(default_price_provider.upstream))
+                        for _ in range(shards)]
+
+    def _shard(self, account_id):
+        return self._shards[hash(account_id) % len(self._shards)]
+
+    # Open a new account under account_id
+    def open_account(self, account_id, user_name, user_email, initial_deposit=0.0, lot_method='fifo'):
+        shard = self._shard(account_id)
+        with shard.lock:
+            if account_id in shard.accounts:
+                raise ValueError(f"Account {account_id} already exists")
+            account = Account(user_name, user_email, initial_deposit, shard.price_provider, lot_method)
+            shard.accounts[account_id] = account
+            return account
+
+    # Copy of the account taken under its shard lock; changes to it don't reach the book
+    def get_account(self, account_id):
+        shard = self._shard(account_id)
+        with shard.lock:
+            if account_id not in shard.accounts:
+                raise ValueError(f"Unknown account: {account_id}")
+            return _copy_account(shard.accounts[account_id])
+
+    def account_ids(self):
+        ids = []
+        for shard in self._shards:
+            with shard.lock:
+                ids.extend(shard.accounts)
+        return ids
+
+    def __len__(self):
+        count = 0
+        for shard in self._shards:
+            with shard.lock:
+                count += len(shard.accounts)
+        return count
+
+    # Run one Account method for account_id under its shard lock; dict results are copied
+    def execute(self, account_id, action, *args):
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+        shard = self._shard(account_id)
+        with shard.lock:
+            account = shard.accounts.get(account_id)
+            if account is None:
+                raise ValueError(f"Unknown account: {account_id}")
+            result = getattr(account, action)(*args)
+            return dict(result) if isinstance(result, dict) else result
+
+    def deposit(self, account_id, amount):
+        return self.execute(account_id, 'deposit', amount)
+
+    def withdraw(self, account_id, amount):
+        return self.execute(account_id, 'withdraw', amount)
+
+    def buy(self, account_id, symbol, quantity):
+        return self.execute(account_id, 'buy', symbol, quantity)
+
+    def sell(self, account_id, symbol, quantity):
+        return self.execute(account_id, 'sell', symbol, quantity)
+
+    # Apply a stream of (account_id, action, *args) orders; returns (ok, result or error) per order
+    def process(self, orders):
+        results = []
+        for account_id, action, *args in orders:
+            try:
+                results.append((True, self.execute(account_id, action, *args)))
+            except ValueError as e:
+                results.append((False, str(e)))
+        return results
+
+    # Apply several order streams concurrently, one worker thread per stream
+    def run_streams(self, streams, max_workers=None):
+        streams = list(streams)
+        with ThreadPoolExecutor(max_workers=max_workers or len(streams) or 1) as pool:
+            return list(pool.map(self.process, streams))
+
+
+# Serve one worker's share of a ProcessAccountBook until told to stop
+def _serve(conn, shards):
+    book = AccountBook(shards)
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        method, args = message
+        try:
+            result = getattr(book, method)(*args)
+            if method == 'open_account':
+                result = None  # the live account stays in the worker
+            elif isinstance(result, Account):
+                result.price_provider = None  # providers hold locks; the parent attaches its own
+            conn.send((True, result))
+        except Exception as e:
+            conn.send((False, e))
+    conn.close()
+
+
+class ProcessAccountBook:
+    """AccountBook partitioned across worker processes.
+
+    Each worker process owns the accounts whose id hashes to it, in an
+    AccountBook of its own. process() splits a batch of orders per worker and
+    all workers apply their part at once, so throughput grows with the number
+    of cores instead of being capped by the GIL. Ids are routed in the parent
+    process, so any picklable, hashable id works. Results and errors come back
+    pickled, so they are always copies. Workers price through their own
+    caches, and calls from several threads are serialized in the parent.
+    If a worker dies, the book is marked broken and every later call raises.
+    """
+
+    def __init__(self, processes=None, shards=DEFAULT_SHARDS):
+        self._lock = threading.Lock()
+        self._broken = False
+        self._conns, self._procs = [], []
+        for _ in range(processes or os.cpu_count() or 1):
+            parent, child = multiprocessing.Pipe()
+            proc = multiprocessing.Process(target=_serve, args=(child, shards), daemon=True)
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+
+    def _worker(self, account_id):
+        return hash(account_id) % len(self._conns)
+
+    # Send one call to each (worker, method, args) and return the results in order. A reply
+    # is read for every message that went out, even when a later send fails, so no stale
+    # reply is left on a pipe to be taken as the answer to the next call.
+    def _call_many(self, calls):
+        with self._lock:
+            if self._broken:
+                raise RuntimeError("ProcessAccountBook is broken: a worker process died")
+            sent, error = [], None
+            for worker, method, args in calls:
+                try:
+                    self._conns[worker].send((method, args))
+                except Exception as e:  # an unpicklable argument, or a dead worker
+                    error = e
+                    break
+                sent.append(worker)
+            replies = []
+            for worker in sent:
+                try:
+                    replies.append(self._conns[worker].recv())
+                except (EOFError, OSError) as e:
+                    error = error or e
+            if isinstance(error, (EOFError, OSError)):
+                self._broken = True
+                raise RuntimeError("ProcessAccountBook is broken: a worker process died") from error
+            if error is not None:
+                raise error
+        for ok, result in replies:
+            if not ok:
+                raise result
+        return [result for _, result in replies]
+
+    def _call(self, account_id, method, *args):
+        return self._call_many([(self._worker(account_id), method, (account_id, *args))])[0]
+
+    def open_account(self, account_id, user_name, user_email, initial_deposit=0.0, lot_method='fifo'):
+        self._call(account_id, 'open_account', user_name, user_email, initial_deposit, lot_method)
+
+    # Copy of the account, priced by the default provider of this process
+    def get_account(self, account_id):
+        account = self._call(account_id, 'get_account')
+        account.price_provider = default_price_provider
+        return account
+
+    def account_ids(self):
+        return [account_id for ids in self._call_many([(worker, 'account_ids', ())
+                                                       for worker in range(len(self._conns))])
+                for account_id in ids]
+
+    def __len__(self):
+        return len(self.account_ids())
+
+    def execute(self, account_id, action, *args):
+        return self._call(account_id, 'execute', action, *args)
+
+    def deposit(self, account_id, amount):
+        return self.execute(account_id, 'deposit', amount)
+
+    def withdraw(self, account_id, amount):
+        return self.execute(account_id, 'withdraw', amount)
+
+    def buy(self, account_id, symbol, quantity):
+        return self.execute(account_id, 'buy', symbol, quantity)
+
+    def sell(self, account_id, symbol, quantity):
+        return self.execute(account_id, 'sell', symbol, quantity)
+
+    # Apply (account_id, action, *args) orders, every worker its share at once; (ok, result or error) per order
+    def process(self, orders):
+        batches = [[] for _ in self._conns]
+        positions = [[] for _ in self._conns]
+        for position, order in enumerate(orders):
+            worker = self._worker(order[0])
+            batches[worker].append(order)
+            positions[worker].append(position)
+        busy = [worker for worker, batch in enumerate(batches) if batch]
+        results = [None] * sum(len(batch) for batch in batches)
+        for worker, batch_results in zip(busy, self._call_many([(worker, 'process', (batches[worker],))
+                                                                 for worker in busy])):
+            for position, result in zip(positions[worker], batch_results):
+                results[position] = result
+        return results
+
+    # Same shape as AccountBook.run_streams; each stream is spread over all workers
+    def run_streams(self, streams, max_workers=None):
+        return [self.process(stream) for stream in streams]
+
+    def close(self):
+        with self._lock:
+            for conn, proc in zip(self._conns, self._procs):
+                try:
+                    conn.send(None)
+                except OSError:
+                    pass
+                conn.close()
+                proc.join(timeout=5)
+            self._conns, self._procs = [], []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Generate a reproducible order stream over the given account ids
+def generate_orders(account_ids, count, seed=0):
+    rng = random.Random(seed)
+    symbols = ('AAPL', 'TSLA', 'GOOGL')
+    orders = []
+    for _ in range(count):
+        account_id = rng.choice(account_ids)
+        r = rng.random()
+        if r < 0.2:
+            orders.append((account_id, 'deposit', 100.0))
+        elif r < 0.7:
+            orders.append((account_id, 'buy', rng.choice(symbols), rng.randint(1, 3)))
+        else:
+            orders.append((account_id, 'sell', rng.choice(symbols), 1))
+    return orders
+
+
+# Measure orders/sec as workers are added: threads over one AccountBook, or
+# worker processes of a ProcessAccountBook. Each worker count gets
+# orders_per_worker orders per worker. efficiency is the speedup over one
+# worker divided by the speedup possible on this machine, min(workers, cores);
+# in process mode it should stay at or above SCALING_TARGET.
+def benchmark(worker_counts=(1, 2, 4, 8), accounts=1000, orders_per_worker=20_000, seed=0, mode='threads'):
+    cores = os.cpu_count() or 1
+    ids = list(range(accounts))
+    results = []
+    for workers in worker_counts:
+        streams = [generate_orders(ids, orders_per_worker, seed + n) for n in range(workers)]
+        if mode == 'processes':
+            book = ProcessAccountBook(workers)
+            run = lambda: book.process([order for stream in streams for order in stream])
+        else:
+            book = AccountBook()
+            run = lambda: book.run_streams(streams)
+        try:
+            for account_id in ids:
+                book.open_account(account_id, f'user{account_id}', f'user{account_id}@example.com', 1e9)
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+        finally:
+            if mode == 'processes':
+                book.close()
+        results.append({'workers': workers, 'orders': workers * orders_per_worker,
+                        'seconds': elapsed, 'orders_per_sec': workers * orders_per_worker / elapsed})
+    base = results[0]['orders_per_sec']
+    for row in results:
+        row['speedup'] = row['orders_per_sec'] / base
+        row['efficiency'] = row['speedup'] / min(row['workers'], cores)
+    return results
+
+
+if __name__ == "__main__":
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"GIL enabled: {gil}, cores: {os.cpu_count()}, process scaling target: {SCALING_TARGET:.0%} efficiency")
+    below = 0
+    for mode in ('threads', 'processes'):
+        print(f"\n{mode}\n{'workers':>8} {'orders/s':>12} {'speedup':>8} {'efficiency':>11}")
+        for row in benchmark(mode=mode):
+            missed = mode == 'processes' and row['efficiency'] < SCALING_TARGET
+            below += missed
+            print(f"{row['workers']:>8} {row['orders_per_sec']:>12,.0f} {row['speedup']:>8.2f} "
+                  f"{row['efficiency']:>10.0%}{'  below target' if missed else ''}")
+    sys.exit(1 if below else 0)
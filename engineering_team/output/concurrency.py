@@ -0,0 +1,69 @@
+import asyncio
+from collections import deque
+import time
+
+# Wait times kept for percentile metrics
+WAIT_SAMPLES = 1000
+
+
+class ServerBusy(Exception):
+    """Raised when the request queue is full."""
+
+
+class ConcurrencyLimiter:
+    """Bound concurrent work and queue the rest, with backpressure metrics.
+
+    At most `concurrency` calls run at once; up to `max_queue` more wait their
+    turn and anything beyond that is rejected with ServerBusy. Work runs in a
+    thread so a slow call never blocks the event loop for other sessions.
+    """
+
+    def __init__(self, concurrency=8, max_queue=256):
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self._semaphore = None
+        self.in_flight = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self._waits = deque(maxlen=WAIT_SAMPLES)
+
+    async def run(self, func, *args):
+        if self._semaphore is None:
+            # Created lazily so it binds to the loop that serves requests
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        if self.queued >= self.max_queue:
+            self.rejected += 1
+            raise ServerBusy("Server busy, please retry")
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        enqueued = time.perf_counter()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+        self._waits.append(time.perf_counter() - enqueued)
+        self.in_flight += 1
+        try:
+            return await asyncio.to_thread(func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self._semaphore.release()
+
+    def metrics(self):
+        waits = sorted(self._waits)
+        def pct(fraction):
+            return waits[min(len(waits) - 1, int(fraction * len(waits)))] * 1000 if waits else 0.0
+        return {
+            'concurrency': self.concurrency,
+            'in_flight': self.in_flight,
+            'queue_depth': self.queued,
+            'max_queue_depth': self.max_queued,
+            'completed': self.completed,
+            'rejected': self.rejected,
+            'wait_ms_avg': sum(waits) / len(waits) * 1000 if waits else 0.0,
+            'wait_ms_p50': pct(0.50),
+            'wait_ms_p99': pct(0.99),
+        }
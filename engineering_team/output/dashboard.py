@@ -0,0 +1,74 @@
+"""Push-based live figures for an Account, independent of any UI toolkit.
+
+stream_deltas() is an async generator that wakes only when the account
+reports a trade, cash movement or price tick, and yields just the figures
+that changed. table_window() renders a fixed-size slice of the history so a
+table never materializes more rows than it shows.
+"""
+import asyncio
+from itertools import islice
+
+from export import iter_rows
+
+# Figures pushed to dashboards, in display order
+FIGURES = ('balance', 'portfolio_value', 'profit_loss', 'realized', 'unrealized', 'holdings', 'transactions')
+TABLE_COLUMNS = ['#', 'type', 'symbol', 'quantity', 'amount', 'timestamp']
+WINDOW_ROWS = 50
+# Bursts of changes within this many seconds are pushed as one delta
+DEFAULT_MIN_INTERVAL = 0.2
+
+
+# Current dashboard figures; every value is O(1) except holdings, O(symbols)
+def figures(account):
+    return {
+        'balance': round(account.balance, 2),
+        'portfolio_value': round(account.get_portfolio_value(), 2),
+        'profit_loss': round(account.get_profit_loss(), 2),
+        'realized': round(account.get_realized_profit_loss(), 2),
+        'unrealized': round(account.get_unrealized_profit_loss(), 2),
+        'holdings': dict(account.get_holdings()),
+        'transactions': len(account.transactions),
+    }
+
+
+# Figures in current that differ from previous
+def diff(previous, current):
+    return {key: value for key, value in current.items() if previous.get(key) != value}
+
+
+# Rows [offset, offset + rows) of the transaction table
+def table_window(account, offset=0, rows=WINDOW_ROWS):
+    return [list(row[:6]) for row in islice(iter_rows(account, cursor=max(0, offset)), rows)]
+
+
+# The last `rows` rows of the transaction table
+def tail_window(account, rows=WINDOW_ROWS):
+    return table_window(account, len(account.transactions) - rows, rows)
+
+
+# Yield the full figures once, then only changed figures after each account change
+async def stream_deltas(account, min_interval=DEFAULT_MIN_INTERVAL):
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+
+    def on_change(_account):
+        try:
+            loop.call_soon_threadsafe(changed.set)
+        except RuntimeError:
+            # The loop serving this stream has closed
+            pass
+
+    account.subscribe(on_change)
+    try:
+        previous = {}
+        while True:
+            current = figures(account)
+            delta = diff(previous, current)
+            if delta:
+                yield delta
+                previous = current
+            await changed.wait()
+            changed.clear()
+            await asyncio.sleep(min_interval)
+    finally:
+        account.unsubscribe(on_change)
@@ -0,0 +1,104 @@
+"""Streaming exporters for account transaction history.
+
+Rows are read straight from the ledger's columns and written in chunks, so
+memory stays flat however long the history is. A target can be a file path,
+a text file object, or a connected socket.
+"""
+import csv
+from datetime import datetime
+import io
+import json
+
+from ledger import BUY, SELL, TYPE_NAMES
+
+CSV_FIELDS = ('index', 'type', 'symbol', 'quantity', 'amount', 'timestamp')
+# Rows buffered before each write to the target
+DEFAULT_CHUNK_ROWS = 1000
+
+
+class _SocketWriter:
+    def __init__(self, sock, encoding='utf-8'):
+        self.sock = sock
+        self.encoding = encoding
+
+    def write(self, text):
+        self.sock.sendall(text.encode(self.encoding))
+
+
+class _Sink:
+    """Context manager that opens a path or adapts a file object or socket."""
+
+    def __init__(self, target):
+        self.target = target
+        self._owned = None
+
+    def __enter__(self):
+        if isinstance(self.target, str):
+            self._owned = open(self.target, 'w', newline='', encoding='utf-8')
+            return self._owned
+        if hasattr(self.target, 'sendall'):
+            return _SocketWriter(self.target)
+        return self.target
+
+    def __exit__(self, *exc):
+        if self._owned is not None:
+            self._owned.close()
+
+
+def _ledger(source):
+    return getattr(source, 'transactions', source)
+
+
+# Yield (index, type, symbol, quantity, amount, iso timestamp, epoch ns) for matching entries
+def iter_rows(source, start=None, end=None, symbol=None, type_name=None, cursor=0):
+    ledger = _ledger(source)
+    types, sids, quantities, amounts, stamps = (
+        ledger.types, ledger.symbol_ids, ledger.quantities, ledger.amounts, ledger.timestamps)
+    symbols = ledger.symbols
+    for i in ledger.iter_indices(start, end, symbol, type_name, cursor):
+        code = types[i]
+        trade = code == BUY or code == SELL
+        yield (i, TYPE_NAMES[code], symbols[sids[i]] if trade else '', quantities[i] if trade else '',
+               amounts[i], datetime.fromtimestamp(stamps[i] / 1_000_000_000).isoformat(), stamps[i])
+
+
+# Write matching transactions as CSV; returns the number of rows written
+def export_csv(source, target, start=None, end=None, symbol=None, type_name=None,
+               chunk_rows=DEFAULT_CHUNK_ROWS):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    rows = 0
+    with _Sink(target) as out:
+        writer.writerow(CSV_FIELDS)
+        for row in iter_rows(source, start, end, symbol, type_name):
+            writer.writerow(row[:6])
+            rows += 1
+            if rows % chunk_rows == 0:
+                out.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+        out.write(buffer.getvalue())
+    return rows
+
+
+# Write matching transactions as JSON Lines; returns the number of rows written
+def export_jsonl(source, target, start=None, end=None, symbol=None, type_name=None,
+                 chunk_rows=DEFAULT_CHUNK_ROWS):
+    lines = []
+    rows = 0
+    with _Sink(target) as out:
+        for index, kind, sym, quantity, amount, timestamp, timestamp_ns in iter_rows(
+                source, start, end, symbol, type_name):
+            record = {'index': index, 'type': kind, 'amount': amount,
+                      'timestamp': timestamp, 'timestamp_ns': timestamp_ns}
+            if sym:
+                record['symbol'] = sym
+                record['quantity'] = quantity
+            lines.append(json.dumps(record))
+            rows += 1
+            if len(lines) == chunk_rows:
+                out.write('\n'.join(lines) + '\n')
+                lines.clear()
+        if lines:
+            out.write('\n'.join(lines) + '\n')
+    return rows
@@ -0,0 +1,215 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; queries fall back to pure Python loops
+    np = None
+
+# Transaction type codes stored in the ledger
+DEPOSIT = 0
+WITHDRAW = 1
+BUY = 2
+SELL = 3
+TYPE_NAMES = ('deposit', 'withdraw', 'buy', 'sell')
+TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES)}
+
+# Symbol id used for cash movements that have no symbol
+NO_SYMBOL = -1
+
+# Names of the parallel arrays, in storage order
+COLUMNS = ('types', 'symbol_ids', 'quantities', 'amounts', 'timestamps')
+
+
+def to_ns(when):
+    """Convert a datetime, epoch seconds or epoch-ns value to epoch nanoseconds."""
+    if when is None:
+        return None
+    if isinstance(when, datetime):
+        return int(when.timestamp() * 1_000_000_000)
+    if isinstance(when, float):
+        return int(when * 1_000_000_000)
+    return int(when)
+
+
+class Ledger:
+    """Append-only transaction ledger stored as parallel typed arrays.
+
+    Each entry costs 29 bytes (type code, symbol id, quantity, amount and
+    epoch-ns timestamp) instead of a dict plus a datetime object. Timestamps
+    are kept non-decreasing so time ranges resolve with a binary search.
+    Iterating or indexing yields the same dicts the old list of transactions
+    held, so existing callers keep working.
+    """
+
+    __slots__ = ('types', 'symbol_ids', 'quantities', 'amounts', 'timestamps',
+                 'symbols', '_symbol_index')
+
+    def __init__(self):
+        self.types = array('b')
+        self.symbol_ids = array('i')
+        self.quantities = array('q')
+        self.amounts = array('d')
+        self.timestamps = array('q')
+        self.symbols = []
+        self._symbol_index = {}
+
+    # Intern a symbol and return its id
+    def symbol_id(self, symbol):
+        if symbol is None:
+            return NO_SYMBOL
+        sid = self._symbol_index.get(symbol)
+        if sid is None:
+            sid = len(self.symbols)
+            self.symbols.append(symbol)
+            self._symbol_index[symbol] = sid
+        return sid
+
+    # Replace the symbol table, e.g. when restoring from disk
+    def set_symbols(self, symbols):
+        self.symbols = list(symbols)
+        self._symbol_index = {symbol: sid for sid, symbol in enumerate(self.symbols)}
+
+    # Append one transaction and return its index
+    def append(self, type_name, amount, symbol=None, quantity=0, timestamp_ns=None):
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        if self.timestamps and timestamp_ns < self.timestamps[-1]:
+            timestamp_ns = self.timestamps[-1]
+        self.types.append(TYPE_CODES[type_name])
+        self.symbol_ids.append(self.symbol_id(symbol))
+        self.quantities.append(quantity)
+        self.amounts.append(amount)
+        self.timestamps.append(timestamp_ns)
+        return len(self.types) - 1
+
+    def __len__(self):
+        return len(self.types)
+
+    def __iter__(self):
+        for i in range(len(self.types)):
+            yield self.record(i)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.record(i) for i in range(*index.indices(len(self.types)))]
+        if index < 0:
+            index += len(self.types)
+        if not 0 <= index < len(self.types):
+            raise IndexError('ledger index out of range')
+        return self.record(index)
+
+    def __repr__(self):
+        return f'Ledger({len(self.types)} transactions)'
+
+    # Materialize entry i as a transaction dict
+    def record(self, i):
+        type_code = self.types[i]
+        entry = {'type': TYPE_NAMES[type_code]}
+        if type_code in (BUY, SELL):
+            entry['symbol'] = self.symbols[self.symbol_ids[i]]
+            entry['quantity'] = self.quantities[i]
+        entry['amount'] = self.amounts[i]
+        entry['timestamp'] = datetime.fromtimestamp(self.timestamps[i] / 1_000_000_000)
+        return entry
+
+    # Bytes held by the columnar arrays
+    def nbytes(self):
+        return sum(getattr(self, name).itemsize * len(self) for name in COLUMNS)
+
+    # Index bounds [lo, hi) of entries with start <= timestamp < end
+    def index_range(self, start=None, end=None):
+        lo = 0 if start is None else bisect_left(self.timestamps, to_ns(start))
+        hi = len(self.timestamps) if end is None else bisect_left(self.timestamps, to_ns(end))
+        return lo, max(lo, hi)
+
+    # Index one past the last entry with timestamp <= when
+    def index_at(self, when):
+        return bisect_right(self.timestamps, to_ns(when))
+
+    # Yield indices of entries matching the filters, resuming at cursor
+    def iter_indices(self, start=None, end=None, symbol=None, type_name=None, cursor=0):
+        lo, hi = self.index_range(start, end)
+        lo = max(lo, cursor)
+        types, sids = self.types, self.symbol_ids
+        code = None if type_name is None else TYPE_CODES[type_name]
+        sid = None
+        if symbol is not None:
+            sid = self._symbol_index.get(symbol)
+            if sid is None:
+                return
+        for i in range(lo, hi):
+            if (code is None or types[i] == code) and (sid is None or sids[i] == sid):
+                yield i
+
+    # Yield transaction dicts matching the filters, one at a time
+    def iter_records(self, start=None, end=None, symbol=None, type_name=None, cursor=0):
+        for i in self.iter_indices(start, end, symbol, type_name, cursor):
+            yield self.record(i)
+
+    # One page of matching transactions and the cursor for the next page (None at the end)
+    def page(self, cursor=0, page_size=100, start=None, end=None, symbol=None, type_name=None):
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        records = []
+        for i in self.iter_indices(start, end, symbol, type_name, cursor):
+            if len(records) == page_size:
+                return records, i
+            records.append(self.record(i))
+        return records, None
+
+    # Sum of amounts per transaction type
+    def totals_by_type(self, start=None, end=None):
+        lo, hi = self.index_range(start, end)
+        totals = dict.fromkeys(TYPE_NAMES, 0.0)
+        if lo == hi:
+            return totals
+        if np is not None:
+            sums = np.bincount(np.frombuffer(self.types, dtype=np.int8)[lo:hi],
+                               weights=np.frombuffer(self.amounts, dtype=np.float64)[lo:hi],
+                               minlength=len(TYPE_NAMES))
+            for code, name in enumerate(TYPE_NAMES):
+                totals[name] = float(sums[code])
+            return totals
+        for code, amount in zip(self.types[lo:hi], self.amounts[lo:hi]):
+            totals[TYPE_NAMES[code]] += amount
+        return totals
+
+    # Total amount for one transaction type
+    def total(self, type_name, start=None, end=None):
+        return self.totals_by_type(start, end)[type_name]
+
+    # Net quantity and traded amount per symbol, optionally for one trade type
+    def totals_by_symbol(self, type_name=None, start=None, end=None):
+        lo, hi = self.index_range(start, end)
+        if lo == hi or not self.symbols:
+            return {}
+        if np is not None:
+            types = np.frombuffer(self.types, dtype=np.int8)[lo:hi]
+            sids = np.frombuffer(self.symbol_ids, dtype=np.int32)[lo:hi]
+            qty = np.frombuffer(self.quantities, dtype=np.int64)[lo:hi]
+            amounts = np.frombuffer(self.amounts, dtype=np.float64)[lo:hi]
+            if type_name is None:
+                mask = (types == BUY) | (types == SELL)
+            else:
+                mask = types == TYPE_CODES[type_name]
+            sign = np.where(types[mask] == SELL, -1, 1)
+            sids = sids[mask]
+            n = len(self.symbols)
+            net_qty = np.bincount(sids, weights=qty[mask] * sign, minlength=n)
+            traded = np.bincount(sids, weights=amounts[mask], minlength=n)
+            seen = np.bincount(sids, minlength=n)
+            return {self.symbols[sid]: (int(net_qty[sid]), float(traded[sid]))
+                    for sid in np.flatnonzero(seen)}
+        wanted = (BUY, SELL) if type_name is None else (TYPE_CODES[type_name],)
+        totals = {}
+        for code, sid, qty, amount in zip(self.types[lo:hi], self.symbol_ids[lo:hi],
+                                          self.quantities[lo:hi], self.amounts[lo:hi]):
+            if code not in wanted:
+                continue
+            symbol = self.symbols[sid]
+            net_qty, traded = totals.get(symbol, (0, 0.0))
+            totals[symbol] = (net_qty - qty if code == SELL else net_qty + qty, traded + amount)
+        return totals
@@ -0,0 +1,126 @@
+"""Load generator for the headless accounts API (server.py).
+
+    python loadgen.py --threads 8 --requests 2000
+    python loadgen.py --url http://127.0.0.1:8000 --threads 16 --accounts 500
+
+Without --url an in-process server is started on a free port. Each worker
+thread keeps one keep-alive connection and sends a seeded mix of deposits,
+trades and reads; the run reports requests/sec and p50/p99 latency per route.
+"""
+import argparse
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+from server import make_server
+
+
+class _Client:
+    def __init__(self, host, port):
+        self.conn = http.client.HTTPConnection(host, port, timeout=30)
+
+    def request(self, method, path, body=None):
+        data = json.dumps(body).encode() if body is not None else None
+        headers = {'Content-Type': 'application/json'} if data else {}
+        self.conn.request(method, path, body=data, headers=headers)
+        response = self.conn.getresponse()
+        return response.status, json.loads(response.read())
+
+
+def _worker(host, port, account_ids, requests, seed, latencies, errors):
+    rng = random.Random(seed)
+    client = _Client(host, port)
+    clock = time.perf_counter
+    for _ in range(requests):
+        account_id = rng.choice(account_ids)
+        r = rng.random()
+        if r < 0.2:
+            route, method, body = 'deposit', 'POST', {'amount': 100.0}
+        elif r < 0.55:
+            route, method, body = 'buy', 'POST', {'symbol': rng.choice(('AAPL', 'TSLA', 'GOOGL')), 'quantity': 1}
+        elif r < 0.75:
+            route, method, body = 'sell', 'POST', {'symbol': rng.choice(('AAPL', 'TSLA', 'GOOGL')), 'quantity': 1}
+        elif r < 0.9:
+            route, method, body = 'pnl', 'GET', None
+        else:
+            route, method, body = 'history', 'GET', None
+        path = f'/accounts/{account_id}/{route}'
+        if route == 'history':
+            path += '?page_size=20'
+        start = clock()
+        status, _ = client.request(method, path, body)
+        latencies.setdefault(route, []).append(clock() - start)
+        if status >= 500:
+            errors.append(status)
+
+
+def run(host, port, threads=8, requests=2000, accounts=100, seed=0):
+    setup = _Client(host, port)
+    account_ids = [f'load{seed}-{n}' for n in range(accounts)]
+    for account_id in account_ids:
+        setup.request('POST', '/accounts', {'account_id': account_id, 'user_name': account_id,
+                                            'user_email': f'{account_id}@example.com',
+                                            'initial_deposit': 1_000_000.0})
+    per_thread = [{} for _ in range(threads)]
+    errors = []
+    workers = [threading.Thread(target=_worker, args=(host, port, account_ids, requests, seed + n,
+                                                      per_thread[n], errors))
+               for n in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    routes = {}
+    for latencies in per_thread:
+        for route, values in latencies.items():
+            routes.setdefault(route, []).extend(values)
+    summary = {}
+    for route, values in sorted(routes.items()):
+        values.sort()
+        summary[route] = {
+            'count': len(values),
+            'p50_ms': values[len(values) // 2] * 1000,
+            'p99_ms': values[min(len(values) - 1, int(len(values) * 0.99))] * 1000,
+        }
+    total = threads * requests
+    return {'threads': threads, 'requests': total, 'seconds': elapsed,
+            'requests_per_sec': total / elapsed, 'server_errors': len(errors), 'routes': summary}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator for the accounts API")
+    parser.add_argument('--url', help='server to target; starts one in-process if omitted')
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=2000, help='requests per thread')
+    parser.add_argument('--accounts', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        started = time.perf_counter()
+        server = make_server(port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address[:2]
+        print(f"In-process server ready in {(time.perf_counter() - started) * 1000:.1f} ms on port {port}")
+    try:
+        print(json.dumps(run(host, port, args.threads, args.requests, args.accounts, args.seed), indent=2))
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+from collections import deque
+
+# Lot matching methods supported on sell
+LOT_METHODS = ('fifo', 'lifo', 'average')
+
+
+class LotQueue:
+    """Open lots of one symbol as [quantity, unit_cost] pairs, oldest first."""
+
+    __slots__ = ('lots', 'quantity', 'cost')
+
+    def __init__(self):
+        self.lots = deque()
+        self.quantity = 0
+        self.cost = 0.0
+
+
+class LotBook:
+    """Per-symbol tax lots with running realized P&L.
+
+    fifo sells the oldest lots first, lifo the newest, and average keeps a
+    single merged lot per symbol. Each symbol's open quantity and cost are
+    kept as running totals, so its cost basis and unrealized P&L are cached
+    lookups, and a sell only touches the lots it consumes.
+    """
+
+    __slots__ = ('method', 'queues', 'realized', 'realized_total')
+
+    def __init__(self, method='fifo'):
+        if method not in LOT_METHODS:
+            raise ValueError(f"Unknown lot method: {method}")
+        self.method = method
+        self.queues = {}
+        self.realized = {}
+        self.realized_total = 0.0
+
+    # Open a lot of quantity shares at price
+    def on_buy(self, symbol, quantity, price):
+        queue = self.queues.get(symbol)
+        if queue is None:
+            queue = self.queues[symbol] = LotQueue()
+        if self.method == 'average' and queue.lots:
+            queue.lots[0][0] += quantity
+            queue.lots[0][1] = (queue.cost + price * quantity) / queue.lots[0][0]
+        else:
+            queue.lots.append([quantity, price])
+        queue.quantity += quantity
+        queue.cost += price * quantity
+
+    # Close quantity shares at price; returns the cost basis released
+    def on_sell(self, symbol, quantity, price):
+        queue = self.queues.get(symbol)
+        if queue is None or queue.quantity < quantity:
+            raise ValueError(f"Insufficient shares of {symbol} to sell {quantity} units")
+        take = queue.lots.pop if self.method == 'lifo' else queue.lots.popleft
+        peek = -1 if self.method == 'lifo' else 0
+        released = 0.0
+        remaining = quantity
+        while remaining:
+            lot = queue.lots[peek]
+            used = min(lot[0], remaining)
+            released += used * lot[1]
+            remaining -= used
+            if used == lot[0]:
+                take()
+            else:
+                lot[0] -= used
+        queue.quantity -= quantity
+        if queue.quantity:
+            queue.cost -= released
+        else:
+            del self.queues[symbol]
+        gain = price * quantity - released
+        self.realized[symbol] = self.realized.get(symbol, 0.0) + gain
+        self.realized_total += gain
+        return released
+
+    # Cost basis of the open lots of a symbol
+    def cost(self, symbol):
+        queue = self.queues.get(symbol)
+        return queue.cost if queue is not None else 0.0
+
+    # Open lots of a symbol as (quantity, unit_cost) tuples, in matching order for fifo
+    def open_lots(self, symbol):
+        queue = self.queues.get(symbol)
+        return [tuple(lot) for lot in queue.lots] if queue is not None else []
+
+    def realized_for(self, symbol=None):
+        if symbol is None:
+            return self.realized_total
+        return self.realized.get(symbol, 0.0)
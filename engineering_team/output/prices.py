@@ -0,0 +1,162 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import threading
+import time
+
+# Fixed prices used by the test implementation of get_share_price()
+TEST_PRICES = {'AAPL': 150.0, 'TSLA': 700.0, 'GOOGL': 2800.0}
+
+
+class PriceProvider(ABC):
+    """Source of share prices.
+
+    get_prices() returns a dict for the symbols the provider knows and omits
+    the ones it does not; get_price() raises ValueError for an unknown symbol.
+    """
+
+    @abstractmethod
+    def get_prices(self, symbols):
+        ...
+
+    def get_price(self, symbol):
+        prices = self.get_prices([symbol])
+        if symbol not in prices:
+            raise ValueError(f"Unknown symbol: {symbol}")
+        return prices[symbol]
+
+
+class StaticPriceFeed(PriceProvider):
+    """In-process price feed backed by a dict, for tests and demos.
+
+    latency simulates the round trip of a remote feed per batch, and fetches
+    counts how many batches were served.
+    """
+
+    def __init__(self, prices=None, latency=0.0):
+        self.prices = dict(TEST_PRICES if prices is None else prices)
+        self.latency = latency
+        self.fetches = 0
+        self._lock = threading.Lock()
+
+    def get_prices(self, symbols):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.fetches += 1
+            return {symbol: self.prices[symbol] for symbol in symbols if symbol in self.prices}
+
+    # Move the price of a symbol, as a market tick would
+    def set_price(self, symbol, price):
+        with self._lock:
+            self.prices[symbol] = price
+
+
+class _Pending:
+    __slots__ = ('event', 'price', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.price = None
+        self.error = None
+
+
+class CachedPriceProvider(PriceProvider):
+    """TTL + LRU cache in front of another provider.
+
+    Misses in one get_prices() call are fetched from the upstream provider in
+    a single batch. A symbol that is already being fetched by another thread
+    is not fetched again; the caller waits for the in-flight result instead.
+    """
+
+    def __init__(self, upstream, ttl=5.0, maxsize=10_000, clock=time.monotonic):
+        self.upstream = upstream
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._cache = OrderedDict()  # symbol -> (price, expires_at)
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.fetches = 0
+
+    def get_prices(self, symbols):
+        prices = {}
+        waiting = {}
+        to_fetch = []
+        with self._lock:
+            now = self._clock()
+            for symbol in dict.fromkeys(symbols):
+                entry = self._cache.get(symbol)
+                if entry is not None and entry[1] > now:
+                    self._cache.move_to_end(symbol)
+                    prices[symbol] = entry[0]
+                    self.hits += 1
+                    continue
+                self.misses += 1
+                pending = self._inflight.get(symbol)
+                if pending is None:
+                    pending = self._inflight[symbol] = _Pending()
+                    to_fetch.append(symbol)
+                else:
+                    self.coalesced += 1
+                waiting[symbol] = pending
+
+        if to_fetch:
+            self._fetch(to_fetch)
+
+        for symbol, pending in waiting.items():
+            pending.event.wait()
+            if pending.error is not None:
+                raise pending.error
+            if pending.price is not None:
+                prices[symbol] = pending.price
+        return prices
+
+    # Fetch a batch upstream and hand the results to every waiter, even if the fetch is interrupted
+    def _fetch(self, symbols):
+        fetched, error = {}, None
+        try:
+            fetched = self.upstream.get_prices(symbols)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            with self._lock:
+                self.fetches += 1
+                expires_at = self._clock() + self.ttl
+                for symbol in symbols:
+                    pending = self._inflight.pop(symbol)
+                    pending.error = error
+                    if symbol in fetched:
+                        pending.price = fetched[symbol]
+                        self._cache[symbol] = (pending.price, expires_at)
+                        self._cache.move_to_end(symbol)
+                    pending.event.set()
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+
+    # Drop one cached symbol, or the whole cache
+    def invalidate(self, symbol=None):
+        with self._lock:
+            if symbol is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(symbol, None)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'fetches': self.fetches,
+                'size': len(self._cache),
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Shared provider used by get_share_price() and by accounts that don't bring their own
+default_price_provider = CachedPriceProvider(StaticPriceFeed())
@@ -0,0 +1,192 @@
+"""Headless JSON API over the accounts module, with no Gradio import.
+
+    python server.py --port 8000
+
+Endpoints (account ids are strings in the URL):
+
+    GET  /health
+    POST /accounts                     {"account_id", "user_name", "user_email", "initial_deposit"}
+    POST /accounts/<id>/deposit        {"amount"}
+    POST /accounts/<id>/withdraw       {"amount"}
+    POST /accounts/<id>/buy            {"symbol", "quantity"}
+    POST /accounts/<id>/sell           {"symbol", "quantity"}
+    POST /accounts/<id>/orders         {"orders": [[action, ...args], ...], "atomic": true}
+    GET  /accounts/<id>/holdings
+    GET  /accounts/<id>/pnl
+    GET  /accounts/<id>/history?cursor=0&page_size=100&symbol=&type=&start=&end=
+
+Account ids may be sent as strings or integers and are stored as strings,
+the form they take in the URL. Validation errors come back as 400 with
+{"error": message}, including a quantity that is not a JSON integer, a
+history page_size outside 1..MAX_PAGE_SIZE or a negative cursor.
+"""
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from urllib.parse import parse_qs, urlsplit
+
+from book import AccountBook
+
+MAX_PAGE_SIZE = 1000
+
+
+# Ids are looked up by their URL path segment, so they are stored as strings
+def _account_id(value):
+    if isinstance(value, bool) or not isinstance(value, (str, int)) or not str(value) or '/' in str(value):
+        raise ValueError(f"account_id must be an integer or a non-empty string without '/', not {value!r}")
+    return str(value)
+
+
+# Share quantities are whole numbers; 1.9 or "2" is rejected rather than coerced
+def _quantity(value):
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"quantity must be an integer, not {value!r}")
+    return value
+
+
+def _history_entry(entry):
+    entry['timestamp'] = entry['timestamp'].isoformat()
+    return entry
+
+
+class AccountService:
+    """Request routing over an AccountBook, independent of the HTTP layer."""
+
+    def __init__(self, book=None):
+        self.book = book or AccountBook()
+
+    def open_account(self, body):
+        account_id = _account_id(body['account_id'])
+        self.book.open_account(account_id, body.get('user_name', ''), body.get('user_email', ''),
+                               float(body.get('initial_deposit', 0.0)), body.get('lot_method', 'fifo'))
+        return {'account_id': account_id}
+
+    def deposit(self, account_id, body):
+        self.book.deposit(account_id, float(body['amount']))
+        return self.balance(account_id)
+
+    def withdraw(self, account_id, body):
+        self.book.withdraw(account_id, float(body['amount']))
+        return self.balance(account_id)
+
+    def buy(self, account_id, body):
+        self.book.buy(account_id, body['symbol'], _quantity(body['quantity']))
+        return self.balance(account_id)
+
+    def sell(self, account_id, body):
+        self.book.sell(account_id, body['symbol'], _quantity(body['quantity']))
+        return self.balance(account_id)
+
+    def orders(self, account_id, body):
+        orders = [tuple(order) for order in body['orders']]
+        results = self.book.execute(account_id, 'apply_orders', orders, bool(body.get('atomic', True)))
+        return {'results': [{'ok': ok, 'value' if ok else 'error': value} for ok, value in results]}
+
+    def balance(self, account_id):
+        return {'balance': self.book.execute(account_id, 'get_balance')}
+
+    def holdings(self, account_id, query):
+        return {'holdings': dict(self.book.execute(account_id, 'get_holdings'))}
+
+    # One call under one shard lock, so a concurrent trade can't split the figures
+    def pnl(self, account_id, query):
+        return self.book.execute(account_id, 'get_pnl')
+
+    def history(self, account_id, query):
+        def arg(name, cast=str, default=None):
+            return cast(query[name][0]) if name in query else default
+        page_size, cursor = arg('page_size', int, 100), arg('cursor', int, 0)
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+        if cursor < 0:
+            raise ValueError("cursor must not be negative")
+        page, next_cursor = self.book.execute(
+            account_id, 'get_transaction_page', cursor, page_size,
+            arg('start', int), arg('end', int), arg('symbol'), arg('type'))
+        return {'transactions': [_history_entry(entry) for entry in page], 'next_cursor': next_cursor}
+
+    POST_ACTIONS = ('deposit', 'withdraw', 'buy', 'sell', 'orders')
+    GET_ACTIONS = ('holdings', 'pnl', 'history')
+
+    # Dispatch a request; returns (status, payload)
+    def handle(self, method, path, query, body):
+        parts = [part for part in path.split('/') if part]
+        try:
+            if method == 'GET' and parts == ['health']:
+                return 200, {'status': 'ok', 'accounts': len(self.book)}
+            if method == 'POST' and parts == ['accounts']:
+                return 201, self.open_account(body)
+            if len(parts) == 3 and parts[0] == 'accounts':
+                account_id, action = parts[1], parts[2]
+                if method == 'POST' and action in self.POST_ACTIONS:
+                    return 200, getattr(self, action)(account_id, body)
+                if method == 'GET' and action in self.GET_ACTIONS:
+                    return 200, getattr(self, action)(account_id, query)
+            return 404, {'error': f"No route for {method} {path}"}
+        except (KeyError, TypeError) as e:
+            return 400, {'error': f"Bad request: {e}"}
+        except ValueError as e:
+            return 400, {'error': str(e)}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; without this Nagle adds ~40 ms per response
+    disable_nagle_algorithm = True
+    service = None
+
+    def _respond(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        body = {}
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length))
+            except json.JSONDecodeError as e:
+                self._respond(400, {'error': f"Invalid JSON: {e}"})
+                return
+        self._respond(*self.service.handle(method, url.path, parse_qs(url.query), body))
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def log_message(self, format, *args):
+        pass
+
+
+# Build (but don't start) a threaded HTTP server around a service
+def make_server(host='127.0.0.1', port=8000, service=None):
+    handler = type('AccountHandler', (_Handler,), {'service': service or AccountService()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def serve(host='127.0.0.1', port=8000):
+    server = make_server(host, port)
+    print(f"Accounts API listening on http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless JSON API for the accounts module")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+    serve(args.host, args.port)
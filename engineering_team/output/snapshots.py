@@ -0,0 +1,94 @@
+from bisect import bisect_right
+
+from ledger import BUY, DEPOSIT, SELL, WITHDRAW
+
+# Transactions between two holdings/balance checkpoints
+DEFAULT_CHECKPOINT_INTERVAL = 1024
+
+
+class Snapshot:
+    """Account state after the first `index` ledger entries.
+
+    Holdings are valued at the last traded price per symbol as of the
+    snapshot, since the ledger holds no other price history.
+    """
+
+    __slots__ = ('index', 'balance', 'net_contributions', 'holdings', 'prices')
+
+    def __init__(self, index, balance, net_contributions, holdings, prices):
+        self.index = index
+        self.balance = balance
+        self.net_contributions = net_contributions
+        self.holdings = holdings
+        self.prices = prices
+
+    def copy(self):
+        return Snapshot(self.index, self.balance, self.net_contributions,
+                        dict(self.holdings), dict(self.prices))
+
+    # Apply ledger entries [self.index, end) in place
+    def replay(self, ledger, end):
+        types, sids, quantities, amounts = ledger.types, ledger.symbol_ids, ledger.quantities, ledger.amounts
+        symbols, holdings, prices = ledger.symbols, self.holdings, self.prices
+        for i in range(self.index, end):
+            code, amount = types[i], amounts[i]
+            if code == DEPOSIT:
+                self.balance += amount
+                self.net_contributions += amount
+            elif code == WITHDRAW:
+                self.balance -= amount
+                self.net_contributions -= amount
+            else:
+                symbol, quantity = symbols[sids[i]], quantities[i]
+                if not quantity:
+                    continue  # zero-quantity trade logged before quantities were validated; moved nothing
+                prices[symbol] = amount / quantity
+                if code == BUY:
+                    self.balance -= amount
+                    holdings[symbol] = holdings.get(symbol, 0) + quantity
+                elif code == SELL:
+                    self.balance += amount
+                    held = holdings[symbol] - quantity
+                    if held:
+                        holdings[symbol] = held
+                    else:
+                        del holdings[symbol]
+        self.index = max(self.index, end)
+        return self
+
+    def get_portfolio_value(self):
+        return sum(quantity * self.prices[symbol] for symbol, quantity in self.holdings.items())
+
+    def get_profit_loss(self):
+        return self.balance + self.get_portfolio_value() - self.net_contributions
+
+
+class Checkpoints:
+    """Periodic snapshots of an account's ledger for point-in-time queries.
+
+    A query binary-searches the ledger's timestamps for the cut-off index,
+    then the checkpoints for the nearest one at or before it, and replays at
+    most `interval` entries from there.
+    """
+
+    def __init__(self, initial_deposit=0.0, interval=DEFAULT_CHECKPOINT_INTERVAL):
+        self.interval = interval
+        self.snapshots = [Snapshot(0, initial_deposit, initial_deposit, {}, {})]
+        self.indices = [0]
+
+    # Extend the checkpoint chain once enough entries have accumulated
+    def update(self, ledger):
+        last = self.snapshots[-1]
+        while len(ledger) - last.index >= self.interval:
+            last = last.copy().replay(ledger, last.index + self.interval)
+            self.snapshots.append(last)
+            self.indices.append(last.index)
+
+    # State as of an index into the ledger
+    def at_index(self, ledger, index):
+        base = self.snapshots[bisect_right(self.indices, index) - 1]
+        return base.copy().replay(ledger, index)
+
+    # State including every entry with timestamp <= when
+    def as_of(self, ledger, when):
+        return self.at_index(ledger, ledger.index_at(when))
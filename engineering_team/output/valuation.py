@@ -0,0 +1,76 @@
+from lots import LotBook
+
+
+class Valuation:
+    """Running market value and cost basis for a set of holdings.
+
+    Trades and price ticks adjust the totals by the delta of the affected
+    symbol only, so reading the portfolio value or P&L never scans holdings.
+    Cost basis follows the tax lots kept by the LotBook (fifo, lifo or average).
+    """
+
+    __slots__ = ('quantities', 'prices', 'lots', 'market_value', 'cost_basis')
+
+    def __init__(self, lot_method='fifo'):
+        self.quantities = {}
+        self.prices = {}
+        self.lots = LotBook(lot_method)
+        self.market_value = 0.0
+        self.cost_basis = 0.0
+
+    # Record a purchase of quantity shares at price
+    def on_buy(self, symbol, quantity, price):
+        held = self.quantities.get(symbol, 0)
+        old_value = held * self.prices.get(symbol, 0.0)
+        held += quantity
+        self.quantities[symbol] = held
+        self.prices[symbol] = price
+        self.market_value += held * price - old_value
+        self.lots.on_buy(symbol, quantity, price)
+        self.cost_basis += price * quantity
+
+    # Record a sale of quantity shares at price
+    def on_sell(self, symbol, quantity, price):
+        held = self.quantities[symbol]
+        old_value = held * self.prices[symbol]
+        released = self.lots.on_sell(symbol, quantity, price)
+        held -= quantity
+        self.cost_basis -= released
+        if held:
+            self.quantities[symbol] = held
+            self.prices[symbol] = price
+            self.market_value += held * price - old_value
+        else:
+            del self.quantities[symbol]
+            self.market_value -= old_value
+            if not self.quantities:
+                # Drop accumulated float drift once the book is flat
+                self.market_value = 0.0
+                self.cost_basis = 0.0
+
+    # Reprice one symbol; only its contribution to the totals is recomputed
+    def update_price(self, symbol, price):
+        old_price = self.prices.get(symbol)
+        self.prices[symbol] = price
+        held = self.quantities.get(symbol)
+        if held and old_price is not None:
+            self.market_value += held * (price - old_price)
+
+    # Reprice many symbols at once
+    def update_prices(self, prices):
+        for symbol, price in prices.items():
+            self.update_price(symbol, price)
+
+    # Market value of one symbol
+    def symbol_value(self, symbol):
+        return self.quantities.get(symbol, 0) * self.prices.get(symbol, 0.0)
+
+    # Unrealized gain of the shares still held, for one symbol or the whole book
+    def unrealized(self, symbol=None):
+        if symbol is None:
+            return self.market_value - self.cost_basis
+        return self.symbol_value(symbol) - self.lots.cost(symbol)
+
+    # Gain locked in by sells, for one symbol or the whole book
+    def realized(self, symbol=None):
+        return self.lots.realized_for(symbol)
@@ -0,0 +1,275 @@
+import mmap
+import os
+import pickle
+import struct
+import threading
+import time
+import zlib
+
+from accounts import Account
+from ledger import COLUMNS, Ledger, TYPE_CODES, TYPE_NAMES
+from prices import default_price_provider
+
+# Log record: crc32, type code, quantity, amount, epoch-ns timestamp, symbol length, then the symbol
+RECORD = struct.Struct('<IBqdqH')
+# Snapshot header: magic, format version, first log generation not covered, entry count, metadata length
+SNAPSHOT_HEADER = struct.Struct('<8sIQQQ')
+SNAPSHOT_MAGIC = b'ACCTSNAP'
+SNAPSHOT_VERSION = 1
+
+# Attributes of Account that are rebuilt on open rather than persisted
+_TRANSIENT = ('price_provider', 'journal', 'listeners', 'holdings', 'transactions')
+
+
+class WriteAheadLog:
+    """Append-only binary log of account transactions with group commit.
+
+    append() buffers a record; commit() returns once every record appended
+    so far is written and fsynced. The first committer writes and fsyncs
+    the whole buffer, and records appended meanwhile go out together in the
+    next fsync, so concurrent committers share the fsync cost. With
+    wait=False commit() returns at once and a background flusher writes a
+    group when group_size records are pending or group_interval seconds
+    after its first record: an acknowledged record can then be lost in a
+    crash for at most group_interval (plus one fsync). Each record carries
+    a CRC so a torn write at the tail is detected and dropped on replay.
+    """
+
+    def __init__(self, path, group_size=512, group_interval=0.005, wait=True):
+        self.path = path
+        self.group_size = group_size
+        self.group_interval = group_interval
+        self.wait = wait
+        self._file = open(path, 'ab')
+        self._cond = threading.Condition()
+        self._pending = []
+        self._first_pending = None
+        self._synced = 0
+        self._syncing = False
+        self._closed = False
+        self.records = 0
+        self.syncs = 0
+        self._flusher = None
+        if not wait:
+            self._flusher = threading.Thread(target=self._flush_loop, name='wal-flusher', daemon=True)
+            self._flusher.start()
+
+    def append(self, type_name, amount, symbol, quantity, timestamp_ns):
+        encoded = symbol.encode() if symbol is not None else b''
+        body = RECORD.pack(0, TYPE_CODES[type_name], quantity, amount, timestamp_ns, len(encoded))[4:] + encoded
+        with self._cond:
+            if not self._pending:
+                self._first_pending = time.monotonic()
+            self._pending.append(struct.pack('<I', zlib.crc32(body)) + body)
+            self.records += 1
+            if len(self._pending) == 1 or len(self._pending) >= self.group_size:
+                self._cond.notify_all()
+
+    # Block until every record appended so far is durable (no-op with wait=False)
+    def commit(self):
+        if self.wait:
+            self.sync()
+
+    # Write and fsync every record appended so far, joining a group already in flight
+    def sync(self):
+        with self._cond:
+            target = self.records
+            while self._synced < target:
+                if self._syncing:
+                    self._cond.wait()
+                else:
+                    self._write_group()
+
+    # Called with the condition held; writes outside it so appends continue meanwhile
+    def _write_group(self):
+        batch, through = self._pending, self.records
+        self._pending, self._syncing = [], True
+        self._cond.release()
+        try:
+            self._file.write(b''.join(batch))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except BaseException:
+            self._cond.acquire()
+            self._pending[:0] = batch
+            self._syncing = False
+            self._cond.notify_all()
+            raise
+        self._cond.acquire()
+        self._syncing = False
+        self._synced = through
+        self.syncs += 1
+        self._cond.notify_all()
+
+    def _flush_loop(self):
+        with self._cond:
+            while not self._closed:
+                if not self._pending or self._syncing:
+                    self._cond.wait()
+                    continue
+                remaining = self._first_pending + self.group_interval - time.monotonic()
+                if len(self._pending) < self.group_size and remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                self._write_group()
+
+    def close(self):
+        self.sync()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._flusher is not None:
+            self._flusher.join()
+        self._file.close()
+
+    # Feed every intact record to apply(type_name, amount, symbol, quantity, timestamp_ns);
+    # returns the byte offset just past the last intact record
+    @staticmethod
+    def replay(path, apply):
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if not size:
+            return 0
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offset = 0
+            while offset + RECORD.size <= size:
+                crc, code, quantity, amount, timestamp_ns, length = RECORD.unpack_from(data, offset)
+                end = offset + RECORD.size + length
+                if end > size or zlib.crc32(data[offset + 4:end]) != crc:
+                    break
+                symbol = data[offset + RECORD.size:end].decode() if length else None
+                apply(TYPE_NAMES[code], amount, symbol, quantity, timestamp_ns)
+                offset = end
+        return offset
+
+
+# Persist the account to path atomically; generation is the first log not yet included
+def write_snapshot(account, path, generation):
+    ledger = account.transactions
+    state = {key: value for key, value in vars(account).items() if key not in _TRANSIENT}
+    state['symbols'] = ledger.symbols
+    meta = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, generation, len(ledger), len(meta)))
+        f.write(meta)
+        for name in COLUMNS:
+            getattr(ledger, name).tofile(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+# Load a snapshot through a read-only memory map; returns (account, generation).
+# Each ledger column is copied out of the map with one bulk frombytes() (no
+# per-entry parsing), since the ledger keeps appending to its own arrays.
+def load_snapshot(path, price_provider=None):
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        magic, version, generation, count, meta_len = SNAPSHOT_HEADER.unpack_from(data, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"Not an account snapshot: {path}")
+        offset = SNAPSHOT_HEADER.size
+        state = pickle.loads(data[offset:offset + meta_len])
+        offset += meta_len
+        ledger = Ledger()
+        ledger.set_symbols(state.pop('symbols'))
+        for name in COLUMNS:
+            column = getattr(ledger, name)
+            size = column.itemsize * count
+            column.frombytes(data[offset:offset + size])
+            offset += size
+    account = Account.__new__(Account)
+    account.__dict__.update(state)
+    account.transactions = ledger
+    account.holdings = account.valuation.quantities
+    account.price_provider = price_provider or default_price_provider
+    account.journal = None
+    account.listeners = []
+    return account, generation
+
+
+class AccountStore:
+    """Durable storage for one Account in a directory.
+
+    The directory holds snapshot.bin and numbered logs wal.<generation>.log.
+    A snapshot starts a new log generation and then records which generation
+    it covers up to, so recovery loads the snapshot and replays only the logs
+    written after it. Older logs are deleted once the snapshot is in place.
+    """
+
+    def __init__(self, directory, group_size=512, group_interval=0.005, snapshot_every=1_000_000, wait=True):
+        self.directory = directory
+        self.group_size = group_size
+        self.group_interval = group_interval
+        self.wait = wait
+        self.snapshot_every = snapshot_every
+        self.account = None
+        self.log = None
+        self.generation = 0
+        self._since_snapshot = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def snapshot_path(self):
+        return os.path.join(self.directory, 'snapshot.bin')
+
+    def _log_path(self, generation):
+        return os.path.join(self.directory, f'wal.{generation}.log')
+
+    def _generations(self):
+        found = []
+        for name in os.listdir(self.directory):
+            if name.startswith('wal.') and name.endswith('.log'):
+                found.append(int(name[4:-4]))
+        return sorted(found)
+
+    # Recover the account (or create it) and start journaling to the log
+    def open(self, user_name, user_email, initial_deposit=0.0, price_provider=None, lot_method='fifo'):
+        if os.path.exists(self.snapshot_path):
+            account, covered = load_snapshot(self.snapshot_path, price_provider)
+        else:
+            account, covered = Account(user_name, user_email, initial_deposit, price_provider, lot_method), 0
+        generations = [g for g in self._generations() if g >= covered]
+        for generation in generations:
+            path = self._log_path(generation)
+            end = WriteAheadLog.replay(path, account.restore_transaction)
+            if end < os.path.getsize(path):
+                # Drop a torn tail so new records are not appended after garbage
+                with open(path, 'r+b') as f:
+                    f.truncate(end)
+        self.generation = generations[-1] if generations else covered
+        self.account = account
+        self.log = WriteAheadLog(self._log_path(self.generation), self.group_size, self.group_interval, self.wait)
+        self._since_snapshot = 0
+        account.journal = self
+        return account
+
+    # Called by Account for every recorded transaction
+    def append(self, type_name, amount, symbol, quantity, timestamp_ns):
+        self.log.append(type_name, amount, symbol, quantity, timestamp_ns)
+        self._since_snapshot += 1
+        if self._since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    # Snapshot the account, roll the log and drop logs the snapshot covers
+    def snapshot(self):
+        self.log.close()
+        self.generation += 1
+        self.log = WriteAheadLog(self._log_path(self.generation), self.group_size, self.group_interval, self.wait)
+        write_snapshot(self.account, self.snapshot_path, self.generation)
+        for generation in self._generations():
+            if generation < self.generation:
+                os.remove(self._log_path(generation))
+        self._since_snapshot = 0
+
+    # Called by Account once its records for a call are appended
+    def commit(self):
+        self.log.commit()
+
+    def sync(self):
+        self.log.sync()
+
+    def close(self):
+        if self.log is not None:
+            self.log.close()
+        if self.account is not None:
+            self.account.journal = None
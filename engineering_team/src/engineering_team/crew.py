@@ -1,9 +1,14 @@
 from tabnanny import verbose
-from crewai import Agent, Crew, Process, Task
+from crewai import Agent, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List
+from crew_common.config import compiled_configs
+from crew_common.dag import DagCrew
+from crew_common.sandbox import code_execution_options
+from crew_common.tools import RunTestsTool
 
+@compiled_configs
 @CrewBase
 class EngineeringTeam():
     """EngineeringTeam crew"""
@@ -23,8 +28,8 @@ class EngineeringTeam():
         return Agent(
             config=self.agents_config['backend_engineer'],
             verbose=True,
-            allow_code_execution=True,
-            code_execution_mode="safe", # Uses Docker for safety
+            # Warm local sandbox workers, or Docker with CREW_CODE_EXECUTION=docker
+            **code_execution_options(),
             max_execution_time=500,
             max_retry_limit=3
         )
@@ -41,8 +46,8 @@ class EngineeringTeam():
         return Agent(
             config=self.agents_config['test_engineer'],
             verbose=True,
-            allow_code_execution=True,
-            code_execution_mode="safe",
+            # Runs the draft test module against the backend module in output/
+            **code_execution_options(tools=[RunTestsTool()]),
             max_execution_time=500,
             max_retry_limit=3
         )
@@ -72,12 +77,14 @@ class EngineeringTeam():
         )   
 
     @crew
-    def crew(self) -> Crew:
+    def crew(self) -> DagCrew:
         """Creates the EngineeringTeam crew"""
 
-        return Crew(
+        return DagCrew(
             agents=self.agents,
             tasks=self.tasks,
             process=Process.sequential,
+            # Tasks whose context is complete run in parallel, at most this many at once
+            max_concurrency=2,
             verbose=True,
         )
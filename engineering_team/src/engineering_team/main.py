@@ -4,10 +4,28 @@ import warnings
 
 from datetime import datetime
 
-from engineering_team.crew import EngineeringTeam
-
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
+
+def _crew():
+    """
+    Build the crew. crewAI, the crew module and the runtime hooks are imported
+    here rather than at module load, so CLIs that don't run the crew start fast.
+    """
+    from crew_common.checkpoint import install_checkpoints
+    from crew_common.llm_cache import install_llm_cache
+    from crew_common.streaming import install_streaming
+    from engineering_team.crew import EngineeringTeam
+
+    # Serve repeated LLM calls from disk when CREW_LLM_CACHE=1
+    install_llm_cache()
+    # Stream final answers to output files and stdout when CREW_STREAM=1
+    install_streaming()
+    # Record each task's output under a hash of its inputs, for `uv run resume`
+    install_checkpoints()
+    return EngineeringTeam().crew()
+
+
 # Create output directory if it doesn't exist
 os.makedirs('output', exist_ok=True)
 
@@ -37,6 +55,42 @@ def run():
     }
     
     try:
-        EngineeringTeam().crew().kickoff(inputs=inputs)
+        _crew().kickoff(inputs=inputs)
     except Exception as e:
         raise Exception(f"An error occurred while running the crew: {e}")
+
+
+def batch():
+    """
+    Run the crew once per input in a CSV or JSONL file, e.g. `uv run batch inputs.csv --concurrency 8`.
+    """
+    from crew_common.batch import main as batch_main
+
+    sys.exit(batch_main(_crew, defaults={'requirements': requirements, 'module_name': module_name, 'class_name': class_name}, argv=sys.argv[1:]))
+
+
+def profile():
+    """
+    Run the crew with tracing; spans go to output/trace.jsonl and a summary table is printed.
+    """
+    from crew_common.tracing import profile_main
+
+    sys.exit(profile_main(run, argv=sys.argv[1:]))
+
+
+def resume():
+    """
+    Rerun the crew, reusing checkpointed outputs of tasks whose inputs are unchanged.
+    """
+    from crew_common.checkpoint import resume_main
+
+    sys.exit(resume_main(run))
+
+
+def run_tests():
+    """
+    Run the generated test modules in output/ in parallel, e.g. `uv run run_tests --workers 8`.
+    """
+    from crew_common.test_runner import main as run_tests_main
+
+    sys.exit(run_tests_main(argv=sys.argv[1:]))
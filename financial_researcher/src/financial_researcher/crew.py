@@ -1,9 +1,19 @@
-from crewai import Agent, Crew, Process, Task
+from crewai import Agent, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List
-from crewai_tools import SerperDevTool
+from crew_common.config import compiled_configs
+from crew_common.dag import DagCrew
 
+
+# crewai_tools pulls in every bundled tool; import it only when an agent is built
+def _search_tool():
+    from crewai_tools import SerperDevTool
+
+    return SerperDevTool()
+
+
+@compiled_configs
 @CrewBase
 class FinancialResearcher():
     """FinancialResearcher crew"""
@@ -16,7 +26,7 @@ class FinancialResearcher():
         return Agent(
             config=self.agents_config['researcher'],
             verbose=True,
-            tools=[SerperDevTool()]
+            tools=[_search_tool()]
         )
 
     @agent
@@ -39,12 +49,14 @@ class FinancialResearcher():
         )
 
     @crew
-    def crew(self) -> Crew:
+    def crew(self) -> DagCrew:
         """Creates the FinancialResearcher crew"""
 
-        return Crew(
+        return DagCrew(
             agents=self.agents,
             tasks=self.tasks,
             process=Process.sequential,
+            # Tasks whose context is complete run in parallel, at most this many at once
+            max_concurrency=2,
             verbose=True,
         )
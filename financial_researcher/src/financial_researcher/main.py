@@ -1,10 +1,29 @@
 import os
+import sys
 import warnings
 
-from financial_researcher.crew import FinancialResearcher
-
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
+
+def _crew():
+    """
+    Build the crew. crewAI, the crew module and the runtime hooks are imported
+    here rather than at module load, so CLIs that don't run the crew start fast.
+    """
+    from crew_common.checkpoint import install_checkpoints
+    from crew_common.llm_cache import install_llm_cache
+    from crew_common.streaming import install_streaming
+    from financial_researcher.crew import FinancialResearcher
+
+    # Serve repeated LLM calls from disk when CREW_LLM_CACHE=1
+    install_llm_cache()
+    # Stream final answers to output files and stdout when CREW_STREAM=1
+    install_streaming()
+    # Record each task's output under a hash of its inputs, for `uv run resume`
+    install_checkpoints()
+    return FinancialResearcher().crew()
+
+
 def run():
     """
     Run the researcher crew.
@@ -14,16 +33,46 @@ def run():
     # Ensure output directory exists for tasks that write files
     os.makedirs("output", exist_ok=True)
 
-    result = FinancialResearcher().crew().kickoff(inputs=inputs)
+    from crew_common.streaming import streaming_enabled
+
+    result = _crew().kickoff(inputs=inputs)
     try:
-        # Print the result
-        print("\n\n=== FINAL REPORT ===\n\n")
-        print(result.raw)
+        # Print the result, unless it was already streamed to the console
+        if not streaming_enabled():
+            print("\n\n=== FINAL REPORT ===\n\n")
+            print(result.raw)
 
         print("\n\nReport has been saved to output/report.md")
     except AttributeError:
         print(result)
 
+
+def batch():
+    """
+    Run the crew once per input in a CSV or JSONL file, e.g. `uv run batch inputs.csv --concurrency 8`.
+    """
+    from crew_common.batch import main as batch_main
+
+    sys.exit(batch_main(_crew, argv=sys.argv[1:]))
+
+
+def profile():
+    """
+    Run the crew with tracing; spans go to output/trace.jsonl and a summary table is printed.
+    """
+    from crew_common.tracing import profile_main
+
+    sys.exit(profile_main(run, argv=sys.argv[1:]))
+
+
+def resume():
+    """
+    Rerun the crew, reusing checkpointed outputs of tasks whose inputs are unchanged.
+    """
+    from crew_common.checkpoint import resume_main
+
+    sys.exit(resume_main(run))
+
 if __name__ == "__main__":
     run()
 
@@ -3,13 +3,20 @@ from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List
 from pydantic import BaseModel, Field
-from crewai_tools import SerperDevTool
+from crew_common.config import compiled_configs
 from .tools.push_tool import PushNotificationTool
 from crewai.memory import LongTermMemory, ShortTermMemory, EntityMemory
 from crewai.memory.storage.rag_storage import RAGStorage
 from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
 
 
+# crewai_tools pulls in every bundled tool; import it only when an agent is built
+def _search_tool():
+    from crewai_tools import SerperDevTool
+
+    return SerperDevTool()
+
+
 class TrendingCompany(BaseModel):
     """ A company that is in the news and attracting attention """
     name: str = Field(description="Company name")
@@ -32,6 +39,7 @@ class TrendingCompanyResearchList(BaseModel):
     research_list: List[TrendingCompanyResearch] = Field(description="Comprehensive research on all trending companies")
 
 
+@compiled_configs
 @CrewBase
 class StockPicker():
     """StockPicker crew"""
@@ -43,7 +51,7 @@ class StockPicker():
     def trending_company_finder(self) -> Agent:
         return Agent(
             config=self.agents_config['trending_company_finder'],
-            tools=[SerperDevTool()],
+            tools=[_search_tool()],
             memory=True
         )
 
@@ -51,7 +59,7 @@ class StockPicker():
     def financial_researcher(self) -> Agent:
         return Agent(
             config=self.agents_config['financial_researcher'],
-            tools=[SerperDevTool()]
+            tools=[_search_tool()]
         )
 
     @agent